@@ -0,0 +1,32 @@
+# ******************************************************************************************
+# FileName     : conftest.py
+# Description  : pytest 공용 준비 (cd src/Host && python -m pytest -q tests)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import pytest
+
+from sf2sim import Conveyor, Simulation
+
+
+#===========================================================================================
+@pytest.fixture
+def simulate(tmp_path):                                  # simulate(variant, drums, ...) -> setup() 을 마친 Simulation
+#===========================================================================================
+    def start(variant='standard', drums=20, interval_ms=3000, conveyor=None, **options):
+        if conveyor is None:
+            conveyor = Conveyor()
+            conveyor.add_drums(drums, interval_ms)
+        sim = Simulation(variant, conveyor, fs_dir=str(tmp_path), options=options)
+        sim.setup()
+        return sim
+    return start
+
+
+#===========================================================================================
+@pytest.fixture
+def clock(tmp_path):                                     # 펌웨어 모듈(smartfactory2.*)을 이 가상 시계로 불러옴
+#===========================================================================================
+    return Simulation('standard', fs_dir=str(tmp_path)).clock
@@ -0,0 +1,326 @@
+# ******************************************************************************************
+# FileName     : sf2bench.py
+# Description  : 펌웨어 성능 측정 (시뮬레이터 사용, JSON 출력)
+#                python sf2bench.py --drums 300 -o bench.json [--baseline old.json]
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 최대 속도 측정에서 주기적 개수 증가(count_tick)를 빼고 계수 확인
+# ******************************************************************************************
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+import tracemalloc
+
+from sf2sim import Conveyor, Simulation, VARIANTS
+from sf2sim.board import BLOCK_SERVO_PIN, BLOCK_OPEN_ANGLE
+
+
+BOOT_CONNECT_MS = 2000                                   # 부팅 측정 때 가정하는 Wi-Fi, MQTT 연결 시간
+LONG_PERIOD_MS = 5000                                    # et_long_periodic_process 주기
+
+SWEEP_DPM = (10, 15, 20, 25, 30, 35, 40, 45, 50, 60, 75, 90, 120)   # 드럼통/분 측정 구간
+
+# 기준값 대비 악화로 보는 항목과 허용 비율 (--baseline)
+REGRESSION_KEYS = {
+    'loop_ms.p99': 1.10,
+    'arrival_to_gate_ms.p50': 1.10,
+    'detect_to_gate_ms.p50': 1.10,
+    'publishes_per_drum': 1.05,
+    'bytes_per_drum': 1.05,
+    'alloc_bytes_per_loop': 1.25,
+    'idle.pings_per_s': 1.10,                            # 드럼통이 없을 때 초당 측정
+    'flood.latency_ms.p99': 1.25,                        # 명령 폭주 중 처리 지연 (sf2flood)
+    'flood.queue_depth.max': 1.25,
+}
+FLOOD_DRUMS = 40                                         # 명령 폭주 측정 드럼통 수
+
+
+#===========================================================================================
+def percentiles(values):                                 # 분포 요약
+#===========================================================================================
+    if not values:
+        return None
+    v = sorted(values)
+    pick = lambda p: v[min(len(v) - 1, int(p * len(v)))]
+    return {
+        'n': len(v),
+        'min': round(v[0], 3),
+        'p50': round(pick(0.50), 3),
+        'p90': round(pick(0.90), 3),
+        'p99': round(pick(0.99), 3),
+        'max': round(v[-1], 3),
+        'mean': round(sum(v) / len(v), 3),
+    }
+
+
+#===========================================================================================
+def gate_events(sim):                                    # 차단대 열림/닫힘 시각 목록
+#===========================================================================================
+    opens, closes = [], []
+    state = False
+    for t, angle in sim.board.servo_log.get(BLOCK_SERVO_PIN, []):
+        is_open = angle >= BLOCK_OPEN_ANGLE
+        if is_open and not state:
+            opens.append(t)
+        elif state and not is_open:
+            closes.append(t)
+        state = is_open
+    return opens, closes
+
+
+#===========================================================================================
+def first_after(times, t):                               # t 이후 첫 시각
+#===========================================================================================
+    for x in times:
+        if x >= t:
+            return x
+    return None
+
+
+#===========================================================================================
+def count_ticks(sim):                                    # 주기적 처리에서 늘어난 개수 (시험 펌웨어 count_tick)
+#===========================================================================================
+    ticks = [0]
+    fw = sim.fw
+    original = getattr(fw, 'et_long_periodic_process', None)
+    if original is None:
+        return ticks
+
+    def et_long_periodic_process():                      # 주기적 처리에서는 드럼통을 감지하지 않음
+        before = fw.count
+        original()
+        ticks[0] += fw.count - before
+    fw.et_long_periodic_process = et_long_periodic_process
+    return ticks
+
+
+#===========================================================================================
+def new_simulation(variant, drums, interval_ms, seed):
+#===========================================================================================
+    conveyor = Conveyor(seed=seed)
+    conveyor.add_drums(drums, interval_ms, start_ms=2000)
+    sim = Simulation(variant, conveyor)
+    sim.setup()
+    return sim
+
+
+#===========================================================================================
+def measure_boot(variant, connect_ms=BOOT_CONNECT_MS):   # 전원 인가 -> 첫 계수 (드럼통이 이미 센서 앞)
+#===========================================================================================
+    conveyor = Conveyor()
+    conveyor.add_drum(0)
+    sim = Simulation(variant, conveyor, connect_ms=connect_ms)
+    sim.setup()
+    while sim.count == 0 and sim.now_ms < connect_ms + 10000:
+        sim.step()
+    phases = sim.boot_ms() or {}
+    first_count_ms = phases.get('first_count')           # 부팅 기록이 없는 펌웨어는 루프 단위
+    if first_count_ms is None and sim.count:
+        first_count_ms = round(sim.now_ms, 3)
+    sim.run(LONG_PERIOD_MS)                              # 부팅 보고서 송신까지
+    return {
+        'connect_ms': connect_ms,
+        'first_count_ms': first_count_ms,
+        'phases_ms': phases or None,
+        'reported': bool(sim.telemetry('boot')),
+    }
+
+
+#===========================================================================================
+def measure_idle(variant, ms=60000):                     # 드럼통이 없을 때 초당 측정, 루프 횟수
+#===========================================================================================
+    sim = Simulation(variant, Conveyor())
+    sim.setup()
+    sim.run(1000)
+    pings, loops = sim.board.ping_count, sim.loop_count
+    sim.run(ms)
+    return {
+        'pings_per_s': round((sim.board.ping_count - pings) * 1000 / ms, 3),
+        'loops_per_s': round((sim.loop_count - loops) * 1000 / ms, 3),
+    }
+
+
+#===========================================================================================
+def measure_run(variant, drums, interval_ms, seed=0):    # 일정 간격 운전 측정
+#===========================================================================================
+    sim = new_simulation(variant, drums, interval_ms, seed)
+    sim.run(1000)                                        # 부팅 직후 송신은 제외
+    sim.broker.reset_stats()
+    sim.board.servo_log.pop(BLOCK_SERVO_PIN, None)
+
+    detects = []                                         # 드럼통 감지 시각
+    fw = sim.fw
+    if hasattr(fw, 'detect_drum'):
+        original = fw.detect_drum
+
+        def detect_drum(*args):
+            found = original(*args)
+            if found:
+                detects.append(sim.now_ms)
+            return found
+        fw.detect_drum = detect_drum
+
+    loop_ms, loop_wall_us, alloc = [], [], []
+    tracemalloc.start()
+    conveyor = sim.conveyor
+    limit_ms = conveyor.last_end_ms() + 60000 + drums * 5000
+    while (conveyor.passed_count < drums and sim.now_ms < limit_ms) or len(loop_ms) < 10:
+        t0 = sim.now_ms
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        w0 = time.perf_counter()
+        sim.step()
+        loop_wall_us.append((time.perf_counter() - w0) * 1e6)
+        alloc.append(tracemalloc.get_traced_memory()[1] - base)
+        loop_ms.append(sim.now_ms - t0)
+    tracemalloc.stop()
+    sim.run(3000)
+
+    opens, closes = gate_events(sim)
+    arrival_to_gate = [first_after(opens, s) - s for s in conveyor.starts if first_after(opens, s) is not None]
+    detect_to_gate = [first_after(opens, d) - d for d in detects if first_after(opens, d) is not None]
+    cycles = [first_after(closes, o) - o for o in opens if first_after(closes, o) is not None]
+
+    elapsed_min = max(sim.now_ms - 1000, 1) / 60000
+    counted = sim.count
+    publishes = sim.broker.publish_count
+    return {
+        'drums': drums,
+        'interval_ms': interval_ms,
+        'count': counted,
+        'count_error': counted - drums,
+        'passed': conveyor.passed_count,
+        'loop_ms': percentiles(loop_ms),
+        'loop_wall_us': percentiles(loop_wall_us),
+        'arrival_to_gate_ms': percentiles(arrival_to_gate),
+        'detect_to_gate_ms': percentiles(detect_to_gate),
+        'gate_cycle_ms': percentiles(cycles),
+        'publishes': publishes,
+        'publishes_per_drum': round(publishes / max(drums, 1), 3),
+        'bytes_per_drum': round(sim.broker.byte_count / max(drums, 1), 1),
+        'publishes_per_min': round(publishes / elapsed_min, 2),
+        'alloc_bytes_per_loop': percentiles(alloc)['mean'],
+    }
+
+
+#===========================================================================================
+def sweep_rate(variant, drums, seed=0):                  # 계수 오류 없이 처리 가능한 최대 속도
+#===========================================================================================
+    points = []
+    best = 0
+    for dpm in SWEEP_DPM:
+        interval = 60000 / dpm
+        sim = new_simulation(variant, drums, interval, seed)
+        ticks = count_ticks(sim)
+        sim.run_conveyor(tail_ms=3000)
+        c = sim.conveyor
+        span_ms = c.exits[-1] - c.starts[0] if len(c.exits) == drums else None
+        achieved = round(drums * 60000 / span_ms, 2) if span_ms else 0
+        counted = sim.count - ticks[0]                   # 드럼통 감지로 늘어난 개수
+        exact = counted == drums and c.passed_count == drums
+        keeps_up = achieved >= 0.95 * dpm
+        points.append({'offered_dpm': dpm, 'achieved_dpm': achieved,
+                       'count': counted, 'exact': exact, 'keeps_up': keeps_up})
+        if exact and keeps_up:
+            best = dpm
+        if not exact:
+            break
+    return best, points
+
+
+#===========================================================================================
+def lookup(result, dotted):
+#===========================================================================================
+    value = result
+    for part in dotted.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+#===========================================================================================
+def compare(results, baseline):                          # 기준 결과 대비 악화 항목
+#===========================================================================================
+    regressions = []
+    for variant, result in results['variants'].items():
+        base = baseline.get('variants', {}).get(variant)
+        if not base:
+            continue
+        for key, ratio in REGRESSION_KEYS.items():
+            now, before = lookup(result['steady'], key), lookup(base['steady'], key)
+            if now is None or before is None or before <= 0:
+                continue
+            if now > before * ratio:
+                regressions.append({'variant': variant, 'metric': key, 'baseline': before, 'current': now})
+        if lookup(base['steady'], 'flood.count_error') == 0 and \
+                lookup(result['steady'], 'flood.count_error') not in (0, None):
+            regressions.append({'variant': variant, 'metric': 'flood.count_error', 'baseline': 0,
+                                'current': lookup(result['steady'], 'flood.count_error')})
+        if result['max_sustainable_dpm'] < base.get('max_sustainable_dpm', 0):
+            regressions.append({'variant': variant, 'metric': 'max_sustainable_dpm',
+                                'baseline': base['max_sustainable_dpm'],
+                                'current': result['max_sustainable_dpm']})
+    return regressions
+
+
+#===========================================================================================
+def main(argv=None):
+#===========================================================================================
+    parser = argparse.ArgumentParser(description='스마트 팩토리2 펌웨어 성능 측정')
+    parser.add_argument('--variants', default='all', help='쉼표로 구분 (%s)' % ', '.join(VARIANTS))
+    parser.add_argument('--drums', type=int, default=200, help='정상 운전 측정 드럼통 수')
+    parser.add_argument('--interval-ms', type=int, default=3000, help='정상 운전 도착 간격')
+    parser.add_argument('--sweep-drums', type=int, default=60, help='속도 측정 구간별 드럼통 수')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', help='결과 JSON 파일')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON (악화 시 종료 코드 1)')
+    args = parser.parse_args(argv)
+
+    from sf2flood import measure_flood                   # sf2flood 가 이 모듈의 percentiles 를 사용
+
+    variants = list(VARIANTS) if args.variants == 'all' else args.variants.split(',')
+    results = {'version': 1, 'variants': {}}
+
+    for variant in variants:
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # 펌웨어의 print() 출력은 버림
+            steady = measure_run(variant, args.drums, args.interval_ms, args.seed)
+            best, points = sweep_rate(variant, args.sweep_drums, args.seed)
+            boot = measure_boot(variant)
+            steady['idle'] = measure_idle(variant)
+            steady['flood'] = measure_flood(variant, drums=FLOOD_DRUMS, seed=args.seed)
+        results['variants'][variant] = {
+            'steady': steady,
+            'boot': boot,
+            'max_sustainable_dpm': best,
+            'sweep': points,
+            'wall_s': round(time.perf_counter() - started, 3),
+        }
+        print('%-11s loop p50 %6.1f ms  gate %6.1f ms  %5.2f pub/drum  %6.1f B/drum  max %3d dpm' % (
+            variant, steady['loop_ms']['p50'],
+            (steady['arrival_to_gate_ms'] or {}).get('p50', -1),
+            steady['publishes_per_drum'], steady['bytes_per_drum'], best), file=sys.stderr)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f))
+        for r in regressions:
+            print('악화: %(variant)s %(metric)s %(baseline)s -> %(current)s' % r, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,67 @@
+# ******************************************************************************************
+# FileName     : sf2build.py
+# Description  : 공용 모듈(smartfactory2)을 mpy-cross 로 .mpy 바이트코드로 변환
+#                python sf2build.py [-o build] [--march xtensawin]
+#                펌웨어 이미지에 포함하려면 src/MicroPython/manifest.py 사용
+# Author       :
+# Created Date : 2026.10.18
+# Reference    : https://docs.micropython.org/en/latest/reference/mpyfiles.html
+# Modified     :
+# ******************************************************************************************
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+
+FIRMWARE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'MicroPython'))
+PACKAGE = 'smartfactory2'
+
+
+#===========================================================================================
+def build(output, mpy_cross='mpy-cross', march=None, opt=3):  # .py -> .mpy 변환
+#===========================================================================================
+    source_dir = os.path.join(FIRMWARE_DIR, PACKAGE)
+    target_dir = os.path.join(output, PACKAGE)
+    os.makedirs(target_dir, exist_ok=True)
+
+    built = []
+    for name in sorted(os.listdir(source_dir)):
+        if not name.endswith('.py'):
+            continue
+        target = os.path.join(target_dir, name[:-3] + '.mpy')
+        command = [mpy_cross, '-O%d' % opt, '-s', PACKAGE + '/' + name, '-o', target]
+        if march:
+            command.append('-march=' + march)            # 네이티브 코드(@micropython.native) 대상
+        command.append(os.path.join(source_dir, name))
+        subprocess.run(command, check=True)
+        built.append((target, os.path.getsize(os.path.join(source_dir, name)), os.path.getsize(target)))
+    return built
+
+
+#===========================================================================================
+def main(argv=None):
+#===========================================================================================
+    parser = argparse.ArgumentParser(description='스마트 팩토리2 공용 모듈 .mpy 빌드')
+    parser.add_argument('-o', '--output', default='build', help='출력 폴더 (보드에 그대로 복사)')
+    parser.add_argument('--mpy-cross', default='mpy-cross', help='mpy-cross 실행 파일')
+    parser.add_argument('--march', help='대상 아키텍처 (ESP32: xtensawin)')
+    parser.add_argument('-O', '--opt', type=int, default=3, help='최적화 수준 (3: assert, 줄 번호 제거)')
+    args = parser.parse_args(argv)
+
+    if shutil.which(args.mpy_cross) is None:
+        print('mpy-cross 를 찾을 수 없음 : pip install mpy-cross', file=sys.stderr)
+        return 1
+
+    total_py = total_mpy = 0
+    for target, py_size, mpy_size in build(args.output, args.mpy_cross, args.march, args.opt):
+        print('%-40s %6d -> %6d bytes' % (target, py_size, mpy_size))
+        total_py += py_size
+        total_mpy += mpy_size
+    print('%-40s %6d -> %6d bytes' % ('합계', total_py, total_mpy))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,272 @@
+# ******************************************************************************************
+# FileName     : sf2flood.py
+# Description  : 명령 폭주 부하 시험 (수신 경로 처리 지연, 대기열 깊이, 버림, 계수 정확도)
+#                python sf2flood.py standard --rate pos=50 --rate block=50 -o flood.json
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+
+from sf2sim import Conveyor, Simulation, VARIANTS
+from sf2bench import percentiles
+
+
+# 명령 토픽 -> 보낼 값 (차례로 반복)
+PAYLOADS = {
+    'pos': ('0', '1', '2', '3'),
+    'block': ('open', 'close'),
+    'reset': ('reset',),
+    'get_sensor_type': ('get',),
+    'transit': ('get',),
+}
+BAD_PAYLOAD = 'x'                                        # 잘못된 값 (--malformed 비율만큼)
+
+DEFAULT_RATES = {'pos': 20.0, 'block': 20.0, 'reset': 0.2, 'get_sensor_type': 5.0}   # 초당 횟수
+
+# 기준 결과 대비 악화로 보는 항목과 허용 비율 (--baseline)
+REGRESSION_KEYS = {
+    'latency_ms.p99': 1.25,
+    'loop_ms.p99': 1.10,
+    'queue_depth.max': 1.25,
+}
+
+
+#===========================================================================================
+class Flood:                                             # 가상 시각에 맞춰 명령 주입, 처리 시각 기록
+#===========================================================================================
+    # 명령은 가상 시계 예약으로 정해진 시각에 도착 (루프 실행 중이나 대기 중에도 도착)
+    # 처리 지연 : 도착 -> 그 명령(또는 대신한 더 새 명령)의 처리기 실행
+    # pos, block 은 대기열에서 마지막 값으로 합쳐지므로, 처리기가 한 번 실행되면 그때까지 주입한 같은 토픽 명령은 모두 처리로 봄
+
+    def __init__(self, sim, rates, malformed=0.0):
+        self.sim = sim
+        self.rates = rates                               # topic -> 초당 횟수
+        self.malformed = malformed
+        self.stopped = False
+        self.sent = {topic: 0 for topic in rates}
+        self.bad = 0
+        self.waiting = {topic: [] for topic in rates}    # 처리되지 않은 주입 시각
+        self.latency = {topic: [] for topic in rates}
+        self.handled = {topic: 0 for topic in rates}
+        self.depth = []                                  # 명령 실행 직전 대기열 깊이 (명령 대기열 펌웨어)
+        self.inbox = []                                  # 루프마다 수신 대기열(브로커 -> 키트) 깊이
+        self.reset_total = 0                             # reset 전에 센 드럼통 수 합계
+        self._bad_at = 0.0
+
+        self.subscribed = {topic: topic in sim.app.callbacks for topic in rates}
+        self._wrap_handlers()
+        sim.loop_hooks.append(self._on_loop)
+        start_us = sim.clock.now_us + 1000000            # 1초 뒤부터 주입
+        for topic, rate in rates.items():
+            if rate > 0:
+                self._schedule(topic, start_us)
+
+    def _wrap_handlers(self):                            # 처리기 실행 시각 기록
+        fw = self.sim.fw
+        commands = getattr(fw, 'commands', None)
+        if commands is not None and hasattr(commands, 'handlers'):   # 명령 대기열 펌웨어
+            table = commands.handlers
+            for topic, (parse, handler) in list(table.items()):
+                if topic in self.rates:
+                    table[topic] = (parse, self._timed(topic, handler))
+            run = commands.run
+
+            def run_and_measure():                       # 실행 직전 대기열 깊이
+                self.depth.append(commands.length)
+                run()
+            commands.run = run_and_measure
+        else:                                            # 수신 콜백에서 바로 처리하는 펌웨어
+            table = self.sim.app.callbacks
+            for topic, handler in list(table.items()):
+                if topic in self.rates:
+                    table[topic] = self._timed(topic, handler)
+
+    def _timed(self, topic, handler):
+        sim = self.sim
+
+        def timed(t, msg):
+            if topic == 'reset':
+                self.reset_total += sim.count            # 초기화 전 생산 수량
+            result = handler(t, msg)
+            now = sim.now_ms
+            for at in self.waiting[topic]:
+                self.latency[topic].append(now - at)
+            self.waiting[topic] = []
+            self.handled[topic] += 1
+            return result
+        return timed
+
+    def _schedule(self, topic, at_us):                   # at_us 에 명령 하나 도착, 다음 명령 예약
+        def fire():
+            if self.stopped:
+                return
+            self._send(topic)
+            self._schedule(topic, at_us + 1e6 / self.rates[topic])   # 누적 오차 없이 일정 간격
+        self.sim.clock.schedule(at_us, fire)
+
+    def stop(self):                                      # 주입 중지 (남은 명령은 계속 처리)
+        self.stopped = True
+
+    def _on_loop(self, sim):                             # 루프마다 : 수신 대기열 깊이 기록
+        self.inbox.append(len(sim.app.inbox))
+
+    def _send(self, topic):
+        self._bad_at += self.malformed
+        if self._bad_at >= 1.0:                          # 일정 비율로 잘못된 값
+            self._bad_at -= 1.0
+            self.bad += 1
+            self.sim.inject(topic, BAD_PAYLOAD)
+            return
+        values = PAYLOADS[topic]
+        payload = values[self.sent[topic] % len(values)]
+        self.sent[topic] += 1
+        if self.subscribed[topic]:
+            self.waiting[topic].append(self.sim.now_ms)
+        self.sim.inject(topic, payload)
+
+
+#===========================================================================================
+def measure_flood(variant, rates=None, drums=100, interval_ms=2000, malformed=0.0, seed=0):
+#===========================================================================================
+    rates = dict(DEFAULT_RATES if rates is None else rates)
+    conveyor = Conveyor(seed=seed)
+    conveyor.add_drums(drums, interval_ms, start_ms=2000)
+    sim = Simulation(variant, conveyor)
+    sim.setup()
+    flood = Flood(sim, rates, malformed)
+
+    loop_ms, loop_wall_us = [], []
+    limit_ms = conveyor.last_end_ms() + 60000 + drums * 5000
+    while conveyor.passed_count < drums and sim.now_ms < limit_ms:
+        t0 = sim.now_ms
+        w0 = time.perf_counter()
+        sim.step()
+        loop_wall_us.append((time.perf_counter() - w0) * 1e6)
+        loop_ms.append(sim.now_ms - t0)
+    flood.stop()                                         # 주입을 멈추고 남은 명령 처리
+    sim.run(3000)
+
+    counted = flood.reset_total + sim.count              # reset 으로 지운 수량 포함
+    if getattr(sim.fw, 'profile', {}).get('count_tick'):
+        counted = None                                   # 주기적으로 개수를 늘리는 시험 펌웨어
+
+    per_topic = {}
+    all_latency = []
+    for topic in rates:
+        all_latency += flood.latency[topic]
+        per_topic[topic] = {
+            'rate_per_s': rates[topic],
+            'subscribed': flood.subscribed[topic],
+            'sent': flood.sent[topic],
+            'handled': flood.handled[topic],
+            'pending': len(flood.waiting[topic]),
+            'latency_ms': percentiles(flood.latency[topic]),
+        }
+
+    commands = getattr(sim.fw, 'commands', None)
+    stats = json.loads(commands.report()) if commands is not None and hasattr(commands, 'report') else None
+    return {
+        'drums': drums,
+        'interval_ms': interval_ms,
+        'count': counted,
+        'count_error': None if counted is None else counted - drums,
+        'passed': conveyor.passed_count,
+        'malformed_sent': flood.bad,
+        'latency_ms': percentiles(all_latency),
+        'queue_depth': percentiles(flood.depth),
+        'inbox_depth': percentiles(flood.inbox),
+        'loop_ms': percentiles(loop_ms),
+        'loop_wall_us': percentiles(loop_wall_us),
+        'servo_moves': {pin: len(log) for pin, log in sim.board.servo_log.items()},
+        'commands': per_topic,
+        'firmware_counters': stats,
+    }
+
+
+#===========================================================================================
+def compare(result, baseline):                           # 기준 결과 대비 악화 항목
+#===========================================================================================
+    from sf2bench import lookup
+
+    regressions = []
+    for variant, now in result.items():
+        base = baseline.get(variant)
+        if not base:
+            continue
+        for key, ratio in REGRESSION_KEYS.items():
+            a, b = lookup(now, key), lookup(base, key)
+            if a is not None and b is not None and b > 0 and a > b * ratio:
+                regressions.append({'variant': variant, 'metric': key, 'baseline': b, 'current': a})
+        if base.get('count_error') == 0 and now.get('count_error') != 0:
+            regressions.append({'variant': variant, 'metric': 'count_error',
+                                'baseline': 0, 'current': now.get('count_error')})
+    return regressions
+
+
+#===========================================================================================
+def parse_rates(items):                                  # ['pos=50', 'block=10'] -> {topic: rate}
+#===========================================================================================
+    rates = {}
+    for item in items:
+        topic, _, rate = item.partition('=')
+        if topic not in PAYLOADS:
+            raise ValueError('알 수 없는 명령: %s (%s)' % (topic, ', '.join(PAYLOADS)))
+        rates[topic] = float(rate)
+    return rates
+
+
+#===========================================================================================
+def main(argv=None):
+#===========================================================================================
+    parser = argparse.ArgumentParser(description='스마트 팩토리2 명령 폭주 부하 시험')
+    parser.add_argument('variants', nargs='?', default='all', help='쉼표로 구분 (%s)' % ', '.join(VARIANTS))
+    parser.add_argument('--rate', action='append', default=[], metavar='TOPIC=N',
+                        help='초당 명령 수 (기본: %s)' % ', '.join('%s=%g' % r for r in DEFAULT_RATES.items()))
+    parser.add_argument('--drums', type=int, default=100)
+    parser.add_argument('--interval-ms', type=int, default=2000)
+    parser.add_argument('--malformed', type=float, default=0.0, help='잘못된 값 비율 (0 ~ 1)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', help='결과 JSON 파일')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON (악화 시 종료 코드 1)')
+    args = parser.parse_args(argv)
+
+    try:
+        rates = parse_rates(args.rate) if args.rate else None
+    except ValueError as e:
+        parser.error(str(e))
+    variants = list(VARIANTS) if args.variants == 'all' else args.variants.split(',')
+
+    results = {}
+    for variant in variants:
+        with contextlib.redirect_stdout(io.StringIO()):  # 펌웨어의 print() 출력은 버림
+            r = measure_flood(variant, rates, args.drums, args.interval_ms, args.malformed, args.seed)
+        results[variant] = r
+        print('%-11s latency p99 %7.1f ms  depth max %3d  loop p99 %6.1f ms  count error %s' % (
+            variant, (r['latency_ms'] or {}).get('p99', -1), (r['queue_depth'] or {}).get('max', 0),
+            r['loop_ms']['p99'], r['count_error']), file=sys.stderr)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f))
+        for r in regressions:
+            print('악화: %(variant)s %(metric)s %(baseline)s -> %(current)s' % r, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,11 @@
+# ******************************************************************************************
+# FileName     : __init__.py
+# Description  : 여러 키트의 원격 측정을 모아 저장하는 게이트웨이 (PC, asyncio)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+from .normalize import Normalizer
+from .store import SampleStore
+from .gateway import Gateway, LocalSource, mqtt_source
@@ -0,0 +1,128 @@
+# ******************************************************************************************
+# FileName     : __main__.py
+# Description  : 게이트웨이 실행 : python -m sf2gw --host 192.168.0.10 --db fleet.db
+#                처리량 측정 : python -m sf2gw --bench 50 --messages 200000
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 실제 키트 토픽(<mac>/et/smpl/tele/<name>)으로 처리량 측정
+# ******************************************************************************************
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+
+from . import Gateway, LocalSource, SampleStore, mqtt_source
+
+
+#===========================================================================================
+def sample_messages(drums=10):                           # 네 가지 펌웨어가 실제로 보내는 (topic, payload)
+#===========================================================================================
+    # 키트 토픽은 MAC 주소를 뺀 '/et/smpl/tele/<name>' 으로 돌려줌 (bench 에서 키트별 구분자를 붙임)
+    from sf2sim import Conveyor, Simulation, VARIANTS
+
+    messages = []
+    for variant in VARIANTS:
+        for publish_format in ('frame', 'topic'):        # 상태 묶음, 토픽별 송신
+            conveyor = Conveyor()
+            conveyor.add_drums(drums, 2000)
+            with contextlib.redirect_stdout(io.StringIO()):   # 펌웨어 print 생략
+                sim = Simulation(variant, conveyor, options={'publish_format': publish_format})
+                sim.setup()
+                sim.run_conveyor()
+            kit = sim.kit
+            messages.extend((m[1][len(kit):] if m[1].startswith(kit) else m[1], m[2])
+                            for m in sim.broker.messages)
+    return messages
+
+
+#===========================================================================================
+async def bench(args):                                   # 키트 수 x 메시지를 LocalBroker 로 전달해 처리량 측정
+#===========================================================================================
+    from sf2sim import LocalBroker
+
+    samples = sample_messages()
+    kits = ['kit%03d' % i for i in range(args.bench)]
+
+    broker = LocalBroker()
+    store = SampleStore(args.db)
+    gateway = Gateway(store, batch=args.batch, flush_ms=args.flush_ms)
+    source = LocalSource(broker)
+    task = asyncio.ensure_future(gateway.run(source))
+
+    started = time.perf_counter()
+    n = 0
+    while n < args.messages:
+        for topic, payload in samples:
+            broker.publish(kits[n % len(kits)] + topic if topic[0] == '/' else topic, payload)
+            n += 1
+            if n % 1000 == 0:
+                await asyncio.sleep(0)                   # 게이트웨이가 대기열을 비울 기회
+            if n >= args.messages:
+                break
+    source.close()
+    await task
+    elapsed = time.perf_counter() - started
+
+    result = gateway.stats()
+    result['kits'] = args.bench
+    result['seconds'] = round(elapsed, 3)
+    result['messages_per_s'] = round(n / elapsed)
+    result['rows_in_db'] = store.count()
+    store.close()
+    return result
+
+
+#===========================================================================================
+async def serve(args):                                   # 실제 브로커 구독
+#===========================================================================================
+    store = SampleStore(args.db)
+    gateway = Gateway(store, batch=args.batch, flush_ms=args.flush_ms, default_kit=args.default_kit)
+    try:
+        await gateway.run(mqtt_source(args.host, args.port, args.pattern,
+                                      args.username, args.password))
+    finally:
+        print(json.dumps(gateway.stats()))
+        store.close()
+
+
+#===========================================================================================
+def main(argv=None):
+#===========================================================================================
+    parser = argparse.ArgumentParser(prog='sf2gw', description='스마트 팩토리2 키트 원격 측정 게이트웨이')
+    parser.add_argument('--host', help='MQTT 브로커 주소')
+    parser.add_argument('--port', type=int, default=1883)
+    parser.add_argument('--username')
+    parser.add_argument('--password')
+    parser.add_argument('--pattern', default='#', help='구독 토픽')
+    parser.add_argument('--db', help='SQLite 파일 (기본: fleet.db, --bench 는 임시 파일)')
+    parser.add_argument('--batch', type=int, default=1000, help='한 번에 저장할 최대 행 수')
+    parser.add_argument('--flush-ms', type=int, default=1000, help='최대 저장 간격')
+    parser.add_argument('--default-kit', default='kit', help='키트 구분자가 없는 토픽의 키트 이름')
+    parser.add_argument('--bench', type=int, metavar='KITS', help='LocalBroker 로 처리량 측정 (키트 수)')
+    parser.add_argument('--messages', type=int, default=200000, help='(--bench) 메시지 수')
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        if args.db is None:
+            args.db = os.path.join(tempfile.mkdtemp(prefix='sf2gw_'), 'bench.db')
+        print(json.dumps(asyncio.run(bench(args)), indent=2))
+        return 0
+
+    if not args.host:
+        parser.error('--host 또는 --bench 가 필요함')
+    if args.db is None:
+        args.db = 'fleet.db'
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
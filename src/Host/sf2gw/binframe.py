@@ -0,0 +1,65 @@
+# ******************************************************************************************
+# FileName     : binframe.py
+# Description  : 이진 상태 묶음, 센서 데이터 복호화 (펌웨어 smartfactory2/binframe.py 와 짝)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    : src/MicroPython/smartfactory2/binframe.py
+# Modified     :
+# ******************************************************************************************
+import json
+import struct
+
+
+MAGIC = 0xB7
+VERSION = 1
+HEADER = '<BBHI'                                         # MAGIC, VERSION, 스키마 번호, 값 있음 비트
+HEADER_SIZE = struct.calcsize(HEADER)
+
+
+#===========================================================================================
+def is_binary(payload):                                  # 이진 묶음인가 (JSON 은 '{' 로 시작)
+#===========================================================================================
+    return len(payload) >= HEADER_SIZE and payload[0] == MAGIC
+
+
+#===========================================================================================
+class BinaryDecoder:                                     # 스키마별 복호화
+#===========================================================================================
+    # 펌웨어가 <mac>/et/smpl/tele/schema 로 보내는 스키마 JSON 을 learn() 으로 등록한 뒤 decode()
+
+    def __init__(self):
+        self.schemas = {}                                # 스키마 번호 -> (struct, 필드 목록)
+        self.unknown = 0                                 # 스키마를 모르는 묶음 수
+
+    def learn(self, schema):                             # 스키마 JSON (문자열, bytes 또는 dict)
+        if not isinstance(schema, dict):
+            schema = json.loads(schema)
+        fields = schema['fields']                        # [[name, fmt, scale, enum], ...]
+        layout = struct.Struct(HEADER + ''.join(f[1] for f in fields))
+        self.schemas[schema['id']] = (layout, fields)
+        return schema['id']
+
+    def decode(self, payload):                           # 이진 묶음 -> dict, 스키마를 모르면 None
+        magic, version, schema_id, present = struct.unpack_from(HEADER, payload)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('binframe 이 아님')
+        entry = self.schemas.get(schema_id)
+        if entry is None:
+            self.unknown += 1
+            return None
+        layout, fields = entry
+        values = layout.unpack(payload)[4:]
+
+        result = {}
+        for i, (name, fmt, scale, enum) in enumerate(fields):
+            if not present & (1 << i):                   # 값 없음 (펌웨어의 None)
+                continue
+            value = values[i]
+            if enum:
+                value = enum[value] if value < len(enum) else None
+            elif scale != 1:
+                value = value / scale                    # 정수로 보낸 값을 실제 단위로
+            elif fmt == 'f':
+                value = round(value, 4)                  # float32 -> 읽기 쉬운 자릿수
+            result[name] = value
+        return result
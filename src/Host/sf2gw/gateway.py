@@ -0,0 +1,133 @@
+# ******************************************************************************************
+# FileName     : gateway.py
+# Description  : 여러 키트의 MQTT 메시지를 한 번 구독해 정규화 후 묶음 저장 (asyncio)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 이중 버퍼 : 수신 루프는 저장(디스크)을 기다리지 않음
+# ******************************************************************************************
+import asyncio
+import time
+
+from .normalize import Normalizer
+
+try:
+    import aiomqtt                                       # 실제 브로커 연결 (pip install aiomqtt)
+except ImportError:
+    aiomqtt = None
+
+
+#===========================================================================================
+class LocalSource:                                       # LocalBroker 구독 -> 비동기 메시지 목록
+#===========================================================================================
+    # sf2sim.LocalBroker 로 게이트웨이를 실제 브로커 없이 시험할 때 사용
+
+    def __init__(self, broker, pattern='#'):
+        self.broker = broker
+        self.queue = asyncio.Queue()
+        broker.subscribe(pattern, self._on_message)
+
+    def _on_message(self, topic, payload):               # 브로커 콜백 (동기) : 대기열에 넣기만 함
+        self.queue.put_nowait((topic, payload))
+
+    def close(self):                                     # 남은 메시지를 처리한 뒤 끝냄
+        self.broker.unsubscribe(self._on_message)
+        self.queue.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self.queue.get()
+        if item is None:
+            raise StopAsyncIteration
+        return item
+
+
+#===========================================================================================
+async def mqtt_source(host, port=1883, pattern='#', username=None, password=None):
+#===========================================================================================
+    # 실제 MQTT 브로커 구독 (aiomqtt 2.x)
+    if aiomqtt is None:
+        raise RuntimeError('aiomqtt 가 설치되어 있지 않음 (pip install aiomqtt)')
+    async with aiomqtt.Client(host, port, username=username, password=password) as client:
+        await client.subscribe(pattern)
+        async for message in client.messages:
+            yield str(message.topic), message.payload
+
+
+#===========================================================================================
+class Gateway:                                           # 수신 -> 정규화 -> 묶음 저장
+#===========================================================================================
+    # 수신 루프는 행을 목록에 모으기만 하고, 저장은 batch 행이 차거나 flush_ms 마다 스레드에서 실행
+    # 이중 버퍼 : 저장 중에는 다음 목록에 계속 모으고, 저장이 끝나면 모인 행을 이어서 넘김 (순서 유지)
+    # 수신 루프는 목록 교체만 하며 디스크 저장을 기다리지 않음
+
+    def __init__(self, store, batch=1000, flush_ms=1000, default_kit='kit', clock=time.time):
+        self.store = store
+        self.batch = batch
+        self.flush_ms = flush_ms
+        self.clock = clock                               # 수신 시각 (epoch 초)
+        self.normalizer = Normalizer(default_kit)
+
+        self.pending = []                                # 모으는 중인 행
+        self.writing = None                              # 진행 중인 저장 (asyncio.Future)
+        self.error = None                                # 기다리는 쪽이 없던 저장의 오류
+        self.flushes = 0
+
+    def feed(self, topic, payload, ts=None):             # 메시지 하나 정규화 (동기, 빠름)
+        row = self.normalizer.row(topic, payload, self.clock() if ts is None else ts)
+        if row is not None:
+            self.pending.append(row)
+
+    def _swap(self):                                     # 모은 행을 저장 스레드로 넘김 (await 없음)
+        if self.writing is not None or not self.pending:
+            return                                       # 저장 중 : 끝나면 _written 이 이어서 넘김
+        rows = self.pending
+        self.pending = []                                # await 없이 교체하므로 수신 루프와 겹치지 않음
+        self.flushes += 1
+        self.writing = asyncio.ensure_future(asyncio.to_thread(self.store.write, rows))
+        self.writing.add_done_callback(self._written)
+
+    def _written(self, future):                          # 저장 끝 (이벤트 루프에서 호출)
+        self.writing = None
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self.error = future.exception()              # 다음 flush 에서 알림
+            return
+        if len(self.pending) >= self.batch:
+            self._swap()
+
+    async def flush(self):                               # 모인 행을 모두 저장할 때까지 기다림
+        self._swap()
+        while self.writing is not None:
+            await asyncio.wait([self.writing])           # 오류는 _written 이 self.error 에 남김
+            self._swap()
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    async def _flush_every(self):
+        while True:
+            await asyncio.sleep(self.flush_ms / 1000)
+            await self.flush()
+
+    async def run(self, source):                         # source : (topic, payload) 비동기 목록
+        ticker = asyncio.ensure_future(self._flush_every())
+        try:
+            feed = self.feed
+            async for topic, payload in source:
+                feed(topic, payload)
+                if len(self.pending) >= self.batch:
+                    self._swap()                         # 저장 중이면 계속 모음
+        finally:
+            ticker.cancel()
+            await self.flush()                           # 마지막 저장이 끝날 때까지
+
+    def stats(self):
+        result = self.normalizer.stats()
+        result['stored'] = self.store.rows
+        result['batches'] = self.store.batches
+        result['pending'] = len(self.pending)
+        return result
@@ -0,0 +1,176 @@
+# ******************************************************************************************
+# FileName     : normalize.py
+# Description  : 키트별 토픽, 페이로드를 하나의 행 형식 (ts, kit, count, pos, block ...) 으로 변환
+# Author       :
+# Created Date : 2026.10.18
+# Reference    : smartfactory2/core.py, smartfactory2/profiles.py,
+#                src/App_Inventor/SmartFactory2_IoT_v091.aia (TeleTopic, getValueFromMsg)
+# Modified     : 2026.10.18 : 이진 묶음(binframe) 복호화, schema 스키마 등록
+# Modified     : 2026.10.18 : 실제 키트 토픽 <mac>/et/smpl/tele/<name> 과 {key: value} 페이로드로 변경
+# ******************************************************************************************
+import json
+import struct
+
+from .binframe import BinaryDecoder, is_binary
+
+
+# 정규화한 한 행 : (ts, kit, FIELDS...) , 메시지에 없는 필드는 NULL
+FIELDS = ('count', 'pos', 'block', 'distance', 'rate', 'temp', 'lux',
+          'dpm1', 'dpm5', 'dpm15', 'gap_ms', 'gap_dev', 'cmd_err')
+INDEX = dict((field, i) for i, field in enumerate(FIELDS))
+
+TELE = '/et/smpl/tele/'                                  # ET_IoT_App.send_data : <mac>/et/smpl/tele/<name> {key: value}
+SCALAR = {                                               # 토픽별 송신 (publish_format='topic') : (name, key) -> 필드
+    ('drum', 'count'): 'count',
+    ('pos', 'state'): 'pos',
+    ('block', 'state'): 'block',
+}
+SCHEMA = 'schema'                                        # 이진 묶음 스키마 (<mac>/et/smpl/tele/schema {key: 스키마 JSON})
+RAW_TOPICS = ('aws/etboard',)                            # 키트 구분 없이 직접 publish 하는 토픽 (AWS raw_topics, 필드 JSON)
+
+WORDS = {'open': 1.0, 'close': 0.0}                      # 문자열 상태 -> 숫자 (block)
+
+
+#===========================================================================================
+def _number(value):                                      # 숫자로 변환, 변환할 수 없으면 None
+#===========================================================================================
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        word = WORDS.get(value)
+        if word is not None:
+            return word
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+#===========================================================================================
+def _merge(values, data):                                # 필드 JSON 의 아는 필드를 행에 넣음, 넣은 것이 있으면 True
+#===========================================================================================
+    found = False
+    for field, value in data.items():
+        i = INDEX.get(field)
+        if i is not None:                                # 모르는 필드는 생략
+            value = _number(value)                       # None (센서 이상) 은 NULL
+            if value is not None:
+                values[i] = value
+                found = True
+    return found
+
+
+#===========================================================================================
+class Normalizer:                                        # 메시지 -> 행
+#===========================================================================================
+    # 변형별 송신(drum {count}, kit {status: 묶음}, throughput {dpm: 묶음}, sensor {sensorId: value},
+    # aws/etboard ...)을 같은 열의 한 행으로 변환
+
+    def __init__(self, default_kit='kit'):
+        self.default_kit = default_kit                   # 토픽에 키트 구분자가 없을 때 (AWS raw_topics)
+        self.empty = [None] * len(FIELDS)
+        self.decoder = BinaryDecoder()                   # 이진 묶음 (frame_encoding, sensor_encoding='binary')
+
+        self.messages = 0
+        self.rows = 0
+        self.ignored = 0                                 # 원격 측정이 아닌 메시지 (boot, stats, 명령 등)
+        self.malformed = 0                               # 해석할 수 없는 페이로드
+        self.binary = 0                                  # 복호화한 이진 묶음 수
+
+    def split(self, topic):                              # (키트, 송신 이름), 키트 송신 토픽이 아니면 (None, None)
+        kit, sep, name = topic.rpartition(TELE)
+        if sep and kit and '/' not in name:
+            return kit, name
+        if topic in RAW_TOPICS:
+            return self.default_kit, topic
+        return None, None
+
+    def row(self, topic, payload, ts):                   # (ts, kit, FIELDS...) , 저장할 값이 없으면 None
+        self.messages += 1
+        kit, name = self.split(topic)
+        if kit is None:
+            self.ignored += 1
+            return None
+
+        values = list(self.empty)
+        if isinstance(payload, (bytes, bytearray)):
+            if is_binary(payload):                       # 이진 묶음 : 스키마 번호로 복호화
+                return self._binary(ts, kit, payload, values)
+            try:
+                payload = payload.decode()
+            except UnicodeDecodeError:
+                self.malformed += 1
+                return None
+
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            self.malformed += 1
+            return None
+        if not isinstance(data, dict):
+            self.malformed += 1
+            return None
+
+        if name == SCHEMA:                               # {key: 스키마 JSON}
+            try:
+                for schema in data.values():
+                    self.decoder.learn(schema)
+            except (ValueError, KeyError, TypeError, struct.error):
+                self.malformed += 1
+                return None
+            self.ignored += 1
+            return None
+
+        found = False
+        for key, value in data.items():
+            field = SCALAR.get((name, key))
+            if field is not None:                        # drum {count}, pos {state}, block {state}
+                value = _number(value)
+                if value is None:
+                    self.malformed += 1
+                    return None
+                values[INDEX[field]] = value
+                found = True
+            elif isinstance(value, str) and value[:1] == '{':   # send_data 로 보낸 상태 묶음 {status: "{...}"}
+                try:
+                    frame = json.loads(value)
+                except ValueError:
+                    self.malformed += 1
+                    return None
+                if isinstance(frame, dict) and _merge(values, frame):
+                    found = True
+            elif isinstance(value, dict):
+                found = _merge(values, value) or found
+            else:                                        # 필드 JSON (센서 데이터, aws/etboard)
+                i = INDEX.get(key)
+                value = _number(value) if i is not None else None
+                if value is not None:
+                    values[i] = value
+                    found = True
+
+        if not found:
+            self.ignored += 1
+            return None
+        self.rows += 1
+        return (ts, kit, *values)
+
+    def _binary(self, ts, kit, payload, values):         # 이진 묶음, 센서 데이터
+        try:
+            data = self.decoder.decode(payload)
+        except (ValueError, struct.error):
+            self.malformed += 1
+            return None
+        if data is None:                                 # 아직 스키마를 받지 못함
+            self.ignored += 1
+            return None
+        self.binary += 1
+        if not _merge(values, data):
+            self.ignored += 1
+            return None
+        self.rows += 1
+        return (ts, kit, *values)
+
+    def stats(self):
+        return {'messages': self.messages, 'rows': self.rows, 'binary': self.binary,
+                'ignored': self.ignored, 'malformed': self.malformed}
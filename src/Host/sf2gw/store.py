@@ -0,0 +1,62 @@
+# ******************************************************************************************
+# FileName     : store.py
+# Description  : SQLite 저장 (묶음 단위 executemany, 한 트랜잭션)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import sqlite3
+
+from .normalize import FIELDS
+
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS samples (
+    ts    REAL NOT NULL,                                 -- 게이트웨이 수신 시각 (epoch 초)
+    kit   TEXT NOT NULL,                                 -- 키트 구분자 (토픽 앞부분)
+    -- normalize.FIELDS : 메시지에 없는 값은 NULL
+    %s
+);
+CREATE INDEX IF NOT EXISTS samples_kit_ts ON samples (kit, ts);
+''' % ',\n    '.join(field + ' REAL' for field in FIELDS)
+INSERT = 'INSERT INTO samples VALUES (%s)' % ', '.join('?' * (len(FIELDS) + 2))
+
+
+#===========================================================================================
+class SampleStore:                                       # samples 테이블 저장
+#===========================================================================================
+    def __init__(self, path):
+        self.path = path
+        # 쓰기는 게이트웨이의 저장 스레드에서만 함
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')       # 읽는 쪽(대시보드)과 동시에 사용
+        self.db.execute('PRAGMA synchronous=NORMAL')     # 묶음마다 fsync 하지 않음 (WAL 체크포인트 때)
+        self.db.execute('PRAGMA cache_size=-32768')      # 32 MB : 색인이 커져도 디스크 읽기 없이 삽입
+        self.db.executescript(SCHEMA)
+
+        self.batches = 0
+        self.rows = 0
+
+    def write(self, rows):                               # 행 묶음을 한 트랜잭션으로 저장
+        with self.db:
+            self.db.executemany(INSERT, rows)
+        self.batches += 1
+        self.rows += len(rows)
+
+    def count(self, kit=None):
+        if kit is None:
+            return self.db.execute('SELECT COUNT(*) FROM samples').fetchone()[0]
+        return self.db.execute('SELECT COUNT(*) FROM samples WHERE kit = ?', (kit,)).fetchone()[0]
+
+    def latest(self, kit):                               # 키트의 필드별 마지막 값
+        result = {}
+        for field in FIELDS:
+            row = self.db.execute('SELECT %s FROM samples WHERE kit = ? AND %s IS NOT NULL '
+                                  'ORDER BY ts DESC LIMIT 1' % (field, field), (kit,)).fetchone()
+            if row:
+                result[field] = row[0]
+        return result
+
+    def close(self):
+        self.db.close()
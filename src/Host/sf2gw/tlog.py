@@ -0,0 +1,161 @@
+# ******************************************************************************************
+# FileName     : tlog.py
+# Description  : 송수신 메시지 기록 (이진 로그)과 배속 재생 (1x ~ 100x)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 방향을 토픽의 cmnd/tele 단계로 구분
+# Modified     : 2026.10.18 : 페이로드 길이를 32비트로 (64 KB 가 넘는 메시지도 기록), 로그 버전 2
+# ******************************************************************************************
+import asyncio
+import struct
+import time
+
+
+MAGIC = b'SF2T'
+VERSION = 2                                              # 2 : 길이 32비트
+FILE_HEADER = struct.Struct('<4sBd')                     # MAGIC, VERSION, 기록 시작 시각 (epoch 초)
+RECORD = struct.Struct('<IBHI')                          # 이전 기록과의 시간 차 (us), 종류, 토픽 번호, 길이
+
+UP = 0                                                   # 키트 -> 브로커 (publish)
+DOWN = 1                                                 # 브로커 -> 키트 (수신 명령)
+TOPIC = 2                                                # 토픽 번호 정의 (데이터 : 토픽 문자열)
+GAP = 3                                                  # 시간만 진행 (시간 차가 32비트를 넘을 때)
+
+MAX_DELTA_US = 0xFFFFFFFF
+SPIN_S = 0.002                                           # 재생 시각 직전에는 sleep 대신 바쁜 대기 (지터 감소)
+
+# 브로커에서 기록할 때 방향 구분 : 키트 수신 <mac>/et/smpl/cmnd/<topic>, 송신 <mac>/et/smpl/tele/<name>
+CMND = 'cmnd'
+
+
+#===========================================================================================
+def direction_of(topic):                                 # 토픽으로 방향 구분 (cmnd 단계가 있으면 DOWN)
+#===========================================================================================
+    return DOWN if CMND in topic.split('/') else UP
+
+
+#===========================================================================================
+class LogWriter:                                         # 이진 로그 기록
+#===========================================================================================
+    # 기록 하나 = 11바이트 머리말 + 페이로드, 토픽은 처음 나올 때 한 번만 저장하고 번호로 참조
+
+    def __init__(self, path, epoch=None):
+        self.file = open(path, 'wb')
+        self.file.write(FILE_HEADER.pack(MAGIC, VERSION, time.time() if epoch is None else epoch))
+        self.topics = {}                                 # 토픽 -> 번호
+        self.last_us = None
+        self.records = 0
+        self.bytes = FILE_HEADER.size
+
+    def _put(self, delta_us, kind, topic_id, data):
+        self.file.write(RECORD.pack(delta_us, kind, topic_id, len(data)))
+        self.file.write(data)
+        self.bytes += RECORD.size + len(data)
+
+    def write(self, t_us, direction, topic, payload):    # t_us : 기록 시작 기준 시각 (단조 증가)
+        t_us = int(t_us)
+        delta = 0 if self.last_us is None else max(0, t_us - self.last_us)
+        self.last_us = t_us
+        while delta > MAX_DELTA_US:
+            self._put(MAX_DELTA_US, GAP, 0, b'')
+            delta -= MAX_DELTA_US
+
+        topic_id = self.topics.get(topic)
+        if topic_id is None:
+            topic_id = self.topics[topic] = len(self.topics)
+            self._put(0, TOPIC, topic_id, topic.encode())
+
+        if isinstance(payload, str):
+            payload = payload.encode()
+        self._put(delta, direction, topic_id, bytes(payload))
+        self.records += 1
+
+    def close(self):
+        self.file.close()
+
+
+#===========================================================================================
+def read_log(path):                                      # (기록 시작 epoch, [(t_us, 방향, 토픽, 페이로드)])
+#===========================================================================================
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version, epoch = FILE_HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('SF2T 로그가 아님: %s' % path)
+
+    topics = []
+    records = []
+    t_us = 0
+    offset = FILE_HEADER.size
+    end = len(data)
+    while offset + RECORD.size <= end:
+        delta, kind, topic_id, length = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        if offset + length > end:                        # 기록 중 끊긴 마지막 기록
+            break
+        body = data[offset:offset + length]
+        offset += length
+        t_us += delta
+        if kind == TOPIC:
+            topics.append(body.decode())
+        elif kind != GAP:
+            records.append((t_us, kind, topics[topic_id], body))
+    return epoch, records
+
+
+#===========================================================================================
+class Recorder:                                          # 브로커 구독 콜백 -> 로그 기록
+#===========================================================================================
+    def __init__(self, writer, clock=time.perf_counter):
+        self.writer = writer
+        self.clock = clock
+        self.started = clock()
+
+    def __call__(self, topic, payload):                  # LocalBroker.subscribe 콜백으로 사용
+        self.writer.write((self.clock() - self.started) * 1e6, direction_of(topic), topic, payload)
+
+    async def run(self, source):                         # source : (topic, payload) 비동기 목록
+        async for topic, payload in source:
+            self(topic, payload)
+
+
+#===========================================================================================
+async def replay(records, publish, speed=1.0, directions=(UP,), spin_s=SPIN_S):
+#===========================================================================================
+    # records 를 기록된 상대 시각의 1/speed 로 publish(topic, payload) (코루틴이어도 됨)
+    # 매 기록의 목표 시각은 재생 시작 기준으로 계산하므로 지연이 누적되지 않음
+    clock = time.perf_counter
+    late = []                                            # 기록별 늦은 시간 (초)
+    records = [r for r in records if r[1] in directions]
+    if not records:
+        return summarize(late, 0, 0.0)
+
+    t0 = records[0][0]
+    started = clock()
+    for t_us, _, topic, payload in records:
+        target = started + (t_us - t0) / 1e6 / speed
+        remain = target - clock()
+        if remain > spin_s:
+            await asyncio.sleep(remain - spin_s)
+        while clock() < target:                          # 남은 짧은 시간은 바쁜 대기
+            pass
+        late.append(clock() - target)
+        result = publish(topic, payload)
+        if asyncio.iscoroutine(result):
+            await result
+    return summarize(late, len(records), clock() - started)
+
+
+#===========================================================================================
+def summarize(late, count, elapsed):                     # 재생 결과 (지터 ms)
+#===========================================================================================
+    v = sorted(late)
+    pick = lambda p: round(v[min(len(v) - 1, int(p * len(v)))] * 1000, 3) if v else 0
+    return {
+        'messages': count,
+        'seconds': round(elapsed, 3),
+        'late_ms_p50': pick(0.50),
+        'late_ms_p99': pick(0.99),
+        'late_ms_max': pick(1.0),
+    }
@@ -0,0 +1,117 @@
+# ******************************************************************************************
+# FileName     : sf2replay.py
+# Description  : 키트 송수신 기록과 배속 재생 (디지털 트윈, 대시보드 부하 시험, 문제 재현)
+#                python -m sf2sim standard --drums 300 --record run.sf2t     (시뮬레이터 기록)
+#                python sf2replay.py record --host 192.168.0.10 -o run.sf2t  (실제 라인 기록)
+#                python sf2replay.py replay run.sf2t --host 192.168.0.10 --speed 10
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import argparse
+import asyncio
+import json
+
+from sf2gw import mqtt_source
+from sf2gw.gateway import aiomqtt
+from sf2gw.tlog import DOWN, UP, LogWriter, Recorder, read_log, replay
+
+
+#===========================================================================================
+async def record(args):                                  # 브로커 구독 -> 로그 (Ctrl+C 로 종료)
+#===========================================================================================
+    writer = LogWriter(args.output)
+    try:
+        await Recorder(writer).run(mqtt_source(args.host, args.port, args.pattern,
+                                               args.username, args.password))
+    finally:
+        writer.close()
+        print(json.dumps({'records': writer.records, 'bytes': writer.bytes,
+                          'topics': len(writer.topics)}))
+
+
+#===========================================================================================
+async def play(args):                                    # 로그 -> 브로커 (또는 LocalBroker)
+#===========================================================================================
+    _, records = read_log(args.log)
+    directions = (UP, DOWN) if args.with_commands else (UP,)
+
+    if args.host is None:                                # 브로커 없이 재생 시각 정확도만 측정
+        from sf2sim import LocalBroker
+        broker = LocalBroker()
+        return await replay(records, broker.publish, args.speed, directions)
+
+    if aiomqtt is None:
+        raise SystemExit('aiomqtt 가 설치되어 있지 않음 (pip install aiomqtt)')
+    async with aiomqtt.Client(args.host, args.port, username=args.username,
+                              password=args.password) as client:
+        prefix = args.prefix
+        publish = lambda topic, payload: client.publish(prefix + topic, payload)
+        return await replay(records, publish, args.speed, directions)
+
+
+#===========================================================================================
+def info(args):                                          # 로그 요약
+#===========================================================================================
+    epoch, records = read_log(args.log)
+    topics = {}
+    for _, direction, topic, payload in records:
+        topics[topic] = topics.get(topic, 0) + 1
+    return {
+        'epoch': epoch,
+        'records': len(records),
+        'up': sum(1 for r in records if r[1] == UP),
+        'down': sum(1 for r in records if r[1] == DOWN),
+        'duration_s': round((records[-1][0] - records[0][0]) / 1e6, 3) if records else 0,
+        'payload_bytes': sum(len(r[3]) for r in records),
+        'topics': topics,
+    }
+
+
+#===========================================================================================
+def main(argv=None):
+#===========================================================================================
+    parser = argparse.ArgumentParser(description='스마트 팩토리2 송수신 기록과 재생')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def broker_options(p, required):
+        p.add_argument('--host', required=required, help='MQTT 브로커 주소')
+        p.add_argument('--port', type=int, default=1883)
+        p.add_argument('--username')
+        p.add_argument('--password')
+
+    p = sub.add_parser('record', help='브로커의 메시지를 기록')
+    broker_options(p, True)
+    p.add_argument('--pattern', default='#', help='구독 토픽')
+    p.add_argument('-o', '--output', required=True)
+
+    p = sub.add_parser('replay', help='기록을 배속 재생 (--host 가 없으면 LocalBroker 로 시각 정확도만 측정)')
+    broker_options(p, False)
+    p.add_argument('log')
+    p.add_argument('--speed', type=float, default=1.0, help='재생 배속 (1 ~ 100)')
+    p.add_argument('--prefix', default='', help='재생 토픽 앞에 붙일 문자열 (예: replay/)')
+    p.add_argument('--with-commands', action='store_true', help='수신 명령(pos, block ...)도 재생')
+
+    p = sub.add_parser('info', help='기록 요약')
+    p.add_argument('log')
+
+    args = parser.parse_args(argv)
+    if args.command == 'info':
+        result = info(args)
+    elif args.command == 'record':
+        try:
+            asyncio.run(record(args))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    else:
+        if not 1 <= args.speed <= 100:
+            parser.error('--speed 는 1 ~ 100')
+        result = asyncio.run(play(args))
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
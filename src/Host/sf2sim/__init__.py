@@ -0,0 +1,12 @@
+# ******************************************************************************************
+# FileName     : __init__.py
+# Description  : 스마트 팩토리2 펌웨어 PC 시뮬레이터
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+from .broker import LocalBroker, topic_matches
+from .clock import VirtualClock
+from .conveyor import Conveyor
+from .simulation import Simulation, VARIANTS, FIRMWARE_DIR
@@ -0,0 +1,59 @@
+# ******************************************************************************************
+# FileName     : __main__.py
+# Description  : 시나리오 실행 : python -m sf2sim standard --drums 1000 --interval-ms 3000
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import argparse
+import json
+import time
+
+from . import Conveyor, Simulation, VARIANTS
+
+
+#===========================================================================================
+def main(argv=None):
+#===========================================================================================
+    parser = argparse.ArgumentParser(prog='sf2sim', description='스마트 팩토리2 펌웨어 시뮬레이션')
+    parser.add_argument('firmware', nargs='?', default='standard',
+                        help='변형 이름 (%s) 또는 파일 이름' % ', '.join(VARIANTS))
+    parser.add_argument('--drums', type=int, default=100, help='드럼통 수')
+    parser.add_argument('--interval-ms', type=int, default=3000, help='드럼통 도착 간격')
+    parser.add_argument('--free-flow', action='store_true', help='차단대와 무관하게 지나가는 모델')
+    parser.add_argument('--dwell-ms', type=int, default=400, help='(--free-flow) 센서 앞 통과 시간')
+    parser.add_argument('--jitter-ms', type=int, default=0)
+    parser.add_argument('--noise-cm', type=float, default=0.0)
+    parser.add_argument('--dropout', type=float, default=0.0, help='에코 없음 확률')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--connect-ms', type=int, default=0, help='setup() 네트워크 연결 시간')
+    parser.add_argument('--record', metavar='PATH', help='송수신 메시지를 이진 로그로 기록 (sf2replay.py 로 재생)')
+    args = parser.parse_args(argv)
+
+    conveyor = Conveyor(gated=not args.free_flow, dwell_ms=args.dwell_ms, noise_cm=args.noise_cm,
+                        dropout=args.dropout, seed=args.seed)
+    conveyor.add_drums(args.drums, args.interval_ms, jitter_ms=args.jitter_ms)
+
+    writer = None
+    if args.record:
+        from sf2gw.tlog import LogWriter
+        writer = LogWriter(args.record)
+
+    started = time.perf_counter()
+    sim = Simulation(args.firmware, conveyor, connect_ms=args.connect_ms,
+                     recorder=writer.write if writer else None)
+    sim.setup()
+    sim.run_conveyor()
+    if writer:
+        writer.close()
+
+    result = sim.summary()
+    result['wall_s'] = round(time.perf_counter() - started, 3)
+    result['missed'] = result['drums'] - result['count']
+    print(json.dumps(result, indent=2))
+    return 0 if result['missed'] == 0 else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+# ******************************************************************************************
+# FileName     : aio.py
+# Description  : uasyncio 대체 (가상 시계 위의 협력형 스케줄러)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import heapq
+import types
+
+
+#===========================================================================================
+class _Sleep:                                            # await sleep_ms(ms) : 깨어날 때까지 양보
+#===========================================================================================
+    def __init__(self, us):
+        self.us = int(us)
+
+    def __await__(self):
+        yield self.us
+
+
+#===========================================================================================
+class Task:                                              # 스케줄러가 실행하는 코루틴
+#===========================================================================================
+    def __init__(self, coro):
+        self.coro = coro
+        self.done = False
+
+    def cancel(self):
+        if not self.done:
+            self.done = True
+            self.coro.close()
+
+
+#===========================================================================================
+class Loop:                                              # 가상 시간 이벤트 루프
+#===========================================================================================
+    # 태스크가 sleep_ms 로 양보하면 깨어날 시각에 다시 실행, 그 사이 시간은 clock.advance 로 진행
+    # asyncio.run() 은 태스크만 등록하고 바로 돌아오며, 실행은 Simulation 이 run_until 로 진행
+    # 태스크에서 난 예외는 그대로 run_until 밖으로 나감 (실행 모드가 죽는 오류를 시험에서 확인)
+
+    def __init__(self, clock, step_us=200):
+        self.clock = clock
+        self.step_us = step_us                           # 태스크가 한 번 실행될 때의 연산 시간 (가상)
+        self.ready = []                                  # (깨어날 시각 us, 순번, Task)
+        self.seq = 0
+        self.steps = 0
+
+    def _push(self, at_us, task):
+        heapq.heappush(self.ready, (at_us, self.seq, task))
+        self.seq += 1
+
+    def create_task(self, coro):
+        task = Task(coro)
+        self._push(self.clock.now_us, task)
+        return task
+
+    def run_until(self, end_us):                         # end_us 까지 깨어날 태스크를 차례로 실행
+        clock = self.clock
+        while self.ready and self.ready[0][0] <= end_us:
+            at, _, task = heapq.heappop(self.ready)
+            if at > clock.now_us:
+                clock.advance(at - clock.now_us)
+            if task.done:
+                continue
+            try:
+                us = task.coro.send(None)
+            except StopIteration:
+                task.done = True
+                continue
+            self._push(clock.now_us + max(0, us), task)
+            self.steps += 1
+            clock.advance(self.step_us)
+        if end_us > clock.now_us:
+            clock.advance(end_us - clock.now_us)
+
+    def module(self):                                    # 펌웨어에 넣을 uasyncio 모듈
+        mod = types.ModuleType('uasyncio')
+        mod.sleep_ms = lambda ms: _Sleep(ms * 1000)
+        mod.sleep = lambda s: _Sleep(s * 1000000)
+        mod.create_task = self.create_task
+        mod.run = self.create_task
+        mod.get_event_loop = lambda: self
+        mod.CancelledError = GeneratorExit
+        return mod
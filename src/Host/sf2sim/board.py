@@ -0,0 +1,274 @@
+# ******************************************************************************************
+# FileName     : board.py
+# Description  : ET-Board 대체 (machine, pin_define, Servo, OLED)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : machine.Timer 추가 (가상 시계 사건)
+# ******************************************************************************************
+import types
+
+
+# ETboard.lib.pin_define 핀 번호 (ESP32 GPIO)
+PIN_NUMBERS = {
+    'D2': 2, 'D3': 4, 'D4': 5, 'D5': 18, 'D6': 19, 'D7': 23, 'D8': 16, 'D9': 17,
+    'A0': 36, 'A1': 39, 'A2': 34, 'A3': 35, 'A4': 32, 'A5': 33,
+}
+
+ECHO_PIN = PIN_NUMBERS['D8']
+BUTTON_PIN = PIN_NUMBERS['D7']
+BLOCK_SERVO_PIN = PIN_NUMBERS['D4']                      # 차단대 서보
+GEER_SERVO_PIN = PIN_NUMBERS['D5']                       # 톱니바퀴 서보
+BLOCK_OPEN_ANGLE = 45                                    # 이 각도 이상이면 차단대 열림으로 봄
+
+
+#===========================================================================================
+class Board:                                             # 가상 보드 : 핀 상태와 장치 기록
+#===========================================================================================
+    def __init__(self, clock, conveyor):
+        self.clock = clock
+        self.conveyor = conveyor
+
+        self.levels = {BUTTON_PIN: 1}                    # 핀 번호 -> 입력 레벨 (버튼은 풀업)
+        self.irqs = {}                                   # 핀 번호 -> (trigger, handler, Pin)
+        self.adc_sources = {}                            # 핀 번호 -> 함수(t_ms) -> 0..4095
+
+        self.servo_log = {}                              # 핀 번호 -> [(t_ms, angle)]
+        self.servo_listeners = []                        # 함수(pin, angle) : 서보 동작 알림
+        self.oled = None
+        self.ping_count = 0
+        self.no_echo_count = 0
+
+        self.machine = self._machine_module()
+
+    # --------------------------------------------------------------------------------------
+    # 입력 조작
+    # --------------------------------------------------------------------------------------
+    def set_level(self, pin, level):                     # 입력 핀 레벨 변경 (인터럽트 발생)
+        old = self.levels.get(pin, 0)
+        self.levels[pin] = level
+        if old == level or pin not in self.irqs:
+            return
+        trigger, handler, obj = self.irqs[pin]
+        edge = Pin.IRQ_RISING if level else Pin.IRQ_FALLING
+        if trigger & edge:
+            handler(obj)
+
+    def press_button(self, at_ms, hold_ms=150, bounce=0):   # D7 버튼 누름 예약
+        at_us = at_ms * 1000
+        for i in range(bounce):                          # 접점 떨림
+            self.clock.schedule(at_us + i * 400, lambda: self.set_level(BUTTON_PIN, 0))
+            self.clock.schedule(at_us + i * 400 + 200, lambda: self.set_level(BUTTON_PIN, 1))
+        at_us += bounce * 400
+        self.clock.schedule(at_us, lambda: self.set_level(BUTTON_PIN, 0))
+        self.clock.schedule(at_us + hold_ms * 1000, lambda: self.set_level(BUTTON_PIN, 1))
+
+    def set_adc(self, name, source):                     # ADC 입력 설정 : 값 또는 함수(t_ms)
+        pin = PIN_NUMBERS[name]
+        self.adc_sources[pin] = source if callable(source) else (lambda t, v=source: v)
+
+    # --------------------------------------------------------------------------------------
+    # 가상 장치 동작
+    # --------------------------------------------------------------------------------------
+    def time_pulse_us(self, pin, level, timeout_us=1000000):
+        self.ping_count += 1
+        d = self.conveyor.distance_cm(self.clock.now_us / 1000)
+        if d is not None:
+            duration = int(d * 1000 / 17)
+            if duration <= timeout_us:
+                self.clock.advance(duration)
+                return duration
+        self.no_echo_count += 1
+        self.clock.advance(timeout_us)
+        return -1
+
+    def read_adc(self, pin):
+        source = self.adc_sources.get(pin)
+        if source is None:
+            return 2048
+        return int(source(self.clock.now_us / 1000))
+
+    def write_servo(self, pin, angle):
+        t_ms = self.clock.now_us / 1000
+        self.servo_log.setdefault(pin, []).append((t_ms, angle))
+        if pin == BLOCK_SERVO_PIN:
+            self.conveyor.on_gate(t_ms, angle >= BLOCK_OPEN_ANGLE)
+        for listener in self.servo_listeners:
+            listener(pin, angle)
+
+    def _machine_module(self):
+        board = self
+        mod = types.ModuleType('machine')
+
+        class _Pin(Pin):
+            _board = board
+
+        class _ADC(ADC):
+            _board = board
+
+        class _Timer(Timer):
+            _clock = board.clock
+
+        mod.Pin = _Pin
+        mod.ADC = _ADC
+        mod.Timer = _Timer
+        mod.time_pulse_us = self.time_pulse_us
+        mod.disable_irq = lambda: 0
+        mod.enable_irq = lambda state: None
+        mod.freq = lambda *args: 240000000
+        mod.reset = lambda: None
+        mod.unique_id = lambda: b'\x24\x6f\x28\x00\x00\x01'
+        return mod
+
+    def pin_define_module(self):                         # ETboard.lib.pin_define 대체
+        mod = types.ModuleType('ETboard.lib.pin_define')
+        for name, number in PIN_NUMBERS.items():
+            setattr(mod, name, number)
+        mod.LOW = 0
+        mod.HIGH = 1
+        mod.Pin = self.machine.Pin
+        return mod
+
+    def servo_module(self):                              # ETboard.lib.servo 대체
+        board = self
+        mod = types.ModuleType('ETboard.lib.servo')
+
+        class Servo:
+            def __init__(self, pin):
+                self.pin = pin
+                self.angle = None
+
+            def write_angle(self, angle):
+                self.angle = angle
+                board.write_servo(self.pin.id, angle)
+
+        mod.Servo = Servo
+        return mod
+
+    def oled_module(self):                               # ETboard.lib.OLED_U8G2 대체
+        board = self
+        mod = types.ModuleType('ETboard.lib.OLED_U8G2')
+
+        class oled_u8g2:
+            def __init__(self):
+                self.lines = {}
+                self.frames = []                         # (t_ms, 표시된 줄)
+                self.set_count = 0
+                self.clear_count = 0
+                board.oled = self
+
+            def clear(self):
+                self.lines = {}
+                self.clear_count += 1
+
+            def setLine(self, line, text):
+                self.lines[line] = text
+                self.set_count += 1
+
+            def display(self):
+                self.frames.append((board.clock.now_us / 1000, dict(self.lines)))
+
+        mod.oled_u8g2 = oled_u8g2
+        mod.__all__ = ['oled_u8g2']
+        return mod
+
+
+#===========================================================================================
+class Pin:                                               # machine.Pin 대체
+#===========================================================================================
+    IN = 1
+    OUT = 3
+    OPEN_DRAIN = 7
+    PULL_UP = 2
+    PULL_DOWN = 1
+    IRQ_FALLING = 2
+    IRQ_RISING = 1
+
+    _board = None
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self.mode = mode
+        if value is not None:
+            self._board.levels[id] = value
+
+    def init(self, mode=-1, pull=-1, value=None):
+        self.mode = mode
+        if value is not None:
+            self._board.levels[self.id] = value
+
+    def value(self, level=None):
+        if level is None:
+            return self._board.levels.get(self.id, 0)
+        if self.mode != self.IN:                         # 입력 핀에 쓰는 값은 무시
+            self._board.levels[self.id] = 1 if level else 0
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING):
+        self._board.irqs[self.id] = (trigger, handler, self)
+
+
+#===========================================================================================
+class ADC:                                               # machine.ADC 대체 (12비트)
+#===========================================================================================
+    ATTN_0DB = 0
+    ATTN_2_5DB = 1
+    ATTN_6DB = 2
+    ATTN_11DB = 3
+    WIDTH_12BIT = 3
+
+    _board = None
+
+    def __init__(self, pin):
+        self.pin = pin
+        self.id = pin.id
+
+    def atten(self, attn):
+        self.attn = attn
+
+    def width(self, width):
+        self.bits = width
+
+    def read(self):
+        return self._board.read_adc(self.id)
+
+    def read_u16(self):
+        return self.read() << 4
+
+
+#===========================================================================================
+class Timer:                                             # machine.Timer 대체 (가상 시계 사건으로 실행)
+#===========================================================================================
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    _clock = None
+
+    def __init__(self, id, **kwargs):
+        self.id = id
+        self.generation = 0                              # init/deinit 마다 증가 : 이전 예약 무효
+        if kwargs:
+            self.init(**kwargs)
+
+    def init(self, mode=PERIODIC, period=-1, callback=None, freq=-1):
+        if freq > 0:
+            period = 1000 // freq
+        self.generation += 1
+        generation = self.generation
+        clock = self._clock
+
+        def fire():
+            if generation != self.generation:           # 해제 또는 다시 설정됨
+                return
+            if mode == self.PERIODIC:
+                clock.schedule(clock.now_us + period * 1000, fire)
+            callback(self)
+        clock.schedule(clock.now_us + period * 1000, fire)
+
+    def deinit(self):
+        self.generation += 1
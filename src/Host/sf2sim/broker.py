@@ -0,0 +1,63 @@
+# ******************************************************************************************
+# FileName     : broker.py
+# Description  : 프로세스 내부 MQTT 브로커 대체
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+
+
+#===========================================================================================
+def topic_matches(pattern, topic):                       # MQTT 와일드카드 (+, #) 비교
+#===========================================================================================
+    p = pattern.split('/')
+    t = topic.split('/')
+    for i, part in enumerate(p):
+        if part == '#':
+            return True
+        if i >= len(t) or (part != '+' and part != t[i]):
+            return False
+    return len(p) == len(t)
+
+
+#===========================================================================================
+class LocalBroker:                                       # 메시지 기록과 구독자 전달
+#===========================================================================================
+    def __init__(self, clock=None):
+        self.clock = clock
+        self.subscribers = []                            # (pattern, callback(topic, payload))
+        self.messages = []                               # (t_ms, topic, payload) 전체 기록
+        self.publish_count = 0
+        self.byte_count = 0
+
+    def now_ms(self):
+        return self.clock.now_us / 1000 if self.clock else 0
+
+    def subscribe(self, pattern, callback):
+        self.subscribers.append((pattern, callback))
+
+    def unsubscribe(self, callback):
+        self.subscribers = [s for s in self.subscribers if s[1] is not callback]
+
+    def publish(self, topic, payload):
+        if isinstance(payload, str):
+            payload = payload.encode()
+        elif not isinstance(payload, (bytes, bytearray)):
+            payload = str(payload).encode()
+        payload = bytes(payload)
+
+        self.messages.append((self.now_ms(), topic, payload))
+        self.publish_count += 1
+        self.byte_count += len(topic) + len(payload)
+        for pattern, callback in list(self.subscribers):
+            if topic_matches(pattern, topic):
+                callback(topic, payload)
+
+    def published(self, topic_pattern='#'):              # 조건에 맞는 기록 (t_ms, topic, payload)
+        return [m for m in self.messages if topic_matches(topic_pattern, m[1])]
+
+    def reset_stats(self):
+        self.messages = []
+        self.publish_count = 0
+        self.byte_count = 0
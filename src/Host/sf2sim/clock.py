@@ -0,0 +1,87 @@
+# ******************************************************************************************
+# FileName     : clock.py
+# Description  : 가상 시계와 MicroPython time 모듈 대체
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import heapq
+import types
+
+
+TICKS_PERIOD = 1 << 30                                   # MicroPython ticks 순환 주기
+TICKS_HALF = TICKS_PERIOD // 2
+
+
+#===========================================================================================
+class VirtualClock:                                      # 가상 시계 (대기 시간이 즉시 지나감)
+#===========================================================================================
+    def __init__(self, epoch=0):
+        self.now_us = 0
+        self.epoch = epoch                               # time.time() 기준 초
+        self.events = []                                 # (시각 us, 순번, 함수)
+        self.seq = 0
+        self.slept_us = 0                                # 대기로 흘려보낸 시간 합계
+
+    def schedule(self, at_us, fn):                       # 지정 시각에 fn() 실행 (핀 변화 등)
+        heapq.heappush(self.events, (int(at_us), self.seq, fn))
+        self.seq += 1
+
+    def advance(self, us):                               # 시간을 진행하며 예약된 사건 실행
+        target = self.now_us + int(us)
+        while self.events and self.events[0][0] <= target:
+            at, _, fn = heapq.heappop(self.events)
+            if at > self.now_us:
+                self.now_us = at
+            fn()
+        self.now_us = target
+
+    def sleep_us(self, us):
+        if us > 0:
+            self.slept_us += int(us)
+            self.advance(us)
+
+    def ticks_us(self):
+        return self.now_us % TICKS_PERIOD
+
+    def ticks_ms(self):
+        return (self.now_us // 1000) % TICKS_PERIOD
+
+    def time(self):                                      # MicroPython처럼 초 단위 정수
+        return self.epoch + self.now_us // 1000000
+
+    def module(self):                                    # 펌웨어에 넣을 time 모듈
+        mod = types.ModuleType('time')
+        mod.sleep = lambda s: self.sleep_us(s * 1000000)
+        mod.sleep_ms = lambda ms: self.sleep_us(ms * 1000)
+        mod.sleep_us = self.sleep_us
+        mod.ticks_ms = self.ticks_ms
+        mod.ticks_us = self.ticks_us
+        mod.ticks_cpu = self.ticks_us
+        mod.ticks_diff = ticks_diff
+        mod.ticks_add = ticks_add
+        mod.time = self.time
+        mod.time_ns = lambda: self.now_us * 1000
+        mod.localtime = lambda secs=None: _localtime(self.time() if secs is None else secs)
+        return mod
+
+
+#===========================================================================================
+def ticks_diff(a, b):                                    # MicroPython time.ticks_diff 와 동일
+#===========================================================================================
+    return ((a - b + TICKS_HALF) % TICKS_PERIOD) - TICKS_HALF
+
+
+#===========================================================================================
+def ticks_add(ticks, delta):
+#===========================================================================================
+    return (ticks + delta) % TICKS_PERIOD
+
+
+#===========================================================================================
+def _localtime(secs):
+#===========================================================================================
+    import time as _time
+    t = _time.gmtime(secs)
+    return (t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec, t.tm_wday, t.tm_yday)
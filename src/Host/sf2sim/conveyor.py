@@ -0,0 +1,113 @@
+# ******************************************************************************************
+# FileName     : conveyor.py
+# Description  : 컨베이어 모델 (드럼통 도착, 차단대 앞 대기, 통과)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import bisect
+import random
+
+
+#===========================================================================================
+class Conveyor:                                          # 초음파 센서 앞을 지나가는 드럼통
+#===========================================================================================
+    # gated=True  : 드럼통은 차단대 앞(센서 앞)에서 멈추고, 차단대가 열리면 exit_ms 후에 빠져나감
+    #               뒤따르는 드럼통은 앞 드럼통이 빠져나간 뒤 gap_ms 후에 센서 앞에 도착
+    # gated=False : 드럼통은 dwell_ms 동안 센서 앞을 지나감 (차단대와 무관)
+    def __init__(self, lane_cm=20.0, drum_cm=5.0, gated=True, exit_ms=300, gap_ms=300,
+                 dwell_ms=400, noise_cm=0.0, dropout=0.0, seed=0):
+        self.lane_cm = lane_cm                           # 비어 있을 때 거리
+        self.drum_cm = drum_cm                           # 드럼통이 있을 때 거리
+        self.gated = gated
+        self.exit_ms = exit_ms                           # 차단대가 열린 뒤 빠져나가는 시간
+        self.gap_ms = gap_ms                             # 대기 중인 드럼통 사이 간격
+        self.dwell_ms = dwell_ms                         # (gated=False) 센서 앞 통과 시간
+        self.noise_cm = noise_cm                         # 측정 잡음 (표준편차)
+        self.dropout = dropout                           # 에코가 돌아오지 않을 확률
+        self.random = random.Random(seed)
+
+        self.arrivals = []                               # 드럼통이 라인에 도착한 시각 (ms, 정렬)
+        self.starts = []                                 # 센서 앞에 도착한 시각
+        self.exits = []                                  # 센서 앞을 빠져나간 시각
+        self.gate_intervals = []                         # 차단대 열림 구간 [열림, 닫힘(None)]
+        self.head = 0                                    # 센서 앞(또는 다음) 드럼통 번호
+
+    # --------------------------------------------------------------------------------------
+    # 시나리오
+    # --------------------------------------------------------------------------------------
+    def add_drum(self, at_ms):                           # 드럼통 하나 추가
+        bisect.insort(self.arrivals, at_ms)
+
+    def add_drums(self, n, interval_ms, start_ms=1000, jitter_ms=0):
+        t = start_ms
+        for _ in range(n):
+            offset = self.random.uniform(-jitter_ms, jitter_ms) if jitter_ms else 0
+            self.add_drum(t + offset)
+            t += interval_ms
+        return t
+
+    def on_gate(self, t_ms, is_open):                    # 차단대 동작 (서보 알림)
+        if is_open:
+            if not self.gate_intervals or self.gate_intervals[-1][1] is not None:
+                self.gate_intervals.append([t_ms, None])
+        elif self.gate_intervals and self.gate_intervals[-1][1] is None:
+            self.gate_intervals[-1][1] = t_ms
+
+    # --------------------------------------------------------------------------------------
+    # 상태 계산 (시간은 앞으로만 진행)
+    # --------------------------------------------------------------------------------------
+    def _exit_time(self, start):                         # 센서 앞 도착 시각 -> 빠져나가는 시각
+        if not self.gated:
+            return start + self.dwell_ms
+        for opened, closed in self.gate_intervals:
+            if closed is not None and closed <= start:
+                continue
+            return max(opened, start) + self.exit_ms
+        return None                                      # 아직 차단대가 열리지 않음
+
+    def _advance(self, t_ms):
+        while self.head < len(self.arrivals):
+            i = self.head
+            if len(self.starts) <= i:
+                start = self.arrivals[i]
+                if i > 0:
+                    start = max(start, self.exits[i - 1] + self.gap_ms)
+                self.starts.append(start)
+            if len(self.exits) <= i:
+                if self.starts[i] > t_ms:                # 아직 도착 전 : 차단대가 그 사이 닫힐 수 있음
+                    return
+                exit_ms = self._exit_time(self.starts[i])
+                if exit_ms is None:
+                    return
+                self.exits.append(exit_ms)
+            if self.exits[i] > t_ms:
+                return
+            self.head += 1
+
+    def drum_at(self, t_ms):                             # t 시각에 센서 앞에 있는 드럼통 번호
+        self._advance(t_ms)
+        i = self.head
+        if i < len(self.starts) and self.starts[i] <= t_ms:
+            return i
+        return None
+
+    def distance_cm(self, t_ms):                         # t 시각의 측정 거리 (None : 에코 없음)
+        if self.dropout and self.random.random() < self.dropout:
+            return None
+        d = self.drum_cm if self.drum_at(t_ms) is not None else self.lane_cm
+        if self.noise_cm:
+            d += self.random.gauss(0, self.noise_cm)
+        return max(d, 0.5)
+
+    @property
+    def drum_count(self):
+        return len(self.arrivals)
+
+    @property
+    def passed_count(self):                              # 센서 앞을 완전히 지나간 드럼통 수
+        return self.head
+
+    def last_end_ms(self):                               # 마지막 드럼통 도착 시각 (예상 종료 기준)
+        return self.arrivals[-1] if self.arrivals else 0
@@ -0,0 +1,147 @@
+# ******************************************************************************************
+# FileName     : iot_app.py
+# Description  : ET_IoT_App 대체 (로컬 브로커 사용)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 실제 토픽 형식 (<mac>/et/smpl/tele/<name> {key: value}, <mac>/et/smpl/cmnd/<topic>)
+# ******************************************************************************************
+import json
+import types
+
+
+TELE = '/et/smpl/tele/'                                  # 키트 송신 : <mac>/et/smpl/tele/<name> (앱 인벤터 TeleTopic)
+CMND = '/et/smpl/cmnd/'                                  # 키트 수신 : <mac>/et/smpl/cmnd/<topic> (앱 인벤터 CmndTopic)
+SENSOR_DATA = 'sensor'                                   # send_sensor_data() 송신 이름 (<mac>/et/smpl/tele/sensor)
+
+SHORT_PERIOD_MS = 1000                                   # et_short_periodic_process 주기
+LONG_PERIOD_MS = 5000                                    # et_long_periodic_process 주기
+
+UP = 0                                                   # 송수신 기록 방향 (sf2gw.tlog 와 같은 값) : 송신
+DOWN = 1                                                 # 수신
+
+
+#===========================================================================================
+def tele_topic(kit, name):                               # 키트 송신 토픽
+#===========================================================================================
+    return kit + TELE + name
+
+
+#===========================================================================================
+def cmnd_topic(kit, topic):                              # 키트 수신(명령) 토픽
+#===========================================================================================
+    return kit + CMND + topic
+
+
+#===========================================================================================
+class _Client:                                           # umqtt MQTTClient 대체
+#===========================================================================================
+    def __init__(self, app):
+        self.app = app
+        self.connected = True
+
+    def publish(self, topic, msg, retain=False, qos=0):
+        if not self.connected:
+            raise OSError(113, 'ECONNABORTED')
+        if isinstance(topic, bytes):
+            topic = topic.decode()
+        self.app.record(UP, topic, msg)
+        self.app.broker.publish(topic, msg)
+
+    def check_msg(self):                                 # 받은 메시지를 콜백으로 전달
+        if not self.connected:
+            raise OSError(113, 'ECONNABORTED')
+        self.app.deliver()
+
+    def ping(self):
+        pass
+
+
+#===========================================================================================
+class ET_IoT_App:                                        # ET_IoT_App 대체
+#===========================================================================================
+    broker = None                                        # 시뮬레이션이 설정
+    kit = '246f28000001'                                 # MAC 주소 (토픽 앞부분, 보드의 unique_id)
+    connect_ms = 0                                       # setup() 의 네트워크 연결 시간 (가상)
+    recorder = None                                      # recorder(t_us, 방향, topic, payload) : 송수신 기록
+
+    def __init__(self):
+        self.mqtt = types.SimpleNamespace(client=_Client(self))
+        self.callbacks = {}                              # 수신 토픽 -> 콜백
+        self.inbox = []                                  # 대기 중인 (topic, msg)
+        self.sensor_data = {}
+        self.recv_count = 0
+        self.short_at = 0
+        self.long_at = 0
+        ET_IoT_App.instance = self
+
+    def send_data(self, name, key, value):               # <mac>/et/smpl/tele/<name> 에 {key: value}
+        self.mqtt.client.publish(tele_topic(self.kit, name), json.dumps({key: value}))
+
+    def add_sensor_data(self, name, value):
+        self.sensor_data[name] = value
+
+    def send_sensor_data(self):                          # 모은 센서 값 {sensorId: value}
+        self.mqtt.client.publish(tele_topic(self.kit, SENSOR_DATA), json.dumps(self.sensor_data))
+        self.sensor_data = {}
+
+    def setup_recv_message(self, topic, callback):       # topic : 명령 이름 (pos, block ...)
+        self.callbacks[topic] = callback
+        self.broker.subscribe(cmnd_topic(self.kit, topic), self._on_message)
+
+    def _on_message(self, topic, payload):               # 브로커 -> 수신 대기열 (콜백에는 명령 이름으로)
+        self.record(DOWN, topic, payload)
+        self.inbox.append((topic[len(self.kit) + len(CMND):], payload.decode()))
+
+    def record(self, direction, topic, payload):
+        if self.recorder is not None:
+            self.recorder(self.broker.clock.now_us, direction, topic, payload)
+
+    def deliver(self):
+        inbox = self.inbox
+        self.inbox = []
+        for topic, msg in inbox:
+            callback = self.callbacks.get(topic)
+            if callback:
+                self.recv_count += 1
+                callback(topic, msg)
+
+
+#===========================================================================================
+def setup(app, et_setup):                                # ET_IoT_App.setup 대체
+#===========================================================================================
+    if app.connect_ms:                                   # Wi-Fi, MQTT 연결 대기 흉내
+        app.broker.clock.advance(app.connect_ms * 1000)
+    et_setup()
+
+
+#===========================================================================================
+def loop(app, et_loop, et_short_periodic_process, et_long_periodic_process):
+#===========================================================================================
+    clock = app.broker.clock
+
+    try:
+        app.mqtt.client.check_msg()
+    except OSError:                                      # 연결 끊김 중에는 수신 생략
+        pass
+    et_loop()
+
+    now = clock.now_us // 1000
+    if now - app.short_at >= SHORT_PERIOD_MS:
+        app.short_at = now
+        et_short_periodic_process()
+    if now - app.long_at >= LONG_PERIOD_MS:
+        app.long_at = now
+        et_long_periodic_process()
+
+
+#===========================================================================================
+def module(broker, connect_ms=0, recorder=None, kit=None):   # ET_IoT_App 모듈 대체
+#===========================================================================================
+    mod = types.ModuleType('ET_IoT_App')
+    cls = type('ET_IoT_App', (ET_IoT_App,), {'broker': broker, 'connect_ms': connect_ms,
+                                             'recorder': recorder, 'kit': kit or ET_IoT_App.kit})
+    mod.ET_IoT_App = cls
+    mod.setup = setup
+    mod.loop = loop
+    return mod
@@ -0,0 +1,269 @@
+# ******************************************************************************************
+# FileName     : simulation.py
+# Description  : 펌웨어 스크립트를 PC에서 가상 시간으로 실행
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 키트 토픽(<mac>/et/smpl/...)으로 명령 전달, 송신 기록 조회(telemetry)
+# Modified     : 2026.10.18 : run_mode='async' 실행 (가상 시간 uasyncio 로 core.main() 을 그대로 실행)
+# ******************************************************************************************
+import binascii
+import gc as _gc
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import json
+import os
+import struct
+import sys
+import tempfile
+import types
+
+from .board import Board
+from .broker import LocalBroker
+from .clock import VirtualClock
+from .conveyor import Conveyor
+from . import aio, iot_app
+
+
+FIRMWARE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..', 'MicroPython'))
+
+VARIANTS = {                                             # 이름 -> 펌웨어 파일
+    'standard': 'Kit_smartFactory2_IoT.py',
+    'test': 'Kit_smartFactory2_IoT_test.py',
+    'aws': 'Kit_SmartFactory2_IoT_AWS.py',
+    'smartlabon': 'Kit_smartFactory2_SmartLabOn.py',
+}
+
+FIRMWARE_PACKAGES = ('smartfactory2',)                   # 가상 time/gc 로 불러올 펌웨어 패키지
+FILE_OPTIONS = ('count_journal', 'spill_path')           # 파일 경로인 profile 설정
+ASYNC_STEP_US = 1000                                     # async 모드 step() 한 번에 진행할 가상 시간
+
+
+#===========================================================================================
+def _gc_module():                                        # MicroPython gc 대체
+#===========================================================================================
+    mod = types.ModuleType('gc')
+    mod.collect = _gc.collect
+    mod.enable = _gc.enable
+    mod.disable = _gc.disable
+    mod.isenabled = _gc.isenabled
+    mod.mem_free = lambda: 110000
+    mod.mem_alloc = lambda: 20000
+    mod.threshold = lambda *args: -1
+    return mod
+
+
+#===========================================================================================
+def _micropython_module():                               # micropython 모듈 대체
+#===========================================================================================
+    mod = types.ModuleType('micropython')
+    mod.const = lambda x: x
+    mod.native = lambda f: f
+    mod.viper = lambda f: f
+    mod.alloc_emergency_exception_buf = lambda size: None
+    mod.schedule = lambda fn, arg: fn(arg)
+    mod.mem_info = lambda *args: None
+    return mod
+
+
+#===========================================================================================
+class _FirmwareLoader(importlib.machinery.SourceFileLoader):
+#===========================================================================================
+    # 펌웨어 모듈을 실행하는 동안만 time, gc, uasyncio 를 가상 모듈로 바꿈
+    overrides = {}
+
+    def exec_module(self, module):
+        saved = {name: sys.modules.get(name) for name in self.overrides}
+        sys.modules.update(self.overrides)
+        try:
+            super().exec_module(module)
+        finally:
+            for name, mod in saved.items():
+                if mod is None:
+                    sys.modules.pop(name, None)
+                else:
+                    sys.modules[name] = mod
+
+
+#===========================================================================================
+class _FirmwareFinder(importlib.abc.MetaPathFinder):     # 펌웨어 패키지를 _FirmwareLoader 로 로드
+#===========================================================================================
+    def __init__(self, path):
+        self.path = path
+
+    def find_spec(self, name, path=None, target=None):
+        if name.split('.')[0] not in FIRMWARE_PACKAGES:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(name, path or [self.path])
+        if spec and spec.origin and spec.origin.endswith('.py'):
+            spec.loader = _FirmwareLoader(name, spec.origin)
+        return spec
+
+
+#===========================================================================================
+class Simulation:                                        # 가상 보드 위에서 펌웨어 실행
+#===========================================================================================
+    # 모듈 전역 상태를 쓰므로 한 프로세스에서 한 번에 하나의 시뮬레이션만 사용
+
+    def __init__(self, firmware='standard', conveyor=None, firmware_dir=None,
+                 loop_overhead_us=200, epoch=0, connect_ms=0, fs_dir=None, recorder=None, options=None):
+        self.firmware_dir = firmware_dir or FIRMWARE_DIR
+        self.path = os.path.join(self.firmware_dir, VARIANTS.get(firmware, firmware))
+
+        self.clock = VirtualClock(epoch)
+        self.conveyor = conveyor or Conveyor()
+        self.board = Board(self.clock, self.conveyor)
+        self.broker = LocalBroker(self.clock)
+        self.loop_overhead_us = loop_overhead_us         # 루프 한 번의 연산 시간 (가상)
+        self.connect_ms = connect_ms                     # setup() 의 네트워크 연결 시간 (가상)
+        self.fs_dir = fs_dir or tempfile.mkdtemp(prefix='sf2sim-')   # 보드 파일 시스템 (같은 폴더로 재부팅 흉내)
+        self.recorder = recorder                         # recorder(t_us, 방향, topic, payload) : 키트 송수신 기록
+        self.options = options or {}                     # setup() 때 덮어쓸 profile 설정 (예: {'publish_format': 'topic'})
+        self.kit = binascii.hexlify(self.board.machine.unique_id()).decode()   # 토픽 앞부분 (MAC 주소)
+
+        self.aio = aio.Loop(self.clock, loop_overhead_us)   # run_mode='async' 의 uasyncio
+        self.async_mode = False
+        self.loop_count = 0
+        self.loop_hooks = []                             # 함수(sim) : 루프마다 호출
+
+        self._install()
+        self.fw = self._load()
+
+    # --------------------------------------------------------------------------------------
+    # 모듈 설치
+    # --------------------------------------------------------------------------------------
+    def _install(self):
+        for name in list(sys.modules):                   # 이전 시뮬레이션의 펌웨어 모듈 제거
+            if name.split('.')[0] in FIRMWARE_PACKAGES:
+                del sys.modules[name]
+
+        etboard = types.ModuleType('ETboard')
+        etboard.__path__ = []
+        etboard_lib = types.ModuleType('ETboard.lib')
+        etboard_lib.__path__ = []
+
+        modules = {
+            'machine': self.board.machine,
+            'ETboard': etboard,
+            'ETboard.lib': etboard_lib,
+            'ETboard.lib.pin_define': self.board.pin_define_module(),
+            'ETboard.lib.servo': self.board.servo_module(),
+            'ETboard.lib.OLED_U8G2': self.board.oled_module(),
+            'ET_IoT_App': iot_app.module(self.broker, self.connect_ms, self.recorder, self.kit),
+            'micropython': _micropython_module(),
+            'ujson': json,
+            'ustruct': struct,
+            'ubinascii': binascii,
+        }
+        sys.modules.update(modules)
+
+        self.iot = modules['ET_IoT_App']
+        _FirmwareLoader.overrides = {'time': self.clock.module(), 'gc': _gc_module(),
+                                     'uasyncio': self.aio.module()}
+
+        sys.meta_path[:] = [f for f in sys.meta_path if not isinstance(f, _FirmwareFinder)]
+        sys.meta_path.insert(0, _FirmwareFinder(self.firmware_dir))
+
+    def _load(self):
+        name = 'sf2_firmware'
+        loader = _FirmwareLoader(name, self.path)
+        spec = importlib.util.spec_from_file_location(name, self.path, loader=loader)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        loader.exec_module(module)
+        self.script = module
+        return getattr(module, 'core', module)           # 공용 제어 모듈을 쓰는 스크립트는 core 의 상태 사용
+
+    # --------------------------------------------------------------------------------------
+    # 실행
+    # --------------------------------------------------------------------------------------
+    @property
+    def now_ms(self):
+        return self.clock.now_us / 1000
+
+    @property
+    def app(self):                                       # 펌웨어의 ET_IoT_App (start() 전에는 None 일 수 있음)
+        return self.fw.app
+
+    def setup(self):                                     # setup(app, et_setup)
+        profile = getattr(self.fw, 'profile', None)
+        if profile is not None:
+            profile.update(self.options)
+        if profile:                                      # 펌웨어 파일은 fs_dir 아래에 만듦
+            for key in FILE_OPTIONS:
+                if profile.get(key):
+                    profile[key] = os.path.join(self.fs_dir, os.path.basename(profile[key]))
+        if profile and profile.get('run_mode') == 'async':   # main() : 연결 후 태스크 등록 (실행은 step)
+            self.async_mode = True
+            self.fw.main()
+            return
+        if hasattr(self.fw, 'start'):                    # 센싱을 먼저 준비한 뒤 IoT 프로그램 생성
+            self.fw.start()
+        self.iot.setup(self.app, self.fw.et_setup)
+
+    def step(self):                                      # loop(...) 한 번 (async : 태스크를 ASYNC_STEP_US 만큼)
+        if self.async_mode:
+            self.aio.run_until(self.clock.now_us + ASYNC_STEP_US)
+        else:
+            fw = self.fw
+            self.iot.loop(fw.app, fw.et_loop, fw.et_short_periodic_process, fw.et_long_periodic_process)
+            self.clock.advance(self.loop_overhead_us)
+        self.loop_count += 1
+        for hook in self.loop_hooks:
+            hook(self)
+
+    def run(self, ms):                                   # 가상 시간으로 ms 동안 실행
+        end_us = self.clock.now_us + ms * 1000
+        while self.clock.now_us < end_us:
+            self.step()
+
+    def run_conveyor(self, tail_ms=3000, limit_ms=None):  # 모든 드럼통이 지나갈 때까지 실행
+        conveyor = self.conveyor
+        limit = conveyor.last_end_ms() + (limit_ms or 60000 + conveyor.drum_count * 5000)
+        while conveyor.passed_count < conveyor.drum_count and self.now_ms < limit:
+            self.run(100)
+        self.run(tail_ms)
+
+    # --------------------------------------------------------------------------------------
+    # 조작
+    # --------------------------------------------------------------------------------------
+    def inject(self, topic, msg):                        # 대시보드에서 보낸 메시지처럼 전달 (topic : 명령 이름)
+        self.broker.publish(iot_app.cmnd_topic(self.kit, topic), msg)
+
+    def press_button(self, at_ms=None, hold_ms=150, bounce=0):
+        self.board.press_button(self.now_ms if at_ms is None else at_ms, hold_ms, bounce)
+
+    def set_connected(self, connected):                  # 브로커 연결 끊김 흉내
+        self.app.mqtt.client.connected = connected
+
+    # --------------------------------------------------------------------------------------
+    # 결과
+    # --------------------------------------------------------------------------------------
+    @property
+    def count(self):
+        return self.fw.count
+
+    def telemetry(self, name):                           # <mac>/et/smpl/tele/<name> 송신 기록 [(t_ms, payload)]
+        topic = iot_app.tele_topic(self.kit, name)
+        return [(t, payload) for t, tp, payload in self.broker.messages if tp == topic]
+
+    def boot_ms(self):                                   # 펌웨어가 기록한 부팅 단계별 경과 시간
+        boot = getattr(self.fw, 'boot', None)
+        if boot is None:
+            return None
+        return {name: us / 1000 for name, us in zip(boot.names, boot.times)}
+
+    def summary(self):
+        return {
+            'firmware': os.path.basename(self.path),
+            'virtual_ms': round(self.now_ms, 3),
+            'loops': self.loop_count,
+            'drums': self.conveyor.drum_count,
+            'passed': self.conveyor.passed_count,
+            'count': self.count,
+            'publishes': self.broker.publish_count,
+            'bytes': self.broker.byte_count,
+            'pings': self.board.ping_count,
+            'boot_ms': self.boot_ms(),
+        }
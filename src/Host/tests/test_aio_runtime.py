@@ -0,0 +1,59 @@
+# ******************************************************************************************
+# FileName     : test_aio_runtime.py
+# Description  : smartfactory2.aio_runtime 수신 태스크 : 라이브러리 loop 사용, 오류 때 대기 증가와 복구
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 가상 시간 uasyncio 로 실행 (실제 대기 없음), async 모드 연결 끊김 시험
+# ******************************************************************************************
+import json
+
+
+class Library:                                           # ET_IoT_App.loop 대체 : down 동안 OSError
+    def __init__(self, clock, down):
+        self.clock = clock
+        self.down = down
+        self.calls = []
+
+    def loop(self, app, et_loop, short_process, long_process):
+        self.calls.append(self.clock.now_us)
+        et_loop()
+        short_process()
+        long_process()
+        if self.down:
+            self.down -= 1
+            raise OSError(104)
+
+
+def test_backoff_and_recovery(clock, capsys):
+    from smartfactory2 import aio_runtime
+    loop = aio_runtime.asyncio.get_event_loop()          # 가상 시간 uasyncio
+    lib = Library(clock, down=6)
+    task = loop.create_task(aio_runtime.mqtt_receive(None, lib.loop, 1, retry_max_ms=16))
+    loop.run_until(clock.now_us + 300 * 1000)
+    task.cancel()
+
+    gaps = [(b - a) // 1000 for a, b in zip(lib.calls, lib.calls[1:8])]
+    assert gaps == [2, 4, 8, 16, 16, 16, 1]              # 오류가 이어지면 두 배씩 (최대 16), 복구 후 다시 짧은 주기
+    out = capsys.readouterr().out
+    assert out.count('MQTT 수신 오류') == 1               # 상태가 바뀔 때만 출력
+    assert out.count('MQTT 수신 복구') == 1
+
+
+def test_async_mode_survives_outage(simulate):
+    sim = simulate(drums=20, interval_ms=3000, run_mode='async')
+    assert sim.async_mode
+    sim.run(10000)
+    sim.set_connected(False)                             # 브로커 연결 끊김 30초
+    sim.run(30000)
+    during = sim.count
+    sim.set_connected(True)
+    sim.inject('pos', '2')                               # 복구 후 명령도 수신
+    sim.run_conveyor(tail_ms=10000)
+
+    assert during > 3                                    # 끊긴 동안에도 계수
+    assert sim.count == sim.conveyor.passed_count == 20
+    assert sim.fw.pos == 2
+    assert sim.fw.outbox.spill_size == 0
+    counts = [json.loads(payload)['count'] for _, payload in sim.telemetry('drum')]
+    assert counts[-1] == 20
@@ -0,0 +1,24 @@
+# ******************************************************************************************
+# FileName     : test_bench.py
+# Description  : sf2bench : 최대 속도 측정 (시험 펌웨어의 주기적 개수 증가 제외), 악화 비교
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import pytest
+
+import sf2bench
+
+
+@pytest.mark.parametrize('variant', ['standard', 'test'])
+def test_sweep_rate_excludes_count_tick(variant):
+    best, points = sf2bench.sweep_rate(variant, 10)
+    assert best > 0
+    assert all(p['count'] == 10 for p in points if p['exact'])
+
+
+def test_compare_flags_sweep_regression():
+    old = {'variants': {'test': {'steady': {}, 'max_sustainable_dpm': 90}}}
+    new = {'variants': {'test': {'steady': {}, 'max_sustainable_dpm': 45}}}
+    assert [r['metric'] for r in sf2bench.compare(new, old)] == ['max_sustainable_dpm']
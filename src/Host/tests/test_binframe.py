@@ -0,0 +1,73 @@
+# ******************************************************************************************
+# FileName     : test_binframe.py
+# Description  : 이진 묶음 : 펌웨어 인코더와 PC 복호화, 키트 토픽 송신, 연결 끊김 중 플래시 보관
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import json
+
+from sf2gw.binframe import BinaryDecoder, is_binary
+from sf2gw.normalize import FIELDS, Normalizer
+
+
+def test_encode_decode_round_trip(clock):
+    from smartfactory2.binframe import BinaryCodec
+    codec = BinaryCodec([('count', 'I', 1, None), ('block', 'B', 1, ('close', 'open')),
+                         ('temp', 'h', 100, None), ('distance', 'f', 1, None)])
+    decoder = BinaryDecoder()
+    assert decoder.learn(codec.schema) == codec.id
+
+    payload = codec.encode([12, 'open', 2155, None])
+    assert is_binary(payload) and len(payload) == codec.size
+    assert decoder.decode(payload) == {'count': 12, 'block': 'open', 'temp': 21.55}
+
+
+def test_unknown_schema_is_not_decoded(clock):
+    from smartfactory2.binframe import BinaryCodec
+    payload = BinaryCodec([('count', 'I', 1, None)]).encode([1])
+    assert BinaryDecoder().decode(payload) is None
+
+
+def test_binary_frames_use_kit_topic(simulate):
+    sim = simulate(drums=6, publish_format='frame', frame_encoding='binary')
+    sim.run_conveyor()
+    frames = sim.telemetry('kit')
+    assert frames and all(is_binary(payload) for _, payload in frames)
+    assert sim.telemetry('schema')
+
+    n = Normalizer()
+    rows = [n.row(topic, payload, t) for t, topic, payload in sim.broker.messages]
+    counts = [r[2 + FIELDS.index('count')] for r in rows if r and r[1] == sim.kit]
+    assert counts[-1] == 6
+    assert n.stats()['binary'] == len(frames)
+
+
+def test_binary_frames_survive_flash_spill(simulate):
+    sim = simulate(drums=20, interval_ms=4000, publish_format='frame', frame_encoding='binary',
+                   spill_path='outbox.txt')
+    sim.run(3000)
+    sim.set_connected(False)                             # 100초 연결 끊김 : 넘치는 묶음은 플래시에 보관
+    sim.run(100000)
+    assert sim.fw.outbox.stats()['spilled'] > 0
+    sim.set_connected(True)
+    sim.run(30000)                                       # 재시도 간격(최대 16초)이 지나 모두 재송신
+    assert sim.fw.outbox.spill_size == 0
+
+    n = Normalizer()
+    for t, topic, payload in sim.broker.messages:
+        n.row(topic, payload, t)
+    frames = sim.telemetry('kit')
+    assert len(frames) > sim.fw.outbox.stats()['spilled']
+    assert all(is_binary(payload) for _, payload in frames)
+    assert n.stats()['malformed'] == 0
+    assert n.stats()['binary'] == len(frames)
+
+
+def test_binary_sensor_data(simulate):
+    sim = simulate('smartlabon', drums=3, sensor_encoding='binary')
+    sim.run_conveyor()
+    assert all(is_binary(payload) for _, payload in sim.telemetry('sensor'))
+    schema = json.loads(sim.telemetry('schema')[-1][1])['sensor']
+    assert [f[0] for f in json.loads(schema)['fields']] == ['distance', 'count']
@@ -0,0 +1,82 @@
+# ******************************************************************************************
+# FileName     : test_commands.py
+# Description  : smartfactory2.commands : 검사, 합치기, reset 앞뒤 순서, 가득 참, 실행 오류
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+
+
+def queue(log, size=8):                                  # pos, block, reset 을 등록한 대기열
+    from smartfactory2.commands import CommandQueue
+    commands = CommandQueue(size, coalesce=('pos', 'block'), barrier=('reset',))
+    handler = lambda topic, msg: log.append((topic, msg))
+    commands.add('pos', handler, int)
+    commands.add('block', handler)
+    commands.add('reset', handler)
+    return commands
+
+
+def test_parse_and_run_in_order(clock):
+    log = []
+    commands = queue(log)
+    assert commands.put('pos', '1')
+    assert commands.put('block', 'open')
+    assert not commands.put('pos', 'x')                  # 잘못된 값
+    assert not commands.put('unknown', '1')              # 등록하지 않은 명령
+    commands.run()
+    assert log == [('pos', 1), ('block', 'open')]
+    assert commands.malformed == 2 and commands.rejected() == 2
+
+
+def test_coalesce_keeps_last_value(clock):
+    log = []
+    commands = queue(log)
+    for value in '1232':
+        commands.put('pos', value)
+    commands.run()
+    assert log == [('pos', 2)]
+    assert commands.coalesced == 3
+
+
+def test_no_coalesce_across_reset(clock):
+    log = []
+    commands = queue(log)
+    commands.put('pos', '1')
+    commands.put('reset', 'reset')
+    commands.put('pos', '2')                             # reset 뒤의 pos 는 따로 실행
+    commands.put('pos', '3')                             # reset 뒤의 pos 끼리는 합침
+    commands.run()
+    assert log == [('pos', 1), ('reset', 'reset'), ('pos', 3)]
+
+
+def test_full_queue_drops(clock):
+    log = []
+    commands = queue(log, size=2)
+    commands.put('pos', '1')
+    commands.put('reset', 'reset')
+    assert not commands.put('block', 'open')
+    assert commands.dropped == 1
+
+
+def test_handler_error_does_not_stop_run(clock):
+    from smartfactory2.commands import CommandQueue
+    log = []
+    commands = CommandQueue()
+    commands.add('bad', lambda topic, msg: 1 / 0)
+    commands.add('good', lambda topic, msg: log.append(msg))
+    commands.put('bad', 'x')
+    commands.put('good', 'y')
+    commands.run()
+    assert log == ['y'] and commands.failed == 1
+
+
+def test_pos_after_reset_in_firmware(simulate):
+    sim = simulate(drums=0)
+    sim.run(500)
+    sim.inject('pos', '1')
+    sim.inject('reset', 'reset')
+    sim.inject('pos', '2')
+    sim.run(500)
+    assert sim.fw.pos == 2
@@ -0,0 +1,84 @@
+# ******************************************************************************************
+# FileName     : test_gate.py
+# Description  : smartfactory2.gate 상태 기계와 드럼통 감지 : 에코 없는 라인, 동작 중 리셋
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+from sf2sim import Conveyor
+
+
+def test_gate_opens_after_delay_and_closes(clock):
+    from smartfactory2.gate import Gate, IDLE
+    actions = []
+    gate = Gate(actions.append, delay_ms=500, open_ms=1000)
+    gate.request()
+    gate.poll()
+    assert actions == []
+    clock.advance(500 * 1000)
+    gate.poll()
+    assert actions == ['open']
+    clock.advance(1000 * 1000)
+    gate.poll()
+    assert actions == ['open', 'close']
+    assert gate.state == IDLE and gate.cycles == 1
+
+
+def test_extend_mode_merges_requests_while_open(clock):
+    from smartfactory2.gate import Gate
+    actions = []
+    gate = Gate(actions.append, delay_ms=0, open_ms=1000, mode='extend')
+    gate.request()
+    gate.poll()                                          # 열림
+    clock.advance(800 * 1000)
+    gate.request()                                       # 닫는 시각을 늦춤
+    clock.advance(800 * 1000)
+    gate.poll()
+    assert actions == ['open']
+    clock.advance(200 * 1000)
+    gate.poll()
+    assert actions == ['open', 'close'] and gate.extended == 1
+
+
+def test_queue_mode_runs_every_request(clock):
+    from smartfactory2.gate import Gate
+    actions = []
+    gate = Gate(actions.append, delay_ms=0, open_ms=100, mode='queue')
+    gate.request()
+    gate.request()
+    for _ in range(4):
+        gate.poll()
+        clock.advance(100 * 1000)
+    assert actions == ['open', 'close', 'open', 'close']
+
+
+def test_lane_beyond_sensor_range(simulate):
+    conveyor = Conveyor(lane_cm=50)                      # 빈 라인 : 최대 측정 거리(40cm) 밖, 에코 없음
+    conveyor.add_drums(20, 3000)
+    sim = simulate(conveyor=conveyor)
+    sim.run_conveyor()
+    assert sim.count == 20
+    assert conveyor.passed_count == 20
+
+
+def test_ranging_max_cm_from_profile(simulate):
+    conveyor = Conveyor(lane_cm=50)
+    conveyor.add_drums(5, 3000)
+    sim = simulate(conveyor=conveyor, ranging_max_cm=60)  # 빈 라인도 측정 범위 안
+    sim.run_conveyor()
+    assert sim.fw.ultrasonic.timeout_us == 60 * 1000 // 17 + 1
+    assert sim.count == 5
+
+
+def test_reset_does_not_cancel_running_gate(simulate):
+    from smartfactory2.gate import IDLE
+    sim = simulate(drums=20)
+    while sim.count == 0:
+        sim.step()
+    sim.inject('reset', 'reset')                         # 차단대가 열리기를 기다리는 중
+    sim.run(60000)
+    assert sim.conveyor.passed_count == 20
+    assert sim.count == 19                               # 리셋 뒤에 온 드럼통
+    assert sim.fw.gate.state == IDLE
+    assert sim.fw.block_state == 'close'
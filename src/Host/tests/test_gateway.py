@@ -0,0 +1,66 @@
+# ******************************************************************************************
+# FileName     : test_gateway.py
+# Description  : sf2gw.Gateway 이중 버퍼 : 느린 저장 중에도 수신 계속, 저장 순서 유지, 저장 오류 알림
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import asyncio
+import json
+import threading
+
+import pytest
+
+from sf2gw.gateway import Gateway
+from sf2gw.normalize import FIELDS
+
+
+KIT = '246f28000001'
+COUNT = 2 + FIELDS.index('count')                        # 행 안의 count 위치
+
+
+class SlowStore:                                         # release 전까지 저장 스레드가 멈춤
+    def __init__(self, fail=False):
+        self.release = threading.Event()
+        self.fail = fail
+        self.written = []                                # 저장된 count (순서대로)
+        self.batches = 0
+        self.rows = 0
+
+    def write(self, rows):
+        self.release.wait(2)
+        if self.fail:
+            raise OSError('disk full')
+        self.written.extend(row[COUNT] for row in rows)
+        self.batches += 1
+        self.rows += len(rows)
+
+
+async def drums(gateway, store, n, seen):                # count 1..n 메시지, 저장 중 수신 여부 기록
+    for count in range(1, n + 1):
+        yield KIT + '/et/smpl/tele/drum', json.dumps({'count': count}).encode()
+        await asyncio.sleep(0)
+        if gateway.writing is not None and store.batches == 0:
+            seen.append(count)                           # 첫 저장이 끝나지 않았는데 다음 메시지를 받음
+    store.release.set()
+
+
+def test_ingest_while_slow_write():
+    store = SlowStore()
+    gateway = Gateway(store, batch=2, flush_ms=60000)
+    seen = []
+    asyncio.run(gateway.run(drums(gateway, store, 12, seen)))
+
+    assert seen[-1] == 12                                # 첫 저장이 멈춘 동안 나머지를 모두 받음
+    assert store.written == list(range(1, 13))           # 저장 순서 유지
+    assert gateway.stats()['pending'] == 0
+    assert store.batches == gateway.flushes < 12         # 저장 중 모인 행은 한 묶음으로
+
+
+def test_write_error_raised_by_flush():
+    store = SlowStore(fail=True)
+    store.release.set()
+    gateway = Gateway(store, batch=2, flush_ms=60000)
+    with pytest.raises(OSError):
+        asyncio.run(gateway.run(drums(gateway, store, 4, [])))
@@ -0,0 +1,85 @@
+# ******************************************************************************************
+# FileName     : test_journal.py
+# Description  : smartfactory2.journal : 묶음 저장, 파일 교대, 전원 차단으로 잘린 기록 복구
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import os
+import struct
+
+
+def test_commit_and_recover(clock, tmp_path):
+    from smartfactory2.journal import CounterJournal
+    path = str(tmp_path / 'count')
+    journal = CounterJournal(path)
+    for value in range(1, 6):
+        journal.commit(value)
+    assert CounterJournal(path).value == 5
+
+
+def test_poll_commits_by_delta_and_time(clock, tmp_path):
+    from smartfactory2.journal import CounterJournal
+    journal = CounterJournal(str(tmp_path / 'count'), commit_delta=10, commit_ms=30000)
+    journal.poll(9)
+    assert journal.value == 0
+    journal.poll(10)
+    assert journal.value == 10
+    journal.poll(11)
+    clock.advance(30000 * 1000)
+    journal.poll(11)
+    assert journal.value == 11
+
+
+def test_rotates_between_two_files(clock, tmp_path):
+    from smartfactory2.journal import CounterJournal
+    path = str(tmp_path / 'count')
+    journal = CounterJournal(path, max_records=4)
+    for value in range(1, 11):
+        journal.commit(value)
+    assert sorted(os.listdir(str(tmp_path))) == ['count.' + str(journal.active)]
+    assert CounterJournal(path, max_records=4).value == 10
+
+
+def test_torn_record_then_more_commits(clock, tmp_path):
+    from smartfactory2.journal import CounterJournal
+    path = str(tmp_path / 'count')
+    journal = CounterJournal(path)
+    for value in range(1, 6):
+        journal.commit(value)
+    with open(path + '.' + str(journal.active), 'ab') as f:   # 저장 중 전원 차단 : 잘린 기록
+        f.write(b'\x01\x02\x03')
+
+    journal = CounterJournal(path)
+    assert journal.value == 5
+    for value in range(6, 12):
+        journal.commit(value)
+    assert CounterJournal(path).value == 11
+
+
+def test_falls_back_to_older_file(clock, tmp_path):
+    from smartfactory2.journal import CounterJournal, MAGIC
+    path = str(tmp_path / 'count')
+    journal = CounterJournal(path)
+    journal.commit(7)
+    newer = path + '.' + str(1 - journal.active)
+    with open(newer, 'wb') as f:                         # 교대 중 전원 차단 : 머리말만 쓰임
+        f.write(struct.pack('<II', MAGIC, journal.epoch + 1))
+        f.write(b'\x00\x00\x00')
+
+    journal = CounterJournal(path)
+    assert journal.value == 7
+    journal.commit(8)
+    assert CounterJournal(path).value == 8
+
+
+def test_no_valid_record_starts_from_zero(clock, tmp_path):
+    from smartfactory2.journal import CounterJournal
+    path = str(tmp_path / 'count')
+    with open(path + '.0', 'wb') as f:
+        f.write(b'garbage!')
+    journal = CounterJournal(path)
+    assert journal.value == 0
+    journal.commit(3)
+    assert CounterJournal(path).value == 3
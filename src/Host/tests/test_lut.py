@@ -0,0 +1,48 @@
+# ******************************************************************************************
+# FileName     : test_lut.py
+# Description  : smartfactory2.lut 변환표와 조도 정수 계산 : 모든 ADC 코드를 원래 식과 비교
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import pytest
+
+
+TEMP_TOLERANCE = 0.05                                    # °C
+LUX_TOLERANCE = 1.0                                      # lux (정수 나눗셈)
+
+
+@pytest.fixture
+def fw(simulate):
+    return simulate('aws', drums=0).fw                   # 온도, 조도 센서를 쓰는 펌웨어
+
+
+def test_temperature_every_code(fw):
+    worst = max(abs(fw.temp_table.lookup(code) / 100 - fw.code_to_celsius(code))
+                for code in range(1, 4095))
+    assert worst <= TEMP_TOLERANCE
+    assert fw.temp_table.lookup(0) is None and fw.temp_table.lookup(4095) is None   # 단선, 단락
+
+
+def test_lux_every_code(fw):
+    for code in range(1, 4095):
+        exact = fw.code_to_lux(code)
+        assert abs(fw.code_to_lux_int(code) - exact) <= LUX_TOLERANCE, code
+    assert fw.code_to_lux_int(0) == 0
+    assert fw.code_to_lux_int(4095) == fw.LUX_MAX
+
+
+def test_lookup_without_tolerance_interpolates(clock):
+    from smartfactory2.lut import Lookup
+    table = Lookup(lambda code: code * 3, rail_low=-1, rail_high=-2)
+    assert len(table.dense) == 0
+    assert [table.lookup(c) for c in (0, 16, 17, 4000, 4095)] == [-1, 48, 51, 12000, -2]
+
+
+def test_dense_segments_only_where_needed(clock):
+    from smartfactory2.lut import Lookup
+    table = Lookup(lambda code: 1000000 / (4095 - code), tolerance=1)
+    assert 0 < len(table.dense) <= 64 * 16              # 곡률이 큰 끝 부분만
+    for code in range(1, 4095):
+        assert abs(table.lookup(code) - 1000000 / (4095 - code)) <= 2, code
@@ -0,0 +1,73 @@
+# ******************************************************************************************
+# FileName     : test_normalize.py
+# Description  : sf2gw.Normalizer : 실제 키트 토픽(<mac>/et/smpl/tele/<name>)과 {key: value} 페이로드
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import json
+
+import pytest
+
+from sf2gw.normalize import FIELDS, Normalizer
+
+
+KIT = '246f28000001'
+
+
+def fields(row):                                         # 행 -> {필드: 값} (NULL 제외)
+    return {f: v for f, v in zip(FIELDS, row[2:]) if v is not None}
+
+
+def test_send_data_scalar_topics():
+    n = Normalizer()
+    row = n.row(KIT + '/et/smpl/tele/drum', b'{"count": 5}', 1.0)
+    assert row[:2] == (1.0, KIT)
+    assert fields(row) == {'count': 5.0}
+    assert fields(n.row(KIT + '/et/smpl/tele/pos', b'{"state": 2}', 1.0)) == {'pos': 2.0}
+    assert fields(n.row(KIT + '/et/smpl/tele/block', b'{"state": "open"}', 1.0)) == {'block': 1.0}
+
+
+def test_frame_sent_through_send_data():
+    n = Normalizer()
+    frame = '{"count":3,"pos":1,"block":"close","distance":4.5,"dpm1":2.5}'
+    row = n.row('line1/' + KIT + '/et/smpl/tele/kit', json.dumps({'status': frame}).encode(), 1.0)
+    assert row[1] == 'line1/' + KIT
+    assert fields(row) == {'count': 3.0, 'pos': 1.0, 'block': 0.0, 'distance': 4.5, 'dpm1': 2.5}
+
+
+def test_sensor_data_and_aws_raw_topic():
+    n = Normalizer(default_kit='aws-kit')
+    row = n.row(KIT + '/et/smpl/tele/sensor', b'{"distance": 4.2, "count": 7}', 1.0)
+    assert fields(row) == {'distance': 4.2, 'count': 7.0}
+    row = n.row('aws/etboard', b'{"count": 9, "temp": 21.5}', 1.0)
+    assert row[1] == 'aws-kit'
+    assert fields(row) == {'count': 9.0, 'temp': 21.5}
+
+
+def test_ignores_non_telemetry():
+    n = Normalizer()
+    assert n.row(KIT + '/et/smpl/tele/boot', b'{"timing": "{\\"loop\\":1.2}"}', 1.0) is None
+    assert n.row(KIT + '/et/smpl/cmnd/pos', b'2', 1.0) is None
+    assert n.row('drum/count', b'5', 1.0) is None        # 키트 토픽이 아님
+    assert n.stats()['ignored'] == 3
+
+
+@pytest.mark.parametrize('payload', [b'not json', b'[1, 2]', b'{"count": "x"}', b'\xff\xfe'])
+def test_malformed(payload):
+    n = Normalizer()
+    assert n.row(KIT + '/et/smpl/tele/drum', payload, 1.0) is None
+    assert n.stats()['malformed'] == 1
+
+
+@pytest.mark.parametrize('publish_format', ['topic', 'frame'])
+def test_simulated_kit_messages(simulate, publish_format):
+    sim = simulate(drums=12, publish_format=publish_format)
+    sim.run_conveyor()
+    n = Normalizer()
+    rows = [n.row(topic, payload, t) for t, topic, payload in sim.broker.messages]
+    counts = [fields(r)['count'] for r in rows if r and 'count' in fields(r)]
+    assert counts[-1] == 12
+    assert set(r[1] for r in rows if r) == {sim.kit}
+    assert n.stats()['malformed'] == 0
@@ -0,0 +1,73 @@
+# ******************************************************************************************
+# FileName     : test_outbox.py
+# Description  : smartfactory2.outbox : 순서, 우선순위별 버림, 재시도 간격, 플래시 보관과 값 복원
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+
+
+class Link:                                              # send(name, key, value) : online 이 아니면 OSError
+    def __init__(self):
+        self.online = True
+        self.sent = []
+
+    def __call__(self, name, key, value):
+        if not self.online:
+            raise OSError(113)
+        self.sent.append((name, key, value))
+
+
+def test_drain_in_order_by_batch(clock):
+    from smartfactory2.outbox import Outbox
+    link = Link()
+    box = Outbox(link, batch=2)
+    for i in range(3):
+        box.send('drum', 'count', i)
+    assert box.drain() == 2
+    assert box.drain() == 1
+    assert [v for _, _, v in link.sent] == [0, 1, 2]
+
+
+def test_full_queue_drops_low_priority_first(clock):
+    from smartfactory2.outbox import Outbox
+    link = Link()
+    box = Outbox(link, size=3, high=('drum',))
+    box.send('drum', 'count', 1)
+    box.send('pos', 'state', 0)
+    box.send('drum', 'count', 2)
+    box.send('drum', 'count', 3)                         # 가득 참 : pos 를 버림
+    box.drain()
+    assert link.sent == [('drum', 'count', 1), ('drum', 'count', 2), ('drum', 'count', 3)]
+    assert box.stats()['dropped'] == 1
+
+
+def test_backoff_while_offline(clock):
+    from smartfactory2.outbox import Outbox
+    link = Link()
+    box = Outbox(link, retry_ms=500)
+    box.send('drum', 'count', 1)
+    link.online = False
+    assert box.drain() == 0
+    link.online = True
+    assert box.drain() == 0                              # 재시도 시각 전
+    clock.advance(500 * 1000)
+    assert box.drain() == 1
+
+
+def test_spill_restores_value_types(clock, tmp_path):
+    from smartfactory2.outbox import Outbox
+    link = Link()
+    link.online = False
+    frame = b'\xb7\x01\x12\x34\x0a\x00\x00\x00\x09\n\t\x00'   # 줄바꿈, 탭이 들어 있는 이진 묶음
+    box = Outbox(link, size=1, high=('kit', 'drum'), spill_path=str(tmp_path / 'spill.txt'))
+    box.send('kit', 'status', frame)
+    box.send('drum', 'count', 7)                         # 가득 참 : 이진 묶음을 플래시에 보관
+    box.send('kit', 'status', '{"count":7}')             # 가득 참 : 정수를 플래시에 보관
+    assert box.stats()['spilled'] == 2
+
+    link.online = True
+    box.drain()
+    assert link.sent == [('kit', 'status', frame), ('drum', 'count', 7), ('kit', 'status', '{"count":7}')]
+    assert box.spill_size == 0
@@ -0,0 +1,95 @@
+# ******************************************************************************************
+# FileName     : test_simulation.py
+# Description  : 시뮬레이터 : 계수, 송신 토픽과 페이로드 형식, 명령 수신
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import json
+
+import pytest
+
+
+KIT = '246f28000001'                                     # 가상 보드 MAC (unique_id)
+
+
+@pytest.mark.parametrize('variant', ['standard', 'aws', 'smartlabon'])
+def test_counts_every_drum(simulate, variant):
+    sim = simulate(variant, drums=20)
+    sim.run_conveyor()
+    assert sim.count == 20
+    assert sim.conveyor.passed_count == 20
+
+
+def test_test_variant_counts_drums_and_ticks(simulate):
+    sim = simulate('test', drums=20)
+    sim.run_conveyor()
+    assert sim.conveyor.passed_count == 20
+    assert sim.count > 20                                # 5초마다 개수 증가
+
+
+def test_send_data_uses_kit_tele_topic(simulate):
+    sim = simulate(drums=5)                              # 기본 : 토픽별 송신 (대시보드 앱 구독 토픽)
+    sim.run_conveyor()
+    topics = set(m[1] for m in sim.broker.messages)
+    assert KIT + '/et/smpl/tele/drum' in topics
+    assert all(t.startswith(KIT + '/et/smpl/tele/') for t in topics)
+
+    assert json.loads(sim.telemetry('drum')[-1][1]) == {'count': 5}
+    assert json.loads(sim.telemetry('pos')[-1][1]) == {'state': 0}
+    assert json.loads(sim.telemetry('block')[-1][1]) == {'state': 'close'}
+
+
+def test_frame_is_sent_through_send_data(simulate):
+    sim = simulate(drums=5, publish_format='frame')
+    sim.run_conveyor()
+    payload = json.loads(sim.telemetry('kit')[-1][1])
+    assert json.loads(payload['status'])['count'] == 5
+
+
+def test_commands_arrive_on_kit_cmnd_topic(simulate):
+    sim = simulate(drums=0)
+    sim.run(500)
+    sim.inject('pos', '2')
+    sim.run(500)
+    assert sim.broker.published(KIT + '/et/smpl/cmnd/pos')
+    assert sim.fw.pos == 2
+
+    sim.broker.publish('pos', b'3')                      # 앞부분이 없는 토픽은 키트가 받지 않음
+    sim.run(500)
+    assert sim.fw.pos == 2
+
+
+def test_counts_while_connecting():
+    from sf2sim import Conveyor, Simulation
+    conveyor = Conveyor()
+    conveyor.add_drums(5, 3000, start_ms=0)              # 첫 드럼통은 전원 인가 때 이미 센서 앞
+    sim = Simulation('standard', conveyor, connect_ms=20000)   # Wi-Fi, MQTT 연결에 20초
+    sim.setup()
+    boot = sim.boot_ms()
+    assert boot['first_count'] < 100                     # 연결을 기다리는 동안 계수
+    assert sim.count == 5                                # 차단대도 작동해 모든 드럼통이 지나감
+    assert conveyor.passed_count == 5
+    assert not sim.broker.messages                       # 송신은 연결 후 대기열에서
+
+    sim.run(1000)
+    assert json.loads(sim.telemetry('drum')[-1][1]) == {'count': 5}
+
+
+def test_env_sensor_periods_from_profile(simulate):
+    sim = simulate('aws', drums=0, temp_period_ms=10000, lux_period_ms=250)
+    assert sim.fw.temp_adc.period_ms == 10000
+    assert sim.fw.lux_adc.period_ms == 250
+
+
+def test_smartlabon_survives_outage(simulate):
+    sim = simulate('smartlabon', drums=20, interval_ms=3000)
+    sim.run(3000)
+    sim.set_connected(False)                             # 센서 데이터 송신 중 연결 끊김
+    sim.run(20000)
+    sim.set_connected(True)
+    sim.run_conveyor(tail_ms=20000)
+    assert sim.count == 20
+    data = json.loads(sim.telemetry('sensor')[-1][1])
+    assert data['count'] == 20 and 'distance' in data
@@ -0,0 +1,53 @@
+# ******************************************************************************************
+# FileName     : test_throughput.py
+# Description  : smartfactory2.throughput 이동 창 생산 속도, 별도 주기 송신 (상태 묶음에는 없음)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import json
+
+from sf2gw.normalize import FIELDS, Normalizer
+
+
+def test_rate_per_window(clock):
+    from smartfactory2.throughput import Throughput
+    rate = Throughput()
+    for _ in range(30):                                  # 2초마다 한 개 : 분당 30
+        clock.advance(2000 * 1000)
+        rate.add(clock.ticks_ms())
+    now = clock.ticks_ms()
+    assert 280 <= rate.rate10(0, now) <= 320       # 10초 칸 단위 근사
+    assert rate.gap_ms == 2000 and rate.gap_dev == 0
+
+
+def test_idle_windows_drain(clock):
+    from smartfactory2.throughput import Throughput
+    rate = Throughput()
+    rate.add(clock.ticks_ms())
+    clock.advance(16 * 60000 * 1000)                     # 가장 긴 창보다 오래 쉼
+    now = clock.ticks_ms()
+    assert rate.poll(now)
+    assert [rate.rate10(j, now) for j in range(3)] == [0, 0, 0]
+
+
+def test_frames_leave_throughput_out(simulate):
+    sim = simulate(drums=20, publish_format='frame')
+    sim.run_conveyor()
+    for _, payload in sim.telemetry('kit'):
+        frame = json.loads(json.loads(payload)['status'])
+        assert not set(frame) & {'dpm1', 'dpm5', 'dpm15', 'gap_ms', 'gap_dev'}
+
+
+def test_throughput_sent_on_its_own_period(simulate):
+    sim = simulate(drums=40, interval_ms=3000)
+    sim.run_conveyor(tail_ms=10000)
+    sent = sim.telemetry('throughput')
+    period = sim.fw.profile['throughput_period_ms']
+    assert 1 < len(sent) <= sim.now_ms // period + 1
+
+    n = Normalizer()
+    row = n.row(sim.kit + '/et/smpl/tele/throughput', sent[-1][1], 1.0)
+    assert 15 <= row[2 + FIELDS.index('dpm1')] <= 25     # 3초마다 한 개 : 분당 약 20
+    assert row[2 + FIELDS.index('gap_ms')] > 0
@@ -0,0 +1,88 @@
+# ******************************************************************************************
+# FileName     : test_tlog.py
+# Description  : sf2gw.tlog : 방향 구분, 이진 로그 기록/읽기, 시뮬레이터 기록, 재생 선택
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 64 KB 가 넘는 페이로드 기록
+# ******************************************************************************************
+import asyncio
+
+from sf2gw.tlog import DOWN, UP, LogWriter, direction_of, read_log, replay
+
+
+KIT = '246f28000001'
+
+
+def test_direction_from_cmnd_tele_segment():
+    assert direction_of(KIT + '/et/smpl/cmnd/pos') == DOWN
+    assert direction_of(KIT + '/et/smpl/cmnd/reset') == DOWN
+    assert direction_of(KIT + '/et/smpl/tele/pos') == UP    # 톱니바퀴 위치 송신 (명령 아님)
+    assert direction_of(KIT + '/et/smpl/tele/block') == UP
+    assert direction_of('aws/etboard') == UP
+
+
+def test_write_and_read_back(tmp_path):
+    path = str(tmp_path / 'run.sf2t')
+    writer = LogWriter(path, epoch=100.0)
+    writer.write(0, UP, 'a/et/smpl/tele/drum', b'{"count": 1}')
+    writer.write(5 * 2 ** 32, DOWN, 'a/et/smpl/cmnd/pos', '2')   # 32비트를 넘는 시간 차
+    writer.write(5 * 2 ** 32 + 10, UP, 'a/et/smpl/tele/drum', b'{"count": 2}')
+    writer.close()
+
+    epoch, records = read_log(path)
+    assert epoch == 100.0
+    assert records == [
+        (0, UP, 'a/et/smpl/tele/drum', b'{"count": 1}'),
+        (5 * 2 ** 32, DOWN, 'a/et/smpl/cmnd/pos', b'2'),
+        (5 * 2 ** 32 + 10, UP, 'a/et/smpl/tele/drum', b'{"count": 2}'),
+    ]
+
+    with open(path, 'ab') as f:                          # 기록 중 끊긴 마지막 기록
+        f.write(b'\x00\x01\x02')
+    assert read_log(path)[1] == records
+
+
+def test_recorder_directions_match_simulator(tmp_path, simulate):
+    sim_path = str(tmp_path / 'sim.sf2t')
+    writer = LogWriter(sim_path)
+    sim = simulate(drums=3, publish_format='topic')
+    sim.app.recorder = writer.write                      # 시뮬레이터 송수신 기록
+    sim.run(500)
+    sim.inject('pos', '1')
+    sim.run_conveyor()
+    writer.close()
+    _, records = read_log(sim_path)
+
+    for _, direction, topic, _ in records:               # 브로커 구독 기록(Recorder)도 같은 방향으로 구분
+        assert direction_of(topic) == direction
+    assert any(r[1] == DOWN for r in records)
+    assert any(r[2].endswith('/tele/pos') and r[1] == UP for r in records)
+
+
+def test_replay_keeps_telemetry_without_commands():
+    records = [
+        (0, UP, KIT + '/et/smpl/tele/pos', b'{"state": 1}'),
+        (1000, DOWN, KIT + '/et/smpl/cmnd/pos', b'1'),
+        (2000, UP, KIT + '/et/smpl/tele/block', b'{"state": "open"}'),
+    ]
+    sent = []
+    result = asyncio.run(replay(records, lambda topic, payload: sent.append(topic), speed=100))
+    assert sent == [KIT + '/et/smpl/tele/pos', KIT + '/et/smpl/tele/block']
+    assert result['messages'] == 2
+
+
+def test_payload_over_64k_through_recorder(tmp_path):
+    from sf2sim.broker import LocalBroker
+    from sf2gw.tlog import Recorder
+    path = str(tmp_path / 'big.sf2t')
+    writer = LogWriter(path)
+    broker = LocalBroker()
+    broker.subscribe('#', Recorder(writer))
+    big = b'x' * 70000                                   # 16비트 길이를 넘는 메시지
+    broker.publish(KIT + '/et/smpl/tele/image', big)
+    broker.publish(KIT + '/et/smpl/tele/drum', b'{"count": 1}')   # 그 뒤에도 기록 계속
+    writer.close()
+
+    records = read_log(path)[1]
+    assert [r[3] for r in records] == [big, b'{"count": 1}']
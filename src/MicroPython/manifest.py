@@ -0,0 +1,12 @@
+# ******************************************************************************************
+# FileName     : manifest.py
+# Description  : 펌웨어 이미지에 공용 모듈(smartfactory2)을 frozen 바이트코드로 포함
+#                make BOARD=ESP32_GENERIC FROZEN_MANIFEST=<이 파일 경로>
+# Author       :
+# Created Date : 2026.10.18
+# Reference    : https://docs.micropython.org/en/latest/reference/manifest.html
+# Modified     :
+# ******************************************************************************************
+include("$(PORT_DIR)/boards/manifest.py")                # 포트 기본 frozen 모듈 (uasyncio 등)
+
+package("smartfactory2", opt=3)                          # 공용 제어 모듈 : 부팅 때 컴파일 없이 플래시에서 실행
@@ -0,0 +1,8 @@
+# ******************************************************************************************
+# FileName     : __init__.py
+# Description  : 스마트 팩토리2 키트 공용 모듈 모음
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
@@ -0,0 +1,54 @@
+# ******************************************************************************************
+# FileName     : adc_filter.py
+# Description  : ADC 묶음 측정 + 정수 IIR 필터 (센서별 측정 주기)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import time
+from array import array
+
+
+FRAC_BITS = 4                                            # 필터 내부 소수부 비트 (1/16 코드)
+
+# 상태 배열 인덱스
+FILTERED = 0                                             # 필터 값 (<< FRAC_BITS)
+PRIMED = 1                                               # 첫 측정 완료 여부
+
+
+#===========================================================================================
+class FilteredADC:                                       # 주기마다 burst 번 읽어 평균 후 IIR 필터
+#===========================================================================================
+    def __init__(self, adc, period_ms=1000, burst=8, shift=2):
+        self.adc = adc
+        self.period_ms = period_ms                       # 측정 주기 (센서별로 설정)
+        self.burst = burst                               # 한 번에 읽는 표본 수
+        self.shift = shift                               # IIR 계수 = 1 / 2**shift
+        self.state = array('i', [0, 0])                  # 미리 할당한 필터 상태
+        self.next_ms = time.ticks_ms()
+        self.sample_count = 0                            # 읽은 표본 수
+
+    def poll(self):                                      # 측정 시각이면 측정 후 True
+        now = time.ticks_ms()
+        if time.ticks_diff(now, self.next_ms) < 0:
+            return False
+        self.next_ms = time.ticks_add(now, self.period_ms)
+
+        total = 0
+        read = self.adc.read
+        for _ in range(self.burst):
+            total += read()
+        self.sample_count += self.burst
+
+        mean = (total << FRAC_BITS) // self.burst
+        state = self.state
+        if state[PRIMED]:
+            state[FILTERED] += (mean - state[FILTERED]) >> self.shift
+        else:                                            # 첫 측정은 그대로 사용
+            state[FILTERED] = mean
+            state[PRIMED] = 1
+        return True
+
+    def value(self):                                     # 필터링된 ADC 코드 (정수)
+        return (self.state[FILTERED] + (1 << (FRAC_BITS - 1))) >> FRAC_BITS
@@ -0,0 +1,78 @@
+# ******************************************************************************************
+# FileName     : aio_runtime.py
+# Description  : uasyncio 기반 협력형 실행 모드
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 수신 태스크가 ET_IoT_App.loop 로 재연결, keepalive 처리, 오류 때 점점 길게 대기
+# ******************************************************************************************
+try:
+    import uasyncio as asyncio
+except ImportError:                                      # PC(CPython) 환경
+    import asyncio
+
+
+#===========================================================================================
+def sleep_ms(ms):                                        # 밀리초 단위 대기 (양보)
+#===========================================================================================
+    if hasattr(asyncio, 'sleep_ms'):
+        return asyncio.sleep_ms(ms)
+    return asyncio.sleep(ms / 1000)
+
+
+#===========================================================================================
+async def every(period_ms, process):                     # 주기적 처리 태스크
+#===========================================================================================
+    while True:
+        process()
+        await sleep_ms(period_ms)
+
+
+#===========================================================================================
+def _idle():                                             # 라이브러리 loop 에 넘기는 빈 사용자 처리
+#===========================================================================================
+    pass
+
+
+#===========================================================================================
+async def mqtt_receive(app, loop, period_ms, retry_max_ms=16000):   # MQTT 수신 태스크
+#===========================================================================================
+    # 라이브러리의 loop() 로 수신, 재연결, keepalive 를 처리 (사용자 처리는 각 태스크에서)
+    # 오류가 이어지면 대기 시간을 두 배씩 늘리고, 오류 출력은 상태가 바뀔 때만
+    backoff_ms = period_ms
+    failing = False
+    while True:
+        try:
+            loop(app, _idle, _idle, _idle)
+        except OSError as e:
+            if not failing:
+                print('MQTT 수신 오류:', e)
+                failing = True
+            backoff_ms = min(backoff_ms * 2, retry_max_ms)
+        else:
+            if failing:
+                print('MQTT 수신 복구')
+                failing = False
+            backoff_ms = period_ms
+        await sleep_ms(backoff_ms)
+
+
+#===========================================================================================
+def run(app, setup, loop, et_setup, tasks,               # 협력형 실행 시작 (setup, loop : ET_IoT_App)
+        short_process=None, long_process=None,
+        short_period_ms=1000, long_period_ms=5000, recv_period_ms=50):
+#===========================================================================================
+    setup(app, et_setup)                                 # 기존 setup()으로 네트워크 연결
+
+    async def main():
+        for task in tasks:                               # 사용자 태스크 (센싱, 차단대 등)
+            asyncio.create_task(task())
+
+        if short_process:
+            asyncio.create_task(every(short_period_ms, short_process))
+        if long_process:
+            asyncio.create_task(every(long_period_ms, long_process))
+
+        await mqtt_receive(app, loop, recv_period_ms)
+
+    asyncio.run(main())
@@ -0,0 +1,63 @@
+# ******************************************************************************************
+# FileName     : binframe.py
+# Description  : 상태 묶음, 센서 데이터의 고정 배치 이진 인코딩 (JSON 대신 선택)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    : src/Host/sf2gw/binframe.py (PC 복호화)
+# Modified     :
+# ******************************************************************************************
+import struct
+
+
+MAGIC = 0xB7                                             # 첫 바이트 (JSON 의 '{' 와 구분)
+VERSION = 1
+HEADER = '<BBHI'                                         # MAGIC, VERSION, 스키마 번호, 값 있음 비트
+
+
+#===========================================================================================
+def schema_id(text):                                     # 스키마 번호 (FNV-1a 32비트를 16비트로 접음)
+#===========================================================================================
+    h = 0x811C9DC5
+    for c in text:
+        h = ((h ^ ord(c)) * 0x01000193) & 0xFFFFFFFF
+    return (h >> 16) ^ (h & 0xFFFF)
+
+
+#===========================================================================================
+class BinaryCodec:                                       # 고정 배치 인코더
+#===========================================================================================
+    # 필드 순서와 형식은 스키마 JSON 으로 한 번 알리고, 묶음에는 값만 담음 (필드 이름 없음)
+    # 값이 없는 필드 (None) 는 0 으로 채우고 값 있음 비트를 끔 (최대 32개)
+
+    def __init__(self, fields):                          # fields : [(name, fmt, scale, enum)]
+        self.enums = []
+        self.format = HEADER
+        parts = []
+        for name, fmt, scale, enum in fields:
+            if enum:
+                fmt = 'B'                                # 문자열은 목록 번호
+            self.format += fmt
+            self.enums.append(enum)
+            parts.append('["%s","%s",%d,%s]' % (
+                name, fmt, scale,
+                '[' + ','.join('"%s"' % e for e in enum) + ']' if enum else 'null'))
+        fields_json = '[' + ','.join(parts) + ']'
+        self.id = schema_id(fields_json)
+        self.schema = '{"id":%d,"version":%d,"fields":%s}' % (self.id, VERSION, fields_json)
+        self.size = struct.calcsize(self.format)
+
+    def encode(self, values):                            # values : 필드 순서의 값 목록 -> bytes
+        present = 0
+        args = [0] * len(values)
+        enums = self.enums
+        for i in range(len(values)):
+            value = values[i]
+            if value is None:
+                continue
+            if enums[i]:
+                if value not in enums[i]:
+                    continue
+                value = enums[i].index(value)
+            args[i] = value
+            present |= 1 << i
+        return struct.pack(self.format, MAGIC, VERSION, self.id, present, *args)
@@ -0,0 +1,51 @@
+# ******************************************************************************************
+# FileName     : boot.py
+# Description  : 부팅 단계별 시간 기록 (전원 인가 후 첫 계수까지)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import time
+
+
+US_RANGE_MS = 500000                                     # ticks_us 차이를 믿을 수 있는 범위 (2^29 us 이내)
+
+
+#===========================================================================================
+class BootTimer:                                         # 부팅 단계 시간 기록
+#===========================================================================================
+    def __init__(self):
+        self.start_us = time.ticks_us()                  # 모듈을 불러온 시점을 기준으로 함
+        self.start_ms = time.ticks_ms()
+        self.names = []                                  # 단계 이름 (기록 순서)
+        self.times = []                                  # 기준 시점부터 경과 시간 (us)
+        self.reported = False
+
+    def mark(self, name):                                # 단계 완료 기록 (같은 이름은 처음 한 번만)
+        if name in self.names:
+            return
+        us = time.ticks_diff(time.ticks_us(), self.start_us)
+        ms = time.ticks_diff(time.ticks_ms(), self.start_ms)
+        if ms > US_RANGE_MS:                             # 오래 지난 단계(첫 계수 등)는 ms 정밀도
+            us = ms * 1000
+        self.names.append(name)
+        self.times.append(us)
+
+    def elapsed_us(self, name):                          # 단계 경과 시간, 기록 전이면 None
+        if name in self.names:
+            return self.times[self.names.index(name)]
+        return None
+
+    def report(self):                                    # '{"import":12.345,...}' (ms, 누적)
+        parts = []
+        for i in range(len(self.names)):
+            us = self.times[i]
+            parts.append('"%s":%d.%03d' % (self.names[i], us // 1000, us % 1000))
+        return '{' + ','.join(parts) + '}'
+
+    def take_report(self):                               # 아직 보내지 않았다면 보고서, 아니면 None
+        if self.reported:
+            return None
+        self.reported = True
+        return self.report()
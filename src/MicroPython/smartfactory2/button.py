@@ -0,0 +1,43 @@
+# ******************************************************************************************
+# FileName     : button.py
+# Description  : 인터럽트 기반 푸시 버튼 (디바운스, 눌림 횟수 누적)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import time
+import machine
+from machine import Pin
+
+
+#===========================================================================================
+class PushButton:                                        # 풀업 버튼 (눌림 = LOW)
+#===========================================================================================
+    def __init__(self, pin, debounce_ms=30):
+        self.pin = pin
+        self.debounce_ms = debounce_ms                   # 이 시간 이상 눌려 있어야 한 번으로 인정
+        self.pending = 0                                 # 처리되지 않은 눌림 횟수
+        self.pressed_ms = time.ticks_ms()                # 마지막 하강 엣지 시각
+        self.is_pressed = False
+
+        pin.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._on_edge)
+
+    def _on_edge(self, pin):                             # 인터럽트 처리 (짧게 유지)
+        now = time.ticks_ms()
+        if pin.value() == 0:                             # 눌림 시작
+            self.pressed_ms = now
+            self.is_pressed = True
+        elif self.is_pressed:                            # 뗌 : 충분히 눌려 있었을 때만 인정
+            self.is_pressed = False
+            if time.ticks_diff(now, self.pressed_ms) >= self.debounce_ms:
+                self.pending += 1
+
+    def take(self):                                      # 누적된 눌림 횟수를 가져오고 초기화
+        if self.pending == 0:
+            return 0
+        state = machine.disable_irq()
+        presses = self.pending
+        self.pending = 0
+        machine.enable_irq(state)
+        return presses
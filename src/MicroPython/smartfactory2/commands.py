@@ -0,0 +1,100 @@
+# ******************************************************************************************
+# FileName     : commands.py
+# Description  : 수신 명령 대기열 (수신 콜백에서 넣고 제어 루프에서 실행, pos/block 은 마지막 값만)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : reset 등 barrier 명령 앞의 명령과는 합치지 않음 (실행 순서 유지)
+# ******************************************************************************************
+
+
+#===========================================================================================
+class CommandQueue:                                      # 링 버퍼 명령 대기열
+#===========================================================================================
+    # 수신 콜백은 검사 후 넣기만 하고, 서보 작동과 송신은 run() 에서 처리
+    # coalesce 토픽은 아직 실행하지 않은 같은 토픽 명령의 값을 바꿈 (연속 명령은 한 번만 작동)
+    # barrier 토픽(reset 등) 뒤에 온 명령은 그 앞의 명령과 합치지 않음 ([pos 1, reset, pos 2] 유지)
+
+    def __init__(self, size=8, coalesce=(), barrier=()):
+        self.size = size
+        self.coalesce = coalesce
+        self.barrier = barrier
+
+        self.handlers = {}                               # topic -> (parse, handler)
+        self.topics = [None] * size                      # 링 버퍼 (미리 할당)
+        self.values = [None] * size
+        self.head = 0                                    # 가장 오래된 항목 위치
+        self.length = 0
+
+        self.received = 0                                # 받은 명령 수
+        self.executed = 0                                # 실행한 명령 수
+        self.coalesced = 0                               # 마지막 값으로 합쳐진 명령 수
+        self.malformed = 0                               # 검사에 실패한 명령 수
+        self.dropped = 0                                 # 대기열이 가득 차 버린 명령 수
+        self.failed = 0                                  # 실행 중 오류가 난 명령 수
+
+    def add(self, topic, handler, parse=None):           # 명령 등록, 수신 콜백 반환
+        self.handlers[topic] = (parse, handler)
+        return self.put
+
+    def put(self, topic, msg):                           # 수신 콜백 : 검사 후 대기열에 넣음
+        self.received += 1
+        entry = self.handlers.get(topic)
+        if entry is None:
+            self.malformed += 1
+            return False
+
+        parse = entry[0]
+        if parse is not None:
+            try:
+                msg = parse(msg)
+            except (ValueError, TypeError):              # 잘못된 값 : 세고 버림
+                self.malformed += 1
+                return False
+
+        if topic in self.coalesce:                       # 대기 중인 같은 명령이 있으면 값만 바꿈
+            for n in range(self.length - 1, -1, -1):     # 최근 것부터, barrier 를 만나면 중단
+                i = (self.head + n) % self.size
+                if self.topics[i] == topic:
+                    self.values[i] = msg
+                    self.coalesced += 1
+                    return True
+                if self.topics[i] in self.barrier:
+                    break
+
+        if self.length == self.size:
+            self.dropped += 1
+            return False
+
+        i = (self.head + self.length) % self.size
+        self.topics[i] = topic
+        self.values[i] = msg
+        self.length += 1
+        return True
+
+    def run(self):                                       # 제어 루프에서 호출 : 대기 중인 명령 실행
+        while self.length:
+            i = self.head
+            topic = self.topics[i]
+            msg = self.values[i]
+            self.topics[i] = None
+            self.values[i] = None
+            self.head = (i + 1) % self.size
+            self.length -= 1
+
+            try:
+                self.handlers[topic][1](topic, msg)
+            except Exception as e:                       # 명령 하나의 오류로 루프가 멈추지 않게
+                self.failed += 1
+                print('command', topic, e)
+                continue
+            self.executed += 1
+
+    def rejected(self):                                  # 실행하지 못한 명령 수
+        return self.malformed + self.dropped + self.failed
+
+    def report(self):                                    # 통계 JSON
+        return ('{"received":%d,"executed":%d,"coalesced":%d,"malformed":%d,'
+                '"dropped":%d,"failed":%d,"pending":%d}') % (
+            self.received, self.executed, self.coalesced, self.malformed,
+            self.dropped, self.failed, self.length)
@@ -0,0 +1,863 @@
+# ******************************************************************************************
+# FileName     : core.py
+# Description  : 스마트 팩토리2 키트 공용 제어 (설치 환경별 차이는 profiles.py)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    : Kit_smartFactory2_IoT.py, Kit_SmartFactory2_IoT_AWS.py,
+#                Kit_smartFactory2_SmartLabOn.py
+# Modified     : 2026.10.18 : 센싱을 먼저 시작하는 부팅 순서, 부팅 단계별 시간 기록
+# Modified     : 2026.10.18 : 센서 타입 응답을 센서 목록(SensorRegistry)으로 변경, 한 번에 송신
+# Modified     : 2026.10.18 : 단계별 실행 시간 측정(profiler), 'stats' 메시지로 조회/초기화
+# Modified     : 2026.10.18 : 차단대를 대기 없는 상태 기계(Gate)로 변경, 드럼통 진입 때만 계수
+# Modified     : 2026.10.18 : 초음파 측정 주기를 드럼통 접근에 따라 조절 (AdaptiveSampler)
+# Modified     : 2026.10.18 : 중복 계수 방지를 ticks_ms 로 변경, 드럼통 통과 기록(TransitLog)
+# Modified     : 2026.10.18 : 생산 수량을 플래시에 저장 (CounterJournal), 부팅 때 복원
+# Modified     : 2026.10.18 : 분당 생산 수량(1/5/15분)과 도착 간격을 생산 수량과 함께 송신
+# Modified     : 2026.10.18 : 수신 명령을 검사 후 대기열(CommandQueue)에 넣고 반복 처리에서 실행
+# Modified     : 2026.10.18 : 상태 묶음, 센서 데이터 이진 인코딩 선택 (frame_encoding, sensor_encoding)
+# Modified     : 2026.10.18 : 이진 묶음을 키트 송신 토픽(<mac>/et/smpl/tele/<name>)으로 publish
+# Modified     : 2026.10.18 : 에코 없음(측정 범위 밖)을 드럼통이 빠져나간 것으로 처리, 최대 거리 설정
+# Modified     : 2026.10.18 : 리셋이 동작 중인 차단대를 취소하지 않음 (기다리던 드럼통이 다시 감지됨)
+# Modified     : 2026.10.18 : 생산 속도를 상태 묶음에서 빼고 별도 주기로 송신 (profile['throughput_period_ms'])
+# Modified     : 2026.10.18 : 부팅 순서 설명 수정 : 첫 계수는 여전히 네트워크 연결(iot.setup) 뒤
+# Modified     : 2026.10.18 : reset 명령 앞뒤의 pos, block 명령을 합치지 않음 (CommandQueue barrier)
+# Modified     : 2026.10.18 : async 모드 수신 태스크에 ET_IoT_App.loop 전달 (재연결, keepalive)
+# Modified     : 2026.10.18 : 온도, 조도 측정 주기를 설치 환경별 설정으로 (profile['temp_period_ms'], 'lux_period_ms')
+# Modified     : 2026.10.18 : JSON 센서 데이터도 송신 대기열을 거쳐 send_sensor_data 로 송신 (연결 끊김 대비)
+# Modified     : 2026.10.18 : 네트워크 연결 중에도 타이머(machine.Timer)로 드럼통 감지, 차단대 작동
+# Modified     : 2026.10.18 : 온도 변환표 오차 제한 (tolerance), 조도는 변환표 대신 같은 식의 정수 계산
+# Modified     : 2026.10.18 : ADC 를 machine 에서 직접 import (pin_define 의 재수출에 기대지 않음)
+# ******************************************************************************************
+
+
+#===========================================================================================
+# 부팅 시간 측정 : 가장 먼저 시작
+#===========================================================================================
+from smartfactory2.boot import BootTimer
+boot = BootTimer()                                       # 부팅 단계별 시간 (boot/timing 으로 1회 송신)
+
+
+#===========================================================================================
+# 기본 모듈 사용하기 : 네트워크, OLED 모듈은 센싱을 시작한 뒤에 불러옴
+#===========================================================================================
+import time
+from machine import ADC, Pin
+from ETboard.lib.pin_define import *                     # ETboard 핀 관련 모듈
+from ETboard.lib.servo import Servo
+from smartfactory2.button import PushButton
+from smartfactory2.ranging import Ultrasonic
+from smartfactory2.publisher import StatePublisher, encode_frame
+from smartfactory2.outbox import Outbox
+from smartfactory2.gate import Gate
+from smartfactory2.sampler import AdaptiveSampler
+from smartfactory2.transit import TransitLog
+from smartfactory2.throughput import Throughput
+from smartfactory2.commands import CommandQueue
+from smartfactory2.profiles import STANDARD
+
+boot.mark('import')
+
+
+#===========================================================================================
+# 전역 변수 선언
+#===========================================================================================
+profile = STANDARD                                       # 설치 환경별 설정 (configure()로 선택)
+board_firmware_version = ''                              # OLED 첫 줄에 표시할 펌웨어 버전
+
+app = None                                               # IoT 프로그램 (센싱 시작 후 생성)
+TELE = '/et/smpl/tele/'                                  # 대시보드 송신 토픽 : <mac>/et/smpl/tele/<name>
+tele_prefix = None                                       # 이진 값 직접 publish 토픽 앞부분 (start() 에서 MAC 주소로)
+display = None                                           # OLED 표시 (첫 표시 때 생성, 바뀐 줄만 다시 그림)
+
+button_push = Pin(D7)                                    # 톱니바퀴 작동 버튼 핀 : D7
+push_button = None                                       # 버튼 인터럽트 처리기
+publisher = None                                         # 상태 송신 관리 (바뀐 값만 송신)
+outbox = None                                            # 송신 대기열 (연결 끊김 대비)
+sensors = None                                           # 센서 목록 (profile['sensor_types'])
+SENSOR_SCHEMA_EVERY = 12                                 # 이진 센서 데이터 스키마를 다시 보내는 송신 간격
+profiler = None                                          # 단계별 실행 시간 측정 (profile['profiler'])
+commands = None                                          # 수신 명령 대기열
+
+echo_pin = Pin(D8)                                       # 초음파 수신 핀: D8
+trig_pin = Pin(D9)                                       # 초음파 송신 핀: D9
+ultrasonic = None                                        # 초음파 거리 측정 (중앙값 필터)
+sampler = None                                           # 초음파 측정 주기 조절
+GATE_POLL_MS = 20                                        # 차단대 동작 중 최대 대기 시간
+BOOT_TIMER_ID = 0                                        # 네트워크 연결 중 감지용 하드웨어 타이머
+boot_timer = None                                        # 연결 중 감지 타이머 (et_setup() 에서 해제)
+
+servo_block = Servo(Pin(D4))                             # 서보모터(차단대) 핀 : D4
+servo_geer = Servo(Pin(D5))                              # 서보모터(톱니바퀴) 핀 : D5
+gate = None                                              # 차단대 상태 기계
+
+count = 0                                                # 지나간 물건 개수
+pre_time = None                                          # 물건이 지나간 시간 (ticks_ms)
+transit = None                                           # 드럼통 통과 기록
+throughput = None                                        # 분당 생산 수량, 도착 간격
+THROUGHPUT_FIELDS = ('dpm1', 'dpm5', 'dpm15', 'gap_ms', 'gap_dev')   # 생산 속도 송신 필드
+THROUGHPUT_SCALES = (10, 10, 10, 1, 1)                   # 분당 수량은 x10 정수로 계산
+throughput_at = None                                     # 마지막 생산 속도 송신 시각 (None : 다음 주기 처리에서 송신)
+journal = None                                           # 생산 수량 저장 (profile['count_journal'])
+
+distance = 0                                             # 거리
+pos = 0                                                  # 컨베이어 위치 상태
+block_state = 'close'                                    # 차단대 상태
+drum_present = False                                     # 센서 앞에 드럼통이 있음
+
+
+#===========================================================================================
+# 온도, 조도 센서 (profile['env_sensors'])
+#===========================================================================================
+R1 = 10000
+c1 = 1.009249522e-03
+c2 = 2.378405444e-04
+c3 = 2.019202697e-07
+
+temp = 0                                                 # 온도 (0.01 °C 단위 정수, 센서 이상이면 None)
+lux = 0                                                  # 조도 (lux 정수)
+
+LUX_MAX = 500 * 4094                                     # CDS 가 최대 밝기(레일)일 때 조도
+temp_table = None                                        # 온도 변환표 (부팅 때 생성)
+
+temp_adc = None                                          # 온도 ADC 필터
+lux_adc = None                                           # 조도 ADC 필터
+
+
+#===========================================================================================
+def configure(base, version='', **options):              # 설치 환경 선택
+#===========================================================================================
+    global profile, board_firmware_version
+
+    profile = dict(base)                                 # 스크립트별 옵션(run_mode 등)으로 덮어씀
+    profile.update(options)
+    board_firmware_version = version
+
+
+#===========================================================================================
+def boot_sensing():                                      # 센싱 준비 (네트워크 연결 전)
+#===========================================================================================
+    global push_button, publisher, outbox, gate, sampler, transit, throughput, commands
+    global ultrasonic
+
+    if profile['profiler']:
+        setup_profiler()                                 # 측정할 처리 단계를 감쌈
+
+    # 송신은 대기열을 거쳐 루프에서 처리 (생산 수량과 상태 묶음은 우선 보관)
+    outbox = Outbox(publish_state, high=('drum', 'schema', profile['frame_topic'][0]),
+                    spill_path=profile['spill_path'])
+
+    if profile['publish_format'] == 'frame':             # 상태를 한 번에 송신
+        publisher = StatePublisher(outbox.send, send_frame=send_status_frame,
+                                   binary=profile['frame_encoding'] == 'binary',
+                                   send_schema=send_frame_schema)
+    else:                                                # 토픽별 송신
+        publisher = StatePublisher(outbox.send)
+    pos_name, pos_key = profile['pos_topic']
+    # fmt, enum : 이진 묶음(frame_encoding='binary')일 때의 형식
+    publisher.add_field('count', 'drum', 'count', fmt='I')
+    publisher.add_field('pos', pos_name, pos_key, fmt='B')
+    publisher.add_field('block', 'block', 'state', enum=('close', 'open'))
+    publisher.add_field('distance', trigger=False, fmt='f')   # 묶음에만 포함
+    publisher.add_field('rate', trigger=False, fmt='H')  # 초음파 측정 빈도 (회/초)
+    publisher.add_field('cmd_err', trigger=False, fmt='I')    # 실행하지 못한 명령 수 (잘못된 값, 대기열 가득)
+
+    commands = CommandQueue(profile['command_queue'], coalesce=('pos', 'block'), barrier=('reset',))
+    if profile['env_sensors']:
+        publisher.add_field('temp', trigger=False, scale=100, fmt='h')
+        publisher.add_field('lux', trigger=False)
+
+    button_push.init(Pin.IN)                             # 밀기 버튼 : 입력 모드
+    push_button = PushButton(button_push)                # 버튼 눌림을 인터럽트로 누적
+
+    echo_pin.init(Pin.IN)                                # 초음파 수신부: 입력 모드
+    trig_pin.init(Pin.OUT)                               # 초음파 송신부: 출력 모드
+    ultrasonic = Ultrasonic(trig_pin, echo_pin, profile['ranging_max_cm'])
+    sampler = AdaptiveSampler(profile['sample_slow_ms'], profile['sample_fast_ms'])
+
+    gate = Gate(set_block_state, profile['gate_delay_ms'], profile['gate_open_ms'],
+                profile['gate_mode'])
+    transit = TransitLog(profile['transit_size'])
+    throughput = Throughput()
+
+    initializing_process()                               # 초기화 (송신은 연결 후 대기열에서)
+
+    if profile['count_journal']:
+        restore_count()                                  # 저장된 생산 수량 복원
+
+    if profile['env_sensors']:
+        setup_env_sensors()                              # 온도, 조도 센서 초기화
+
+    if profile['sensor_types']:
+        setup_sensor_registry()                          # 센서 타입 응답, 센서 데이터 송신 목록
+
+    measure_distance()                                   # 첫 거리 측정
+    start_boot_poll()                                    # 네트워크 연결을 기다리는 동안에도 계수
+    boot.mark('sensing')
+
+
+#===========================================================================================
+def et_setup():                                          #  사용자 맞춤형 설정 (네트워크 연결 후)
+#===========================================================================================
+    stop_boot_poll()                                     # 이후 감지, 차단대는 반복 처리(또는 태스크)에서
+    recv_message()
+    boot.mark('network')
+
+
+#===========================================================================================
+def et_loop():                                           # 사용자 반복 처리
+#===========================================================================================
+    boot.mark('loop')                                    # 반복 처리 시작 (처음 한 번만 기록)
+    do_command_process()                                 # 받은 명령 처리
+    do_sensing_process()                                 # 센싱 처리
+    do_automatic_process()                               # 자동화 처리
+    publisher.poll()                                     # 바뀐 상태 송신
+    outbox.drain()                                       # 대기 중인 메시지 송신
+
+    if journal is not None:
+        journal.poll(count)                              # 조건이 되면 생산 수량 저장
+
+
+#===========================================================================================
+def start_boot_poll():                                   # 연결 중 주기 처리 시작 (iot.setup() 이 막혀 있어도 실행)
+#===========================================================================================
+    global boot_timer
+
+    from machine import Timer
+    import micropython
+
+    boot_timer = Timer(BOOT_TIMER_ID)
+    # 타이머 콜백에서는 예약만 하고, 측정과 서보 작동은 micropython.schedule 로 실행
+    boot_timer.init(period=GATE_POLL_MS, mode=Timer.PERIODIC,
+                    callback=lambda t: micropython.schedule(boot_poll, None))
+
+
+#===========================================================================================
+def stop_boot_poll():                                    # 연결 중 주기 처리 종료
+#===========================================================================================
+    global boot_timer
+
+    if boot_timer is not None:
+        boot_timer.deinit()
+        boot_timer = None
+
+
+#===========================================================================================
+def boot_poll(arg):                                      # 연결 중 주기 처리 : 버튼, 측정, 감지, 차단대, 저장
+#===========================================================================================
+    if boot_timer is None:                               # 해제 전에 예약된 호출
+        return
+
+    do_button_process()
+    if sampler.due():
+        measure_distance()
+    if detect_drum():
+        gate.request()
+    gate.poll()
+    if journal is not None:
+        journal.poll(count)
+
+
+#===========================================================================================
+def restore_count():                                     # 저장된 생산 수량 복원
+#===========================================================================================
+    global journal, count
+
+    from smartfactory2.journal import CounterJournal
+
+    try:
+        journal = CounterJournal(profile['count_journal'], profile['count_commit_delta'],
+                                 profile['count_commit_ms'])
+    except OSError as e:                                 # 파일 시스템 이상 : 저장 없이 동작
+        print('count journal:', e)
+        return
+
+    count = journal.value
+    publisher.update('count', count)
+
+
+#===========================================================================================
+def initializing_process():                              # 센싱 처리
+#===========================================================================================
+    global count, pos, block_state, throughput_at
+
+    count = 0
+    pos = 0
+
+    do_geer_process()
+    if not gate.is_busy():                               # 동작 중인 차단대는 끝까지 (닫기는 상태 기계가)
+        block_state = 'close'
+        servo_block.write_angle(0)
+    transit.reset()
+    throughput.reset()
+    throughput_at = None                                 # 초기화된 생산 속도도 다음 주기 처리에서 송신
+
+    if display is not None:                              # 부팅 때는 첫 주기 처리에서 표시
+        display.invalidate()                             # 초기화 때는 전체 다시 그리기
+        display_information()
+
+    publisher.update('count', count)
+    publisher.update('block', block_state)
+    publisher.update('pos', pos)
+    publisher.invalidate()                               # 초기화 후 전체 상태 재송신
+
+
+#===========================================================================================
+def do_geer_process():                                   # 톱니바퀴 작동 처리
+#===========================================================================================
+    global pos
+
+    if pos > 3:                                          # pos가 3보다 크다면
+        pos = 0                                          # pos를 0으로 변경
+
+    publisher.update('pos', pos)
+
+    servo_geer.write_angle(profile['geer_angles'][pos])  # 톱니바퀴를 최종 각도로 설정
+
+
+#===========================================================================================
+def do_command_process():                                # 받은 명령 처리 (수신 콜백에서는 대기열에 넣기만 함)
+#===========================================================================================
+    commands.run()
+    publisher.update('cmd_err', commands.rejected())
+
+
+#===========================================================================================
+def do_sensing_process():                                # 센싱 처리
+#===========================================================================================
+    do_button_process()                                  # 버튼 입력 처리
+
+    if sampler.due():                                    # 측정 주기가 되었다면
+        measure_distance()                               # 초음파 거리 측정
+
+    if profile['env_sensors']:
+        temp_get()
+        lux_get()
+
+    wait = sampler.wait_ms()                             # 다음 측정까지 대기
+    if wait > GATE_POLL_MS and gate.is_busy():           # 차단대 동작 시각을 놓치지 않도록
+        wait = GATE_POLL_MS
+    time.sleep_ms(wait)
+
+
+#===========================================================================================
+def do_button_process():                                 # 버튼 입력 처리
+#===========================================================================================
+    global pos
+
+    presses = push_button.take()                         # 인터럽트로 누적된 눌림 횟수
+    while presses > 0:                                   # 눌린 횟수만큼 톱니바퀴 작동
+        pos += 1
+        do_geer_process()
+        presses -= 1
+
+
+#===========================================================================================
+def measure_distance():                                  # 초음파 거리 측정
+#===========================================================================================
+    global distance
+
+    distance = ultrasonic.measure()                      # 필터링된 거리, 에코가 없으면 NO_ECHO
+    sampler.update(ultrasonic.raw_us)                    # 원시 측정값으로 다음 측정 주기 결정
+    publisher.update('distance', distance)
+    publisher.update('rate', sampler.rate_hz())
+
+
+#===========================================================================================
+def setup_env_sensors():                                 # 온도, 조도 센서 초기화
+#===========================================================================================
+    global temp_table, temp_adc, lux_adc
+
+    from smartfactory2.lut import Lookup
+    from smartfactory2.adc_filter import FilteredADC
+
+    temperature_pin = ADC(Pin(A2))                       # 온도 센서 핀: A2
+    cds_pin = ADC(Pin(A1))                               # CDS 센서 핀: A1
+
+    cds_pin.atten(ADC.ATTN_11DB)                         # 최대 전압 범위 설정 (0-3.3V)
+    temperature_pin.atten(ADC.ATTN_11DB)                 # 최대 전압 범위 설정 (0-3.3V)
+
+    # 센서별 주기로 여러 번 읽어 평균 내고 IIR 필터 적용
+    temp_adc = FilteredADC(temperature_pin, profile['temp_period_ms'])
+    lux_adc = FilteredADC(cds_pin, profile['lux_period_ms'])
+
+    # 변환표 생성 : 반복 처리에서는 표에서 찾기만 함 (보간 오차 0.02 °C 가 넘는 양 끝 구간은 모든 코드 저장)
+    temp_table = Lookup(code_to_celsius, scale=100, tolerance=2)   # 0 / 4095 (단선, 단락) : None
+
+
+#===========================================================================================
+def setup_profiler():                                    # 처리 단계별 실행 시간 측정 준비
+#===========================================================================================
+    global profiler, et_loop, do_sensing_process, do_automatic_process
+    global display_information, send_message
+
+    from smartfactory2.profiler import Profiler
+
+    profiler = Profiler()
+    et_loop = profiler.wrap('loop', et_loop, profile['loop_budget_ms'] * 1000)
+    do_sensing_process = profiler.wrap('sensing', do_sensing_process)
+    do_automatic_process = profiler.wrap('automatic', do_automatic_process)
+    display_information = profiler.wrap('display', display_information)
+    send_message = profiler.wrap('send', send_message)
+
+
+#===========================================================================================
+def setup_sensor_registry():                             # 센서 목록 생성
+#===========================================================================================
+    global sensors
+
+    from smartfactory2.sensors import SensorRegistry
+
+    readers = {                                          # sensorId -> 현재 값
+        'distance': lambda: distance,
+        'count': lambda: count,
+        'temp': lambda: temp,
+        'lux': lambda: lux,
+    }
+
+    sensors = SensorRegistry()
+    for sensor_id, nickname, unit in profile['sensor_types']:
+        sensors.add(sensor_id, nickname, unit, readers[sensor_id])
+
+
+#===========================================================================================
+def temp_get():                                          # 온도
+#===========================================================================================
+    global temp
+
+    if not temp_adc.poll():                              # 측정 주기가 아니면 생략
+        return
+
+    sensor_value = temp_adc.value()                      # 필터링된 온도 센서 값
+    temp = temp_table.lookup(sensor_value)               # 0.01 °C 단위, 단선/단락이면 None
+    publisher.update('temp', temp)
+
+
+#===========================================================================================
+def lux_get():                                           # 조도
+#===========================================================================================
+    global lux
+
+    if not lux_adc.poll():                               # 측정 주기가 아니면 생략
+        return
+
+    sensor_value = lux_adc.value()                       # 필터링된 CDS 값 (0 - 4095)
+    lux = code_to_lux_int(sensor_value)                  # 어두움(0) / 최대 밝기(4095)는 레일 값
+    publisher.update('lux', lux)
+
+
+#===========================================================================================
+def code_to_celsius(sensor_value):                       # 온도 센서 값을 섭씨로 변환 (변환표 생성용)
+#===========================================================================================
+    import math
+
+    # 아날로그 센서 값을 디지털 값으로 변환
+    R2 = R1 * (4095.0 / sensor_value - 1.0)
+    log_R2 = math.log(R2)
+    T = (1.0 / (c1 + c2 * log_R2 + c3 * log_R2 * log_R2 * log_R2))
+    return T - 273.15
+
+
+#===========================================================================================
+def code_to_lux(sensor_value):                           # CDS 값을 Lux로 변환 (기준 식)
+#===========================================================================================
+    # 전압 계산 (ESP32의 경우 3.3V가 최대)
+    voltage = sensor_value * (3.3 / 4095.0)
+
+    # 저항 계산 (기본 0.1kΩ 저항을 사용한다고 가정)
+    resistance = (3.3 - voltage) * (1000) / voltage
+
+    return resistance_to_lux(resistance)                 # 저항을 Lux로 변환
+
+
+#===========================================================================================
+def code_to_lux_int(sensor_value):                       # CDS 값을 Lux 정수로 (code_to_lux 와 같은 식, float 없음)
+#===========================================================================================
+    # 저항 = 1000 * (4095 - code) / code , lux = 500 / (저항 / 1000) = 500 * code / (4095 - code)
+    # 최대 밝기 쪽은 기울기가 매우 커서 변환표 보간으로는 오차가 큼
+    if sensor_value <= 0:
+        return 0
+    if sensor_value >= 4095:
+        return LUX_MAX
+    return 500 * sensor_value // (4095 - sensor_value)
+
+
+#===========================================================================================
+def resistance_to_lux(resistance):                       # CDS 값을 Lux로 변환하는 함수
+#===========================================================================================
+    # 예시로 간단한 변환 식을 사용
+    lux = 500 / (resistance / 1000)
+    return lux
+
+
+#===========================================================================================
+def do_automatic_process():                              # 자동화 처리
+#===========================================================================================
+    if detect_drum():                                    # 드럼통이 감지되었다면
+        gate.request()                                   # 차단대 작동 요청 (기다리지 않음)
+
+    gate.poll()                                          # 시각이 된 열기/닫기 실행
+
+
+#===========================================================================================
+def detect_drum():                                       # 드럼통 감지
+#===========================================================================================
+    global count, pre_time, drum_present
+
+    now = time.ticks_ms()                                # 현재 시간 저장 (ms 단위)
+
+    if not 2 < distance < 8:                             # 측정된 거리가 2 초과 8 미만이 아니라면 (에코 없음 포함)
+        if drum_present:
+            drum_present = False                         # 드럼통이 빠져나감
+            transit.exit(now)
+        return False
+
+    if drum_present:                                     # 이미 계수한 드럼통
+        transit.observe(distance)                        # 최소 거리 갱신
+        return False
+    drum_present = True
+
+    if pre_time is not None and time.ticks_diff(now, pre_time) <= profile['dedupe_ms']:
+        transit.reenter()                                # 중복 카운트 방지 : 같은 드럼통으로 봄
+        return False
+
+    pre_time = now
+    count += 1                                           # 드럼통 출고 개수 증가
+    publisher.update('count', count)
+    transit.enter(now, distance, block_state == 'open')
+    throughput.add(now)
+    boot.mark('first_count')                             # 전원 인가 후 첫 계수 (처음 한 번만 기록)
+    return True
+
+
+#===========================================================================================
+def send_throughput():                                   # 생산 속도 송신 (throughput {dpm: 묶음 JSON}, 별도 주기)
+#===========================================================================================
+    global throughput_at
+
+    now = time.ticks_ms()
+    if throughput_at is not None and \
+            time.ticks_diff(now, throughput_at) < profile['throughput_period_ms']:
+        return
+    throughput_at = now
+
+    throughput.poll(now)                                 # 지난 칸 정리
+    values = (throughput.rate10(0, now), throughput.rate10(1, now), throughput.rate10(2, now),
+              throughput.gap_ms, throughput.gap_dev)
+    outbox.send('throughput', 'dpm', encode_frame(THROUGHPUT_FIELDS, values, THROUGHPUT_SCALES))
+
+
+#===========================================================================================
+def set_block_state(state):                              # 차단대 상태 변경
+#===========================================================================================
+    global block_state
+
+    if state == 'open':
+        servo_block.write_angle(profile['block_open_angle'])
+        transit.gate_opened(time.ticks_ms())             # 기다리던 드럼통의 차단대 지연 기록
+    else:
+        servo_block.write_angle(0)
+
+    block_state = state
+    publisher.update('block', block_state)
+
+
+#===========================================================================================
+def et_short_periodic_process():                         # 사용자 주기적 처리 (예 : 1초마다)
+#===========================================================================================
+    display_information()
+
+
+#===========================================================================================
+def et_long_periodic_process():                          # 사용자 주기적 처리 (예 : 5초마다)
+#===========================================================================================
+    global count
+
+    if profile['count_tick']:                            # 2024.10.12 : SCS : aws test
+        count = count + 1
+        publisher.update('count', count)
+
+    if profiler is not None:
+        profiler.sample_memory()                         # 남은 메모리 기록
+
+    report = boot.take_report()                          # 부팅 단계별 시간 (처음 한 번만)
+    if report:
+        print('boot:', report)
+        outbox.send('boot', 'timing', report)
+
+    send_throughput()                                    # 생산 속도 (상태 묶음과 따로, 느린 주기)
+    send_message()
+
+
+#===========================================================================================
+def display_information():                               # OLED 표시
+#===========================================================================================
+    global display
+
+    if display is None:                                  # OLED는 첫 표시 때 초기화 (부팅 지연 방지)
+        from ETboard.lib.OLED_U8G2 import oled_u8g2
+        from smartfactory2.display import LineDisplay
+        display = LineDisplay(oled_u8g2())
+        boot.mark('display')
+
+    display.set_line(1, board_firmware_version)
+    display.set_line(2, count, 'count: %d')              # 값이 바뀐 줄만 새로 그림
+    display.set_line(3, pos, 'pos: %d')
+    display.show()                                       # 바뀐 내용이 없으면 생략
+
+
+#===========================================================================================
+def send_message():                                      # 메시지 송신
+#===========================================================================================
+    publisher.poll()                                     # 바뀐 상태만 송신 (주기적 생존 신호 포함)
+
+    if sensors is not None:                              # SmartLabOn : 센서 데이터 송신
+        outbox.drain()                                   # 대기 중인 메시지 먼저 송신
+        if profile['sensor_encoding'] == 'binary':       # 이진 센서 데이터 (<mac>/et/smpl/tele/sensor)
+            if sensors.binary_sent % SENSOR_SCHEMA_EVERY == 0:
+                outbox.send('schema', 'sensor', sensors.binary_codec().schema)
+            outbox.send('sensor', 'bin', sensors.encode_binary())
+        else:                                            # JSON 센서 데이터 : 대기열에서 send_sensor_data 로
+            outbox.send('sensor', 'json', sensors.encode_json())
+
+
+#===========================================================================================
+def publish_state(name, key, value):                     # 상태 송신 (출력 대기열에서 호출)
+#===========================================================================================
+    topic = profile['raw_topics'].get(name)
+    if isinstance(value, bytes):                         # 이진 묶음, 센서 데이터 : send_data 와 같은 키트 토픽에 그대로
+        app.mqtt.client.publish(topic or tele_prefix + name, value)
+        return
+    if name == 'sensor':                                 # JSON 센서 데이터 {sensorId: value} : 라이브러리 송신 형식으로
+        import ujson
+        data = ujson.loads(value)
+        for sensor_id in data:
+            app.add_sensor_data(sensor_id, data[sensor_id])
+        app.send_sensor_data()
+        return
+    if topic is None:                                    # 대시보드 송신
+        app.send_data(name, key, value)
+        return
+
+    # 2024.10.21 : SCS : AWS용 커스텀 publish
+    if key == profile['frame_topic'][1]:                 # 상태 묶음 (이미 JSON)
+        json_payload = value
+    else:
+        json_payload = '{"' + key + '":' + str(value) + '}'
+    print('publish(', topic, ',', json_payload, ')')
+    app.mqtt.client.publish(topic, json_payload)
+
+
+#===========================================================================================
+def send_status_frame(payload):                          # 상태 묶음 송신 (1회 publish)
+#===========================================================================================
+    name, key = profile['frame_topic']
+    outbox.send(name, key, payload)
+
+
+#===========================================================================================
+def send_frame_schema(schema):                           # 이진 상태 묶음의 필드 배치 송신 (schema {key: 스키마})
+#===========================================================================================
+    outbox.send('schema', profile['frame_topic'][1], schema)
+
+
+#===========================================================================================
+def recv_message():                                      # 메시지 수신
+#===========================================================================================
+    commands = profile['commands']
+
+    if 'pos' in commands:
+        # 'pos' 메시지를 받으면 process_geer_control() 실행
+        recv('pos', process_geer_control, parse_pos)
+
+    if 'block' in commands:
+        # 'block' 메시지를 받으면 process_block_control() 실행
+        recv('block', process_block_control, parse_block)
+
+    if 'reset' in commands:
+        # 'reset' 메시지를 받으면 process_reset_control() 실행
+        recv('reset', process_reset_control, parse_reset)
+
+    if 'transit' in commands:
+        # 'transit' 메시지를 받으면 process_transit_control() 실행
+        recv('transit', process_transit_control)
+
+    if 'get_sensor_type' in commands:
+        # "get_sensor_type" 메시지를 받으면 handle_get_sensor_type_request() 실행
+        recv('get_sensor_type', handle_get_sensor_type_request)
+
+    if profiler is not None:
+        # 'stats' 메시지를 받으면 process_stats_control() 실행
+        recv('stats', process_stats_control)
+
+
+#===========================================================================================
+def recv(topic, handler, parse=None):                    # 수신 등록 (측정 중이면 명령 실행 시간도 측정)
+#===========================================================================================
+    if profiler is not None:
+        handler = profiler.wrap('recv_' + topic, handler)
+    # 수신 콜백은 parse 로 검사 후 대기열에 넣고, handler 는 do_command_process() 에서 실행
+    app.setup_recv_message(topic, commands.add(topic, handler, parse))
+
+
+#===========================================================================================
+def parse_pos(msg):                                      # 'pos' 값 검사 : 톱니바퀴 위치 번호
+#===========================================================================================
+    pos = int(msg)
+    if not 0 <= pos < len(profile['geer_angles']):
+        raise ValueError(msg)
+    return pos
+
+
+#===========================================================================================
+def parse_block(msg):                                    # 'block' 값 검사 : 'open' / 'close'
+#===========================================================================================
+    if msg not in ('open', 'close'):
+        raise ValueError(msg)
+    return msg
+
+
+#===========================================================================================
+def parse_reset(msg):                                    # 'reset' 값 검사
+#===========================================================================================
+    if msg != 'reset':
+        raise ValueError(msg)
+    return msg
+
+
+#===========================================================================================
+def handle_get_sensor_type_request(topic, msg):          # 센서 타입 송신 처리
+#===========================================================================================
+    # 미리 만든 전체 센서 타입 목록을 한 번에 송신
+    outbox.send('sensor_types', 'all', sensors.descriptors())
+
+
+#===========================================================================================
+def process_geer_control(topic, msg):                    # 톱니바퀴(서보) 제어 처리 (msg : parse_pos 결과)
+#===========================================================================================
+    global pos
+    pos = msg
+    do_geer_process()
+
+
+#===========================================================================================
+def process_block_control(topic, msg):                   # 차단대 제어 처리
+#===========================================================================================
+    global block_state
+
+    if msg == 'open':
+        servo_block.write_angle(profile['block_open_angle'])
+        block_state = 'open'
+        print('차단대: 열림')
+    else:
+        servo_block.write_angle(0)
+        block_state = 'close'
+        print('차단대: 닫힘')
+
+    publisher.update('block', block_state)
+
+
+#===========================================================================================
+def process_reset_control(topic, msg):                   # 리셋 처리
+#===========================================================================================
+    if msg == 'reset':
+        initializing_process()
+        if journal is not None:
+            journal.reset()                              # 저장된 생산 수량도 0 으로
+
+
+#===========================================================================================
+def process_transit_control(topic, msg):                 # 통과 기록 조회 ('get') / 초기화 ('reset')
+#===========================================================================================
+    if msg == 'reset':
+        transit.reset()
+    else:
+        outbox.send('transit', 'report', transit.report())
+
+
+#===========================================================================================
+def process_stats_control(topic, msg):                   # 실행 시간 통계 조회 ('get') / 초기화 ('reset')
+#===========================================================================================
+    if msg == 'reset':
+        profiler.reset()
+    else:
+        profiler.sample_memory()
+        outbox.send('stats', 'report', profiler.report())
+        outbox.send('stats', 'commands', commands.report())
+
+
+#===========================================================================================
+# uasyncio 실행 모드 : 센싱과 차단대 작동을 독립된 태스크로 실행
+#===========================================================================================
+
+
+#===========================================================================================
+async def sensing_task():                                # 센싱 태스크
+#===========================================================================================
+    while True:
+        do_button_process()
+        if sampler.due():
+            measure_distance()
+        if profile['env_sensors']:
+            temp_get()
+            lux_get()
+
+        if detect_drum():
+            gate.request()                               # 차단대 태스크에 작동 요청
+
+        await aio_runtime.sleep_ms(sampler.wait_ms())
+
+
+#===========================================================================================
+async def gate_task():                                   # 차단대 태스크
+#===========================================================================================
+    while True:
+        do_command_process()                             # 받은 명령도 제어 태스크에서 실행
+        gate.poll()
+        await aio_runtime.sleep_ms(20)
+
+
+#===========================================================================================
+async def publish_task():                                # 상태 송신 태스크
+#===========================================================================================
+    while True:
+        publisher.poll()
+        outbox.drain()
+        if journal is not None:
+            journal.poll(count)
+        await aio_runtime.sleep_ms(50)
+
+
+#===========================================================================================
+def start():                                             # 부팅 : 센싱 먼저, 그다음 IoT 프로그램
+#===========================================================================================
+    # iot.setup() 이 Wi-Fi, MQTT 연결을 기다리는 동안에는 타이머(boot_poll)가 드럼통 감지와 차단대를 처리
+    # 연결되지 않아도 계수하고, 송신할 상태는 대기열에 남았다가 연결 후 송신
+    global app, tele_prefix
+
+    boot_sensing()                                       # 버튼, 초음파, 서보 준비와 첫 측정
+
+    import ubinascii
+    from machine import unique_id
+    tele_prefix = ubinascii.hexlify(unique_id()).decode() + TELE   # ET_IoT_App 과 같은 MAC 주소 (ESP32 기본 MAC)
+
+    import ET_IoT_App as iot                             # 네트워크 모듈은 센싱 준비 후 불러옴
+    app = iot.ET_IoT_App()
+    boot.mark('app')
+    return iot
+
+
+#===========================================================================================
+def main():                                              # 시작 지점 (스크립트에서 호출)
+#===========================================================================================
+    global aio_runtime
+
+    iot = start()
+
+    if profile['run_mode'] == 'async':                   # 협력형 실행 (uasyncio)
+        from smartfactory2 import aio_runtime
+        aio_runtime.run(app, iot.setup, iot.loop, et_setup, (sensing_task, gate_task, publish_task),
+                        et_short_periodic_process, et_long_periodic_process)
+    else:
+        iot.setup(app, et_setup)                         # 네트워크 연결 후 et_setup() (연결 중에는 boot_poll)
+        while True:
+            iot.loop(app, et_loop, et_short_periodic_process, et_long_periodic_process)
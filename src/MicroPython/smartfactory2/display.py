@@ -0,0 +1,54 @@
+# ******************************************************************************************
+# FileName     : display.py
+# Description  : OLED 줄 단위 부분 갱신 (바뀐 줄만 다시 그림)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+
+_EMPTY = object()                                        # 아직 그리지 않은 줄
+
+
+#===========================================================================================
+class LineDisplay:                                       # oled_u8g2 줄 캐시
+#===========================================================================================
+    def __init__(self, oled, lines=3):
+        self.oled = oled
+        self.values = [_EMPTY] * (lines + 1)             # 줄 번호(1부터)별 마지막 값
+        self.texts = [''] * (lines + 1)                  # 줄 번호별 마지막 문자열
+        self.changed = 0                                 # 바뀐 줄 비트 마스크
+        self.full = True                                 # 다음 표시 때 전체 다시 그리기
+
+        self.frame_count = 0                             # 실제로 그린 횟수
+        self.skip_count = 0                              # 바뀐 내용이 없어 생략한 횟수
+
+    def set_line(self, line, value, fmt=None):           # 값이 바뀐 경우에만 문자열 생성
+        if value == self.values[line]:
+            return
+        self.values[line] = value
+        self.texts[line] = fmt % value if fmt else value
+        self.changed |= 1 << line
+
+    def invalidate(self):                                # 다음 표시 때 전체 다시 그리기
+        self.full = True
+
+    def show(self):                                      # 바뀐 줄만 반영, 없으면 생략
+        if not self.changed and not self.full:
+            self.skip_count += 1
+            return False
+
+        if self.full:
+            self.oled.clear()
+            for line in range(1, len(self.texts)):
+                self.oled.setLine(line, self.texts[line])
+            self.full = False
+        else:
+            for line in range(1, len(self.texts)):
+                if self.changed & (1 << line):
+                    self.oled.setLine(line, self.texts[line])
+
+        self.changed = 0
+        self.oled.display()
+        self.frame_count += 1
+        return True
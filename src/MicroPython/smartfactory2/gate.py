@@ -0,0 +1,75 @@
+# ******************************************************************************************
+# FileName     : gate.py
+# Description  : 차단대 동작 상태 기계 (대기 없이 반복 처리에서 시각 확인)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : reset() 삭제 (리셋 명령도 동작 중인 열기/닫기를 끝까지 수행)
+# ******************************************************************************************
+import time
+
+
+IDLE = 0                                                 # 닫힘, 대기 중인 요청 없음
+DELAY = 1                                                # 열기 전 대기 (드럼통이 차단대에 닿을 때까지)
+OPEN = 2                                                 # 열림
+
+EXTEND = 'extend'                                        # 열려 있는 동안 온 요청은 열림 시간을 연장
+QUEUE = 'queue'                                          # 요청마다 열기/닫기를 한 번씩 수행
+
+
+#===========================================================================================
+class Gate:                                              # 차단대 상태 기계
+#===========================================================================================
+    def __init__(self, actuate, delay_ms=500, open_ms=1000, mode=EXTEND, max_pending=16):
+        self.actuate = actuate                           # actuate('open' / 'close') : 서보 작동과 상태 송신
+        self.delay_ms = delay_ms
+        self.open_ms = open_ms
+        self.mode = mode
+        self.max_pending = max_pending
+
+        self.state = IDLE
+        self.deadline = 0                                # 다음 동작 시각 (ticks_ms)
+        self.pending = 0                                 # 아직 처리하지 않은 요청 수
+        self.cycles = 0                                  # 열기/닫기 횟수
+        self.extended = 0                                # 연장으로 합쳐진 요청 수
+        self.dropped = 0                                 # 대기열이 가득 차 버린 요청 수
+
+    def request(self):                                   # 드럼통 감지 : 차단대 작동 요청
+        if self.mode == EXTEND and self.state != IDLE:
+            if self.state == OPEN:                       # 열려 있으면 닫는 시각만 늦춤
+                self.deadline = time.ticks_add(time.ticks_ms(), self.open_ms)
+            self.extended += 1
+            return
+        if self.pending >= self.max_pending:
+            self.dropped += 1
+            return
+        self.pending += 1
+        if self.state == IDLE:
+            self.poll()
+
+    def poll(self):                                      # 반복 처리마다 호출 : 시각이 된 동작 실행
+        now = time.ticks_ms()
+        state = self.state
+
+        if state == IDLE:
+            if self.pending > 0:
+                self.pending -= 1
+                self.state = DELAY
+                self.deadline = time.ticks_add(now, self.delay_ms)
+            return
+
+        if time.ticks_diff(now, self.deadline) < 0:     # 아직 시각이 되지 않음
+            return
+
+        if state == DELAY:
+            self.actuate('open')                         # 차단대 열기
+            self.state = OPEN
+            self.deadline = time.ticks_add(now, self.open_ms)
+        else:
+            self.actuate('close')                        # 차단대 닫기
+            self.cycles += 1
+            self.state = IDLE
+            self.poll()                                  # 대기 중인 요청이 있으면 바로 다음 동작
+
+    def is_busy(self):                                   # 동작 중이거나 대기 중인 요청이 있음
+        return self.state != IDLE or self.pending > 0
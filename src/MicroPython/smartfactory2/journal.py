@@ -0,0 +1,152 @@
+# ******************************************************************************************
+# FileName     : journal.py
+# Description  : 생산 수량 플래시 저장 (추가 기록, 두 파일 교대, 묶음 저장)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 잘린 기록이 있거나 올바른 기록이 없으면 다른 파일로 옮겨 씀, 이전 파일로 복구
+# ******************************************************************************************
+import os
+import struct
+import time
+
+
+MAGIC = 0x4A324653                                       # 'SF2J'
+CHECK = 0x5A5AA5A5                                       # 기록 검사 값
+HEADER = 8                                               # MAGIC, epoch
+RECORD = 8                                               # count, count ^ CHECK ^ epoch
+SCAN = 4                                                 # 복구 때 끝에서부터 확인할 최대 기록 수
+
+
+#===========================================================================================
+class CounterJournal:                                    # 생산 수량 저장 (전원이 꺼져도 유지)
+#===========================================================================================
+    # 파일 끝에 8바이트 기록을 추가만 하고, max_records 가 차면 다른 파일로 옮겨 씀 (epoch 증가)
+    # 부팅 때는 두 파일의 머리말과 마지막 기록만 읽음
+
+    def __init__(self, path, commit_delta=10, commit_ms=30000, max_records=512):
+        self.paths = (path + '.0', path + '.1')
+        self.commit_delta = commit_delta                 # 이만큼 늘면 저장
+        self.commit_ms = commit_ms                       # 바뀐 값이 있으면 이 시간마다 저장
+        self.max_records = max_records                   # 파일 하나에 담을 최대 기록 수
+
+        self.active = 0                                  # 현재 기록 중인 파일 번호
+        self.epoch = 0
+        self.records = 0                                 # 현재 파일의 기록 수
+        self.value = 0                                   # 마지막으로 저장한 값
+        self.commit_at = time.ticks_ms()
+        self.commits = 0
+        self.errors = 0                                  # 저장 실패 횟수 (OSError)
+
+        self._recover()
+
+    # --------------------------------------------------------------------------------------
+    # 복구
+    # --------------------------------------------------------------------------------------
+    def _header(self, path):                             # (epoch, 파일 크기), 없거나 깨졌으면 None
+        try:
+            size = os.stat(path)[6]
+            with open(path, 'rb') as f:
+                data = f.read(HEADER)
+        except OSError:
+            return None
+        if len(data) < HEADER:
+            return None
+        magic, epoch = struct.unpack('<II', data)
+        if magic != MAGIC:
+            return None
+        return epoch, size
+
+    def _last(self, path, epoch, size):                  # 파일의 마지막 올바른 기록 값, 없으면 None
+        n = (size - HEADER) // RECORD                    # 잘린 마지막 기록은 무시
+        try:
+            with open(path, 'rb') as f:
+                for k in range(n - 1, max(n - 1 - SCAN, -1), -1):
+                    f.seek(HEADER + k * RECORD)
+                    value, check = struct.unpack('<II', f.read(RECORD))
+                    if check == (value ^ CHECK ^ epoch) & 0xFFFFFFFF:
+                        return value
+        except OSError:
+            pass
+        return None
+
+    def _recover(self):                                  # 최신 파일의 마지막 올바른 기록 읽기
+        found = []                                       # (epoch, 파일 번호, 크기)
+        for i in range(2):
+            header = self._header(self.paths[i])
+            if header:
+                found.append((header[0], i, header[1]))
+        if not found:                                    # 처음 사용
+            self._rotate(0)
+            return
+
+        found.sort(reverse=True)                         # 최신 파일부터
+        newest = found[0]
+        self.epoch = newest[0]                           # 옮겨 쓸 파일은 이보다 큰 epoch
+        self.active = newest[1]
+        for epoch, i, size in found:
+            value = self._last(self.paths[i], epoch, size)
+            if value is None:                            # 올바른 기록 없음 : 이전 파일 확인
+                continue
+            self.value = value
+            if i == newest[1] and (size - HEADER) % RECORD == 0:
+                self.records = (size - HEADER) // RECORD  # 이어서 추가
+                return
+            self.active = i                              # 올바른 파일은 남기고 다른 파일에 옮겨 씀
+            break
+
+        # 잘린 기록 뒤에 추가하면 이후 기록이 모두 어긋나므로 복구한 값으로 새 파일에 옮겨 씀
+        self._rotate(self.value)
+
+    # --------------------------------------------------------------------------------------
+    # 저장
+    # --------------------------------------------------------------------------------------
+    def _record(self, value):
+        return struct.pack('<II', value, (value ^ CHECK ^ self.epoch) & 0xFFFFFFFF)
+
+    def _rotate(self, value):                            # 다른 파일로 옮겨 씀 (epoch 증가)
+        old = self.paths[self.active]
+        self.active = 1 - self.active
+        self.epoch += 1
+        with open(self.paths[self.active], 'wb') as f:
+            f.write(struct.pack('<II', MAGIC, self.epoch))
+            f.write(self._record(value))
+        self.records = 1
+        try:
+            os.remove(old)                               # 새 파일을 쓴 뒤 지우므로 중간에 꺼져도 안전
+        except OSError:
+            pass
+
+    def commit(self, value):                             # 즉시 저장
+        self.commit_at = time.ticks_ms()
+        if value == self.value:
+            return
+        try:
+            if self.records >= self.max_records:
+                self._rotate(value)
+            else:
+                with open(self.paths[self.active], 'ab') as f:
+                    f.write(self._record(value))
+                self.records += 1
+        except OSError:
+            self.errors += 1
+            self.records = self.max_records              # 일부만 쓰였을 수 있음 : 다음 저장은 새 파일에
+            return
+        self.value = value
+        self.commits += 1
+
+    def poll(self, value):                               # 반복 처리에서 호출 : 조건이 되면 저장
+        if value == self.value:
+            return
+        if (value - self.value >= self.commit_delta or value < self.value or
+                time.ticks_diff(time.ticks_ms(), self.commit_at) >= self.commit_ms):
+            self.commit(value)
+
+    def reset(self):                                     # 0 으로 초기화 (새 파일로 교대)
+        try:
+            self._rotate(0)
+        except OSError:
+            self.errors += 1
+            return
+        self.value = 0
+        self.commit_at = time.ticks_ms()
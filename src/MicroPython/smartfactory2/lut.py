@@ -0,0 +1,65 @@
+# ******************************************************************************************
+# FileName     : lut.py
+# Description  : ADC 값 -> 물리량 변환표 (정수, 선형 보간)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 보간 오차가 큰 구간은 모든 코드를 저장 (tolerance), 반올림으로 저장
+# ******************************************************************************************
+from array import array
+
+
+NONE = 255                                               # dense_index : 보간하는 구간
+
+
+#===========================================================================================
+class Lookup:                                            # 변환표 (부팅 때 한 번 생성)
+#===========================================================================================
+    # convert(code) 결과에 scale 을 곱한 정수를 2**step_bits 간격으로 저장하고 사이는 보간
+    # tolerance 가 있으면 구간 가운데의 보간 오차가 이보다 큰 구간(곡률이 큰 양 끝)은 모든 코드를 저장
+    # code 가 0 이하 / 최댓값 이상(레일)이면 rail_low / rail_high 를 그대로 반환
+    def __init__(self, convert, scale=1, bits=12, step_bits=4, rail_low=None, rail_high=None,
+                 tolerance=None):
+        self.max_code = (1 << bits) - 1
+        self.step_bits = step_bits
+        self.mask = (1 << step_bits) - 1
+        self.rail_low = rail_low
+        self.rail_high = rail_high
+
+        n = (1 << bits) >> step_bits
+        self.table = array('i', [0] * (n + 1))
+        for i in range(n + 1):                           # 레일 값은 바로 안쪽 값으로 계산
+            self.table[i] = self._value(convert, scale, i << step_bits)
+
+        self.dense_index = bytearray([NONE] * n)         # 구간 -> dense 안의 순번
+        self.dense = array('i')                          # 모든 코드를 저장한 구간의 값
+        if tolerance is None:
+            return
+        step = 1 << step_bits
+        for i in range(n):
+            code = min((i << step_bits) + step // 2, self.max_code - 1)
+            error = self._interpolate(code) - convert(code) * scale
+            if -tolerance <= error <= tolerance or len(self.dense) >= (NONE - 1) * step:
+                continue
+            self.dense_index[i] = len(self.dense) >> step_bits
+            for k in range(step):
+                self.dense.append(self._value(convert, scale, (i << step_bits) + k))
+
+    def _value(self, convert, scale, code):              # 저장할 정수 (반올림)
+        code = min(max(code, 1), self.max_code - 1)
+        return round(convert(code) * scale)
+
+    def _interpolate(self, code):
+        i = code >> self.step_bits
+        a = self.table[i]
+        return a + (((self.table[i + 1] - a) * (code & self.mask)) >> self.step_bits)
+
+    def lookup(self, code):                              # 정수 연산만 사용 (float 할당 없음)
+        if code <= 0:
+            return self.rail_low
+        if code >= self.max_code:
+            return self.rail_high
+        k = self.dense_index[code >> self.step_bits]
+        if k != NONE:                                    # 곡률이 큰 구간 : 저장한 값
+            return self.dense[(k << self.step_bits) + (code & self.mask)]
+        return self._interpolate(code)
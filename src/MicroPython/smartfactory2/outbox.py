@@ -0,0 +1,221 @@
+# ******************************************************************************************
+# FileName     : outbox.py
+# Description  : 송신 대기열 (연결 끊김 동안 보관 후 재송신)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 플래시 보관 때 값 종류 기록 (bytes 는 base64, 정수는 정수로 복원)
+# ******************************************************************************************
+import os
+import time
+import ubinascii
+
+
+LOW = 0                                                  # 가득 차면 먼저 버리는 메시지
+HIGH = 1                                                 # 생산 수량 등 가능한 한 보관
+
+SEP = '\t'                                               # 플래시 보관 파일 구분자
+TEXT = 's'                                               # 보관 값 종류 : 문자열 (그대로)
+INTEGER = 'i'                                            # 보관 값 종류 : 정수 (생산 수량 등)
+BINARY = 'b'                                             # 보관 값 종류 : bytes (base64)
+
+
+#===========================================================================================
+class Outbox:                                            # 링 버퍼 송신 대기열
+#===========================================================================================
+    def __init__(self, send, size=32, high=('drum',), batch=8,
+                 spill_path=None, spill_max=4096, retry_ms=500, retry_max_ms=16000):
+        self.send_now = send                             # send(name, key, value) : 실패 시 OSError
+        self.size = size
+        self.high = high                                 # HIGH 우선순위로 보관할 name 목록
+        self.batch = batch                               # drain() 한 번에 보내는 최대 개수
+
+        self.names = [None] * size                       # 링 버퍼 (미리 할당)
+        self.keys = [None] * size
+        self.values = [None] * size
+        self.priority = bytearray(size)
+        self.head = 0                                    # 가장 오래된 항목 위치
+        self.length = 0
+
+        self.spill_path = spill_path                     # 넘치는 HIGH 메시지를 보관할 파일
+        self.spill_max = spill_max
+        self.spill_size = self._spill_size()
+
+        self.retry_ms = retry_ms
+        self.retry_max_ms = retry_max_ms
+        self.backoff_ms = retry_ms
+        self.retry_at = None                             # 다음 재시도 시각 (연결 끊김 중)
+
+        self.queued = 0                                  # 대기열에 넣은 수
+        self.sent = 0                                    # 송신 성공 수
+        self.dropped = 0                                 # 버린 수
+        self.spilled = 0                                 # 플래시에 보관한 수
+        self.failed = 0                                  # 송신 실패 횟수
+
+    # --------------------------------------------------------------------------------------
+    # 넣기 (제어 루프에서 호출, 네트워크 사용 안 함)
+    # --------------------------------------------------------------------------------------
+    def send(self, name, key, value, priority=None):     # StatePublisher 의 send 로 사용
+        if priority is None:
+            priority = HIGH if name in self.high else LOW
+
+        if self.length == self.size:
+            self._make_room()
+
+        i = (self.head + self.length) % self.size
+        self.names[i] = name
+        self.keys[i] = key
+        self.values[i] = value
+        self.priority[i] = priority
+        self.length += 1
+        self.queued += 1
+
+    def _make_room(self):                                # 가장 오래된 LOW 를 버리고, 없으면 가장 오래된 것을 처리
+        for n in range(self.length):
+            i = (self.head + n) % self.size
+            if self.priority[i] == LOW:
+                self._remove(n)
+                self.dropped += 1
+                return
+
+        i = self.head                                    # 모두 HIGH : 플래시에 보관하거나 버림
+        if not self._spill(self.names[i], self.keys[i], self.values[i]):
+            self.dropped += 1
+        self._remove(0)
+
+    def _remove(self, n):                                # n 번째 항목 제거 (뒤 항목을 앞으로)
+        size = self.size
+        for k in range(n, self.length - 1):
+            a = (self.head + k) % size
+            b = (a + 1) % size
+            self.names[a] = self.names[b]
+            self.keys[a] = self.keys[b]
+            self.values[a] = self.values[b]
+            self.priority[a] = self.priority[b]
+        last = (self.head + self.length - 1) % size
+        self.names[last] = self.keys[last] = self.values[last] = None
+        self.length -= 1
+
+    # --------------------------------------------------------------------------------------
+    # 보내기 (루프 또는 태스크에서 주기적으로 호출)
+    # --------------------------------------------------------------------------------------
+    def drain(self):                                     # 최대 batch 개 송신, 보낸 수 반환
+        if self.length == 0 and self.spill_size == 0:
+            return 0
+        if self.retry_at is not None and time.ticks_diff(time.ticks_ms(), self.retry_at) < 0:
+            return 0
+
+        count = 0
+        if self.spill_size:                              # 먼저 보관된 오래된 메시지
+            count = self._drain_spill()
+            if self.retry_at is not None:
+                return count
+
+        while self.length and count < self.batch:
+            i = self.head
+            try:
+                self.send_now(self.names[i], self.keys[i], self.values[i])
+            except OSError:
+                self._offline()
+                return count
+            self.names[i] = self.keys[i] = self.values[i] = None
+            self.head = (i + 1) % self.size
+            self.length -= 1
+            self.sent += 1
+            count += 1
+
+        self.retry_at = None
+        self.backoff_ms = self.retry_ms
+        return count
+
+    def _offline(self):                                  # 송신 실패 : 점점 길게 기다렸다 재시도
+        self.failed += 1
+        self.retry_at = time.ticks_add(time.ticks_ms(), self.backoff_ms)
+        self.backoff_ms = min(self.backoff_ms * 2, self.retry_max_ms)
+
+    # --------------------------------------------------------------------------------------
+    # 플래시 보관
+    # --------------------------------------------------------------------------------------
+    def _spill_size(self):
+        if not self.spill_path:
+            return 0
+        try:
+            return os.stat(self.spill_path)[6]
+        except OSError:
+            return 0
+
+    def _spill(self, name, key, value):                  # 한 줄 : name, key, 종류, 값
+        if not self.spill_path:
+            return False
+        if isinstance(value, (bytes, bytearray)):        # 이진 묶음 : 재송신 때 같은 bytes 로 복원
+            data = ubinascii.b2a_base64(value).decode().rstrip('\n')
+            line = name + SEP + key + SEP + BINARY + SEP + data + '\n'
+        else:
+            kind = INTEGER if isinstance(value, int) else TEXT
+            line = name + SEP + key + SEP + kind + SEP + str(value) + '\n'
+        if self.spill_size + len(line) > self.spill_max:
+            return False
+        try:
+            with open(self.spill_path, 'a') as f:
+                f.write(line)
+        except OSError:
+            return False
+        self.spill_size += len(line)
+        self.spilled += 1
+        return True
+
+    def _drain_spill(self):                              # 보관 파일 전체 재송신, 실패하면 남은 것만 다시 저장
+        try:
+            with open(self.spill_path) as f:
+                lines = f.readlines()
+        except OSError:
+            self.spill_size = 0
+            return 0
+
+        count = 0
+        for n in range(len(lines)):
+            parts = lines[n].rstrip('\n').split(SEP, 3)
+            if len(parts) != 4:
+                continue
+            value = parts[3]
+            try:
+                if parts[2] == BINARY:
+                    value = ubinascii.a2b_base64(value)
+                elif parts[2] == INTEGER:
+                    value = int(value)
+            except ValueError:                           # 쓰는 중 끊긴 줄
+                continue
+            try:
+                self.send_now(parts[0], parts[1], value)
+            except OSError:
+                self._offline()
+                self._rewrite_spill(lines[n:])
+                return count
+            self.sent += 1
+            count += 1
+
+        self._rewrite_spill(())
+        return count
+
+    def _rewrite_spill(self, lines):
+        try:
+            if lines:
+                with open(self.spill_path, 'w') as f:
+                    for line in lines:
+                        f.write(line)
+            else:
+                os.remove(self.spill_path)
+        except OSError:
+            pass
+        self.spill_size = self._spill_size()
+
+    # --------------------------------------------------------------------------------------
+    def stats(self):
+        return {
+            'queued': self.queued,
+            'sent': self.sent,
+            'dropped': self.dropped,
+            'spilled': self.spilled,
+            'failed': self.failed,
+            'pending': self.length,
+        }
@@ -0,0 +1,109 @@
+# ******************************************************************************************
+# FileName     : profiler.py
+# Description  : 처리 단계별 실행 시간 측정 (최소/최대/평균, 구간별 횟수)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import gc
+import time
+
+
+LIMITS_US = (1000, 5000, 20000, 100000, 200000, 1000000)  # 구간 상한 (마지막 구간은 그 이상)
+
+
+#===========================================================================================
+class Profiler:                                          # 단계별 실행 시간 통계
+#===========================================================================================
+    # 사용하지 않을 때는 함수를 감싸지 않으므로 부담이 없음
+
+    def __init__(self, limits_us=LIMITS_US):
+        self.limits = limits_us
+        self.names = []                                  # 단계 이름
+        self.budgets = []                                # 단계별 허용 시간 (0 : 검사 안 함)
+        self.counts = []
+        self.totals = []
+        self.mins = []
+        self.maxs = []
+        self.overruns = []                               # 허용 시간 초과 횟수
+        self.hist = []                                   # 단계별 len(limits) + 1 개 구간
+        self.mem_free = 0                                # 마지막 gc.mem_free()
+        self.mem_free_min = 0
+        self.started_ms = time.ticks_ms()
+
+    def stage(self, name, budget_us=0):                  # 단계 등록 (번호 반환)
+        if name in self.names:
+            return self.names.index(name)
+        self.names.append(name)
+        self.budgets.append(budget_us)
+        self.counts.append(0)
+        self.totals.append(0)
+        self.mins.append(0)
+        self.maxs.append(0)
+        self.overruns.append(0)
+        self.hist.extend([0] * (len(self.limits) + 1))
+        return len(self.names) - 1
+
+    def wrap(self, name, fn, budget_us=0):               # fn 을 측정하는 함수 반환
+        i = self.stage(name, budget_us)
+        record = self.record
+        ticks_us = time.ticks_us
+        ticks_diff = time.ticks_diff
+
+        def timed(*args):
+            t0 = ticks_us()
+            result = fn(*args)
+            record(i, ticks_diff(ticks_us(), t0))
+            return result
+        return timed
+
+    def record(self, i, us):                             # 측정값 하나 반영
+        n = self.counts[i]
+        if n == 0 or us < self.mins[i]:
+            self.mins[i] = us
+        if us > self.maxs[i]:
+            self.maxs[i] = us
+        self.counts[i] = n + 1
+        self.totals[i] += us
+
+        budget = self.budgets[i]
+        if budget and us > budget:
+            self.overruns[i] += 1
+
+        limits = self.limits
+        b = 0
+        while b < len(limits) and us > limits[b]:
+            b += 1
+        self.hist[i * (len(limits) + 1) + b] += 1
+
+    def sample_memory(self):                             # 남은 메모리 기록 (주기적 처리에서 호출)
+        free = gc.mem_free()
+        self.mem_free = free
+        if self.mem_free_min == 0 or free < self.mem_free_min:
+            self.mem_free_min = free
+
+    def reset(self):                                     # 통계 초기화 (등록된 단계는 유지)
+        for i in range(len(self.names)):
+            self.counts[i] = 0
+            self.totals[i] = 0
+            self.mins[i] = 0
+            self.maxs[i] = 0
+            self.overruns[i] = 0
+        for b in range(len(self.hist)):
+            self.hist[b] = 0
+        self.mem_free_min = 0
+        self.started_ms = time.ticks_ms()
+
+    def report(self):                                    # 통계 JSON (시간은 us)
+        width = len(self.limits) + 1
+        stages = []
+        for i in range(len(self.names)):
+            n = self.counts[i]
+            stages.append('"%s":{"n":%d,"min":%d,"max":%d,"mean":%d,"over":%d,"hist":[%s]}' % (
+                self.names[i], n, self.mins[i], self.maxs[i],
+                self.totals[i] // n if n else 0, self.overruns[i],
+                ','.join([str(h) for h in self.hist[i * width:(i + 1) * width]])))
+        return '{"ms":%d,"mem_free":%d,"mem_free_min":%d,"limits":[%s],"stages":{%s}}' % (
+            time.ticks_diff(time.ticks_ms(), self.started_ms), self.mem_free, self.mem_free_min,
+            ','.join([str(x) for x in self.limits]), ','.join(stages))
@@ -0,0 +1,94 @@
+# ******************************************************************************************
+# FileName     : profiles.py
+# Description  : 설치 환경별 설정 (표준, 테스트, AWS, SmartLabOn)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 초음파 최대 측정 거리 (ranging_max_cm)
+# Modified     : 2026.10.18 : 기본 송신 형식을 토픽별(topic)로 (대시보드 앱 호환, 송신 바이트 수)
+# Modified     : 2026.10.18 : 생산 속도 송신 주기 (throughput_period_ms)
+# Modified     : 2026.10.18 : 온도, 조도 측정 주기 (temp_period_ms, lux_period_ms)
+# ******************************************************************************************
+
+
+#===========================================================================================
+def derive(base, changes):                               # 기본 설정에서 일부만 바꾼 설정 생성
+#===========================================================================================
+    profile = dict(base)
+    profile.update(changes)
+    return profile
+
+
+#===========================================================================================
+# 표준 : 대시보드(ET_IoT_App)로 상태 송신
+#===========================================================================================
+STANDARD = {
+    'name': 'standard',
+    'geer_angles': (180, 138, 102, 64),                  # 톱니바퀴 위치(pos)별 각도
+    'block_open_angle': 75,                              # 차단대 열림 각도
+    'gate_delay_ms': 500,                                # 드럼통 감지 후 차단대를 열 때까지
+    'gate_open_ms': 1000,                                # 차단대 열림 유지 시간
+    'gate_mode': 'extend',                               # 'extend'(열린 동안 온 드럼통은 연장) 또는 'queue'(드럼통마다 한 번씩)
+    'sample_slow_ms': 150,                               # 라인이 비어 있을 때 초음파 측정 주기
+    'sample_fast_ms': 30,                                # 드럼통이 가까울 때 초음파 측정 주기
+    'ranging_max_cm': 40,                                # 초음파 최대 측정 거리 (넘으면 에코 없음 : 드럼통 없음)
+    'publish_format': 'topic',                           # 'topic'(토픽별, 대시보드 앱) 또는 'frame'(한 번에, 게이트웨이용)
+    'frame_encoding': 'json',                            # 상태 묶음 'json' 또는 'binary'(binframe, 스키마는 schema 송신)
+    'sensor_encoding': 'json',                           # 센서 데이터 'json'(send_sensor_data) 또는 'binary'(sensor 송신)
+    'frame_topic': ('kit', 'status'),                    # 상태 묶음 송신 (name, key)
+    'pos_topic': ('pos', 'state'),                       # 톱니바퀴 위치 송신 (name, key)
+    'raw_topics': {},                                    # name -> MQTT 토픽 (직접 publish)
+    'env_sensors': False,                                # 온도, 조도 센서 사용
+    'temp_period_ms': 2000,                              # 온도 측정 주기 (env_sensors)
+    'lux_period_ms': 500,                                # 조도 측정 주기 (env_sensors)
+    'sensor_types': (),                                  # 센서 목록 (sensorId, sensorNicNm, collectUnit) : 센서 데이터 송신
+    'commands': ('pos', 'block', 'reset', 'transit'),    # 수신할 메시지
+    'command_queue': 8,                                  # 수신 명령 대기열 크기 (pos, block 은 마지막 값만)
+    'dedupe_ms': 500,                                    # 같은 드럼통 중복 계수 방지 시간
+    'transit_size': 32,                                  # 보관할 드럼통 통과 기록 수
+    'throughput_period_ms': 60000,                       # 생산 속도(분당 수량, 도착 간격) 송신 주기
+    'count_tick': False,                                 # 주기적으로 개수 증가 (송신 시험용)
+    'run_mode': 'loop',                                  # 'loop' 또는 'async'(uasyncio)
+    'count_journal': 'count',                            # 생산 수량 저장 파일 (count.0, count.1), None : 저장 안 함
+    'count_commit_delta': 10,                            # 생산 수량이 이만큼 늘면 저장
+    'count_commit_ms': 30000,                            # 바뀐 생산 수량이 있으면 이 시간마다 저장
+    'spill_path': None,                                  # 송신 대기열 플래시 보관 파일 (예: 'outbox.txt')
+    'profiler': False,                                   # 단계별 실행 시간 측정 ('stats' 메시지로 조회)
+    'loop_budget_ms': 250,                               # 반복 처리 1회 허용 시간 (초과 횟수 집계)
+}
+
+
+#===========================================================================================
+# 테스트 : 톱니바퀴 각도가 다른 시험용 키트, 5초마다 개수 증가 (2024.10.12 : SCS : aws test)
+#===========================================================================================
+TEST = derive(STANDARD, {
+    'name': 'test',
+    'geer_angles': (150, 103, 66, 26),
+    'count_tick': True,
+})
+
+
+#===========================================================================================
+# AWS : 상태를 aws/etboard 토픽으로 직접 publish, 온도와 조도 포함 (2024.10.21 : SCS)
+#===========================================================================================
+AWS = derive(STANDARD, {
+    'name': 'aws',
+    'frame_topic': ('aws', 'etboard'),
+    'pos_topic': ('aws', 'pos'),
+    'raw_topics': {'aws': 'aws/etboard'},
+    'env_sensors': True,
+})
+
+
+#===========================================================================================
+# SmartLabOn : 거리와 개수를 센서 데이터로 송신, 센서 타입 요청에 응답
+#===========================================================================================
+SMARTLABON = derive(STANDARD, {
+    'name': 'smartlabon',
+    'sensor_types': (
+        ('distance', '거리', 'cm'),
+        ('count', '드럼통 출고 수', ''),
+    ),
+    'commands': ('get_sensor_type', 'transit'),
+})
+
@@ -0,0 +1,161 @@
+# ******************************************************************************************
+# FileName     : publisher.py
+# Description  : 변경 기반 상태 송신 (중복 제거, 묶음 송신, 생존 신호)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     : 2026.10.18 : 상태 묶음(frame) 송신 추가
+# Modified     : 2026.10.18 : 정수 필드 배율(scale) 추가
+# Modified     : 2026.10.18 : 묶음 이진 인코딩(binary) 선택, 스키마 송신
+# ******************************************************************************************
+import time
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+
+_UNSENT = object()                                       # 아직 송신하지 않은 값
+
+# 필드 목록 항목 인덱스
+NAME = 0
+KEY = 1
+VALUE = 2
+SENT = 3
+TRIGGER = 4
+SCALE = 5
+FMT = 6
+ENUM = 7
+
+
+#===========================================================================================
+def encode_frame(fields, values, scales=None):          # 상태 묶음을 JSON 문자열로 변환
+#===========================================================================================
+    parts = []
+    for i in range(len(fields)):
+        value = values[i]
+        if scales and scales[i] != 1 and value is not None:
+            value = value / scales[i]                    # 정수로 보관한 값을 실제 단위로
+        parts.append('"' + fields[i] + '":' + json.dumps(value))
+    return '{' + ','.join(parts) + '}'
+
+
+#===========================================================================================
+class StatePublisher:                                    # 상태 값 송신 관리
+#===========================================================================================
+    def __init__(self, send, coalesce_ms=200, heartbeat_ms=60000, send_frame=None,
+                 binary=False, send_schema=None):
+        self.send = send                                 # send(name, key, value) : 토픽별 송신
+        self.send_frame = send_frame                     # send_frame(payload) : 묶음 송신 (있으면 사용)
+        self.binary = binary                             # 묶음을 JSON 대신 이진(binframe)으로
+        self.send_schema = send_schema                   # send_schema(json) : 이진 묶음의 필드 배치 송신
+        self.codec = None                                # 이진 인코더 (첫 송신 때 필드 목록으로 생성)
+        self.schema_due = True                           # 다음 묶음 전에 스키마 송신
+        self.coalesce_ms = coalesce_ms                   # 변경을 모아서 보내는 시간
+        self.heartbeat_ms = heartbeat_ms                 # 변경이 없어도 다시 보내는 주기
+
+        self.fields = {}                                 # field -> [name, key, value, sent, trigger, scale, fmt, enum]
+        self.order = []                                  # 송신 순서
+        self.dirty_ms = None                             # 첫 변경 시각 (변경 없으면 None)
+        self.heartbeat_at = time.ticks_ms()
+
+        self.publish_count = 0                           # 실제 송신 횟수
+        self.skip_count = 0                              # 값이 같아 생략한 갱신 횟수
+
+    def add_field(self, field, name=None, key=None, value=_UNSENT, trigger=True, scale=1,
+                  fmt='i', enum=None):
+        # trigger=False : 값이 바뀌어도 송신하지 않고 묶음에만 포함 (거리, 온도 등)
+        # scale : 정수로 보관한 값의 배율 (예: 0.01 °C 단위면 100), 묶음 송신 때 나눔
+        # fmt, enum : 이진 묶음의 struct 형식, 문자열 값 목록 (예: ('close', 'open'))
+        self.fields[field] = [name, key, value, _UNSENT, trigger, scale, fmt, enum]
+        self.order.append(field)
+        self.codec = None
+
+    def update(self, field, value):                      # 값 갱신 : 바뀐 경우에만 송신 예약
+        item = self.fields[field]
+        item[VALUE] = value
+        if not item[TRIGGER]:
+            return
+        if value == item[SENT]:
+            self.skip_count += 1
+            return
+        if self.dirty_ms is None:
+            self.dirty_ms = time.ticks_ms()
+
+    def invalidate(self):                                # 다음 송신 때 모든 값을 다시 보냄
+        for field in self.order:
+            self.fields[field][SENT] = _UNSENT
+        self.schema_due = True                           # 생존 신호, 초기화 때 스키마도 다시 보냄
+        if self.dirty_ms is None:
+            self.dirty_ms = time.ticks_ms()
+
+    def poll(self):                                      # 주기적으로 호출 : 송신 시점 판단
+        now = time.ticks_ms()
+
+        if time.ticks_diff(now, self.heartbeat_at) >= self.heartbeat_ms:
+            self.heartbeat_at = now
+            self.invalidate()                            # 생존 신호 : 전체 재송신
+            self.flush()
+        elif self.dirty_ms is not None and \
+                time.ticks_diff(now, self.dirty_ms) >= self.coalesce_ms:
+            self.flush()
+
+    def flush(self):                                     # 바뀐 값을 즉시 송신
+        if self.send_frame is not None:
+            self._flush_frame()
+        else:
+            self._flush_topics()
+        self.dirty_ms = None
+
+    def _flush_topics(self):                             # 토픽별 송신 (기존 형식)
+        for field in self.order:
+            item = self.fields[field]
+            if not item[TRIGGER] or item[VALUE] is _UNSENT or item[VALUE] == item[SENT]:
+                continue
+            self.send(item[NAME], item[KEY], item[VALUE])
+            item[SENT] = item[VALUE]
+            self.publish_count += 1
+
+    def _flush_frame(self):                              # 모든 상태를 한 번에 송신
+        changed = False
+        names = []
+        values = []
+        scales = []
+        for field in self.order:
+            item = self.fields[field]
+            if item[VALUE] is _UNSENT:
+                continue
+            if item[TRIGGER] and item[VALUE] != item[SENT]:
+                changed = True
+            names.append(field)
+            values.append(item[VALUE])
+            scales.append(item[SCALE])
+
+        if not changed:
+            return
+
+        if self.binary:
+            self.send_frame(self._encode_binary())
+        else:
+            self.send_frame(encode_frame(names, values, scales))
+        for field in names:
+            item = self.fields[field]
+            item[SENT] = item[VALUE]
+        self.publish_count += 1
+
+    def _encode_binary(self):                            # 모든 필드를 고정 배치로 (값 없으면 비트 끔)
+        if self.codec is None:
+            from smartfactory2.binframe import BinaryCodec
+            fields = self.fields
+            self.codec = BinaryCodec([(f, fields[f][FMT], fields[f][SCALE], fields[f][ENUM])
+                                      for f in self.order])
+        if self.schema_due and self.send_schema is not None:
+            self.send_schema(self.codec.schema)
+            self.schema_due = False
+
+        values = []
+        for field in self.order:
+            value = self.fields[field][VALUE]
+            values.append(None if value is _UNSENT else value)
+        return self.codec.encode(values)
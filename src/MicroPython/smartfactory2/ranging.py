@@ -0,0 +1,92 @@
+# ******************************************************************************************
+# FileName     : ranging.py
+# Description  : 초음파 거리 측정 (타임아웃 제한, 중앙값 필터)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import time
+from array import array
+from machine import time_pulse_us
+
+
+NO_ECHO = -1                                             # 에코 없음 (측정 범위 밖)
+
+
+#===========================================================================================
+class Ultrasonic:                                        # 초음파 센서 (HC-SR04 계열)
+#===========================================================================================
+    def __init__(self, trig_pin, echo_pin, max_cm=40, size=3, max_age_ms=300):
+        self.trig_pin = trig_pin
+        self.echo_pin = echo_pin
+
+        # 최대 거리의 왕복 시간 (distance = 17 * duration / 1000)
+        self.timeout_us = max_cm * 1000 // 17 + 1
+
+        self.size = size                                 # 필터 창 크기 (홀수)
+        self.samples = array('i', [0] * size)            # 최근 에코 시간 링 버퍼
+        self.sorted = array('i', [0] * size)             # 중앙값 계산용 작업 버퍼
+        self.index = 0
+        self.filled = 0
+        self.max_age_ms = max_age_ms                     # 이보다 오래된 표본은 버림 (긴 대기 후)
+        self.sample_ms = 0                               # 마지막 표본 시각
+
+        self.raw_us = NO_ECHO                            # 마지막 원시 에코 시간
+        self.distance = NO_ECHO                          # 필터링된 거리 (cm)
+        self.no_echo_count = 0                           # 에코 없음 횟수
+
+    def ping(self):                                      # 한 번 측정 : 에코 시간(us) 또는 NO_ECHO
+        self.trig_pin.value(0)
+        time.sleep_us(2)
+        self.trig_pin.value(1)
+        time.sleep_us(10)
+        self.trig_pin.value(0)
+
+        duration = time_pulse_us(self.echo_pin, 1, self.timeout_us)
+        if duration < 0:                                 # -1, -2 : 타임아웃
+            self.no_echo_count += 1
+            return NO_ECHO
+        return duration
+
+    def measure(self):                                   # 측정 후 필터링된 거리 반환
+        duration = self.ping()
+        self.raw_us = duration
+
+        if duration == NO_ECHO:                          # 에코 없음은 범위 밖으로 기록
+            duration = self.timeout_us + 1
+
+        now = time.ticks_ms()
+        if self.filled and time.ticks_diff(now, self.sample_ms) > self.max_age_ms:
+            self.reset()                                 # 오래된 표본이 새 측정을 가리지 않도록
+        self.sample_ms = now
+
+        self.samples[self.index] = duration
+        self.index = (self.index + 1) % self.size
+        if self.filled < self.size:
+            self.filled += 1
+
+        median = self._median()
+        if median > self.timeout_us:
+            self.distance = NO_ECHO
+        else:
+            self.distance = 17 * median / 1000
+
+        return self.distance
+
+    def _median(self):                                   # 링 버퍼 중앙값 (삽입 정렬, 할당 없음)
+        n = self.filled
+        buf = self.sorted
+        for i in range(n):
+            value = self.samples[i]
+            j = i
+            while j > 0 and buf[j - 1] > value:
+                buf[j] = buf[j - 1]
+                j -= 1
+            buf[j] = value
+        return buf[n // 2]
+
+    def reset(self):                                     # 필터 초기화
+        self.index = 0
+        self.filled = 0
+        self.distance = NO_ECHO
@@ -0,0 +1,55 @@
+# ******************************************************************************************
+# FileName     : sampler.py
+# Description  : 초음파 측정 주기 조절 (비어 있으면 느리게, 드럼통이 다가오면 빠르게)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import time
+
+
+NO_ECHO = -1                                             # ranging.NO_ECHO 와 같은 값
+
+
+#===========================================================================================
+class AdaptiveSampler:                                   # 적응형 측정 주기
+#===========================================================================================
+    def __init__(self, slow_ms=150, fast_ms=30, near_cm=12, step_cm=2, hold_ms=1500):
+        self.slow_ms = slow_ms                           # 라인이 비어 있을 때 주기
+        self.fast_ms = fast_ms                           # 드럼통이 가까울 때 주기
+        self.near_us = near_cm * 1000 // 17              # 이보다 가까우면 빠르게 (에코 시간)
+        self.step_us = step_cm * 1000 // 17              # 한 번에 이만큼 가까워지면 빠르게
+        self.hold_ms = hold_ms                           # 마지막으로 가까웠던 뒤 빠른 주기 유지 시간
+
+        self.period_ms = slow_ms                         # 현재 주기
+        self.next_ms = time.ticks_ms()                   # 다음 측정 시각
+        self.fast_until = self.next_ms
+        self.last_us = NO_ECHO
+        self.switches = 0                                # 주기 변경 횟수
+
+    def due(self):                                       # 측정할 시각이 되었는가
+        return time.ticks_diff(time.ticks_ms(), self.next_ms) >= 0
+
+    def wait_ms(self):                                   # 다음 측정까지 남은 시간
+        remain = time.ticks_diff(self.next_ms, time.ticks_ms())
+        return remain if remain > 0 else 0
+
+    def update(self, raw_us):                            # 측정 직후 호출 (원시 에코 시간)
+        now = time.ticks_ms()
+
+        if raw_us != NO_ECHO:
+            near = raw_us < self.near_us
+            approaching = self.last_us != NO_ECHO and raw_us < self.last_us - self.step_us
+            if near or approaching:
+                self.fast_until = time.ticks_add(now, self.hold_ms)
+        self.last_us = raw_us
+
+        period = self.fast_ms if time.ticks_diff(self.fast_until, now) > 0 else self.slow_ms
+        if period != self.period_ms:
+            self.period_ms = period
+            self.switches += 1
+        self.next_ms = time.ticks_add(now, period)
+
+    def rate_hz(self):                                   # 현재 측정 빈도 (회/초)
+        return 1000 // self.period_ms
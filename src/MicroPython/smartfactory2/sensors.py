@@ -0,0 +1,76 @@
+# ******************************************************************************************
+# FileName     : sensors.py
+# Description  : 센서 목록 (센서 타입 응답과 센서 데이터 송신)
+# Author       :
+# Created Date : 2026.10.18
+# Reference    : Kit_smartFactory2_SmartLabOn.py (send_sensor_type)
+# Modified     : 2026.10.18 : 센서 데이터 이진 인코딩(encode_binary) 추가
+# Modified     : 2026.10.18 : 센서 데이터를 JSON 문자열로 만들어 송신 대기열로 (encode_json)
+# ******************************************************************************************
+import ujson
+
+
+#===========================================================================================
+def json_to_unicode_escaped(value):                      # 직렬화, 비-ASCII 문자 이스케이프
+#===========================================================================================
+    json_string = ujson.dumps(value)
+    parts = []
+    start = 0
+    for i in range(len(json_string)):
+        c = ord(json_string[i])
+        if c > 127:
+            parts.append(json_string[start:i])
+            parts.append('\\u%04x' % c)
+            start = i + 1
+    if not parts:                                        # ASCII 만 있으면 그대로
+        return json_string
+    parts.append(json_string[start:])
+    return ''.join(parts)
+
+
+#===========================================================================================
+class SensorRegistry:                                    # 센서 목록
+#===========================================================================================
+    def __init__(self, channel='01'):
+        self.channel = channel
+        self.ids = []                                    # sensorId (등록 순서)
+        self.readers = []                                # read() : 현재 값
+        self.escaped = []                                # 센서별 타입 JSON (등록 때 한 번만 변환)
+        self.payload = None                              # 전체 센서 타입 JSON 배열 (첫 요청 때 생성)
+        self.codec = None                                # 이진 인코더 (첫 이진 송신 때 생성)
+        self.binary_sent = 0                             # 이진 센서 데이터 송신 횟수
+
+    def add(self, sensor_id, nickname, unit, read, sensor_type=None):
+        self.ids.append(sensor_id)
+        self.readers.append(read)
+        self.escaped.append('{"sensorId":%s,"sensorType":%s,"sensorNicNm":%s,'
+                            '"channelCode":%s,"collectUnit":%s}' % (
+                                json_to_unicode_escaped(sensor_id),
+                                json_to_unicode_escaped(sensor_type or sensor_id),
+                                json_to_unicode_escaped(nickname),
+                                json_to_unicode_escaped(self.channel),
+                                json_to_unicode_escaped(unit)))
+        self.payload = None
+        self.codec = None
+
+    def descriptors(self):                               # 센서 타입 응답 (한 번의 송신으로 전체 전달)
+        if self.payload is None:
+            self.payload = '[' + ','.join(self.escaped) + ']'
+        return self.payload
+
+    def encode_json(self):                               # 현재 값을 센서 데이터 JSON {sensorId: value} 로
+        readers = self.readers
+        parts = []
+        for i in range(len(readers)):
+            parts.append(json_to_unicode_escaped(self.ids[i]) + ':' + ujson.dumps(readers[i]()))
+        return '{' + ','.join(parts) + '}'
+
+    def binary_codec(self):                              # 센서 값 이진 인코더 (모든 값 float32)
+        if self.codec is None:
+            from smartfactory2.binframe import BinaryCodec
+            self.codec = BinaryCodec([(sensor_id, 'f', 1, None) for sensor_id in self.ids])
+        return self.codec
+
+    def encode_binary(self):                             # 현재 값을 이진 센서 데이터로
+        self.binary_sent += 1
+        return self.binary_codec().encode([read() for read in self.readers])
@@ -0,0 +1,97 @@
+# ******************************************************************************************
+# FileName     : throughput.py
+# Description  : 분당 생산 수량 (1/5/15분 이동 창)과 도착 간격 통계, 고정 메모리
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import time
+from array import array
+
+
+#===========================================================================================
+class Throughput:                                        # 이동 창 생산 속도
+#===========================================================================================
+    # bucket_ms 단위 칸의 링 버퍼와 창별 합계를 칸이 바뀔 때마다 증감 (전체를 다시 더하지 않음)
+
+    def __init__(self, bucket_ms=10000, windows_min=(1, 5, 15)):
+        self.bucket_ms = bucket_ms
+        self.windows = [w * 60000 // bucket_ms for w in windows_min]   # 창별 칸 수
+        self.n = max(self.windows)
+        self.buckets = array('H', [0] * self.n)
+        self.sums = array('i', [0] * len(self.windows))  # 창별 합계
+        self.index = 0
+        self.started = time.ticks_ms()
+        self.bucket_start = self.started
+        self.warm = False                                # 켜진 지 가장 긴 창보다 오래됨
+
+        self.last_ms = None                              # 마지막 도착 시각
+        self.gap_ms = 0                                  # 도착 간격 평균 (지수 가중, 1/8)
+        self.gap_dev = 0                                 # 도착 간격 평균 편차 (지수 가중, 1/4)
+
+    def _roll(self, now):                                # 지난 칸 정리, 칸이 바뀌었으면 True
+        elapsed = time.ticks_diff(now, self.bucket_start)
+        if elapsed < self.bucket_ms:
+            return False
+
+        steps = elapsed // self.bucket_ms
+        self.bucket_start = time.ticks_add(self.bucket_start, steps * self.bucket_ms)
+        if steps >= self.n:                              # 모든 창보다 오래 쉬었음
+            for i in range(self.n):
+                self.buckets[i] = 0
+            for j in range(len(self.sums)):
+                self.sums[j] = 0
+            return True
+
+        buckets, sums, windows, n = self.buckets, self.sums, self.windows, self.n
+        for _ in range(steps):
+            self.index = (self.index + 1) % n
+            for j in range(len(windows)):                # 창에서 빠지는 칸 빼기
+                sums[j] -= buckets[(self.index - windows[j]) % n]
+            buckets[self.index] = 0
+        return True
+
+    def add(self, now):                                  # 드럼통 하나 도착
+        self._roll(now)
+        self.buckets[self.index] += 1
+        for j in range(len(self.sums)):
+            self.sums[j] += 1
+
+        if self.last_ms is not None:
+            gap = time.ticks_diff(now, self.last_ms)
+            if self.gap_ms == 0:                         # 첫 간격
+                self.gap_ms = gap
+                self.gap_dev = gap // 2
+            else:
+                error = gap - self.gap_ms
+                self.gap_ms += error >> 3
+                self.gap_dev += (abs(error) - self.gap_dev) >> 2
+        self.last_ms = now
+
+    def poll(self, now):                                 # 반복 처리에서 호출 : 칸이 바뀌면 True
+        return self._roll(now)
+
+    def rate10(self, j, now):                            # j 번째 창의 분당 수량 x 10
+        span = (self.windows[j] - 1) * self.bucket_ms + time.ticks_diff(now, self.bucket_start)
+        if not self.warm:                                # 켜진 지 창보다 짧으면 켜진 시간 기준
+            uptime = time.ticks_diff(now, self.started)
+            if uptime >= self.n * self.bucket_ms:
+                self.warm = True                         # 이후로는 ticks 가 넘쳐도 비교하지 않음
+            elif uptime < span:
+                span = uptime
+        if span <= 0:
+            return 0
+        return self.sums[j] * 600000 // span
+
+    def reset(self):
+        for i in range(self.n):
+            self.buckets[i] = 0
+        for j in range(len(self.sums)):
+            self.sums[j] = 0
+        self.started = time.ticks_ms()
+        self.bucket_start = self.started
+        self.warm = False
+        self.last_ms = None
+        self.gap_ms = 0
+        self.gap_dev = 0
@@ -0,0 +1,102 @@
+# ******************************************************************************************
+# FileName     : transit.py
+# Description  : 드럼통 통과 기록 (진입, 머문 시간, 최소 거리, 차단대 지연) 링 버퍼
+# Author       :
+# Created Date : 2026.10.18
+# Reference    :
+# Modified     :
+# ******************************************************************************************
+import time
+from array import array
+
+
+ENTRY = 0                                                # 센서 앞 진입 시각 (ticks_ms)
+DWELL = 1                                                # 센서 앞에 머문 시간 (ms, 빠져나가기 전 -1)
+MIN_MM = 2                                               # 최소 거리 (mm)
+GATE = 3                                                 # 진입 -> 차단대 열림 (ms, 열리기 전 -1)
+WIDTH = 4
+
+
+#===========================================================================================
+class TransitLog:                                        # 드럼통 통과 기록
+#===========================================================================================
+    def __init__(self, size=32):
+        self.size = size
+        self.records = array('i', [0] * (size * WIDTH))  # 고정 크기 (할당 없음)
+        self.total = 0                                   # 지금까지 기록한 드럼통 수
+        self.bounces = 0                                 # 중복 방지 시간 안에 다시 진입한 횟수
+        self.open = -1                                   # 아직 빠져나가지 않은 기록 위치
+
+    def _slot(self, n):                                  # n 번째 기록의 배열 위치
+        return (n % self.size) * WIDTH
+
+    def enter(self, now, distance, gate_open=False):     # 드럼통 진입 (계수할 때)
+        base = self._slot(self.total)
+        r = self.records
+        r[base + ENTRY] = now
+        r[base + DWELL] = -1
+        r[base + MIN_MM] = int(distance * 10)
+        r[base + GATE] = 0 if gate_open else -1          # 이미 열려 있으면 지연 없음
+        self.open = base
+        self.total += 1
+
+    def reenter(self):                                   # 중복 방지 시간 안에 다시 진입 : 마지막 기록 이어감
+        self.bounces += 1
+        if self.total:
+            base = self._slot(self.total - 1)
+            self.records[base + DWELL] = -1
+            self.open = base
+
+    def observe(self, distance):                         # 머무는 동안 측정 (최소 거리 갱신)
+        if self.open >= 0:
+            mm = int(distance * 10)
+            if mm < self.records[self.open + MIN_MM]:
+                self.records[self.open + MIN_MM] = mm
+
+    def exit(self, now):                                 # 드럼통이 빠져나감
+        base = self.open
+        if base >= 0:
+            r = self.records
+            r[base + DWELL] = time.ticks_diff(now, r[base + ENTRY])
+            self.open = -1
+
+    def gate_opened(self, now):                          # 차단대 열림 : 기다리던 기록의 지연 기록
+        r = self.records
+        n = min(self.total, self.size)
+        for k in range(1, n + 1):                        # 최근 기록부터
+            base = self._slot(self.total - k)
+            if r[base + GATE] >= 0:
+                break
+            r[base + GATE] = time.ticks_diff(now, r[base + ENTRY])
+
+    def report(self):                                    # 통계와 최근 기록 JSON (오래된 것부터)
+        r = self.records
+        n = min(self.total, self.size)
+        rows = []
+        gaps = dwell = dwell_n = gate = gate_n = 0
+        previous = None
+        for k in range(n, 0, -1):
+            base = self._slot(self.total - k)
+            entry = r[base + ENTRY]
+            rows.append('[%d,%d,%d,%d]' % (entry, r[base + DWELL], r[base + MIN_MM], r[base + GATE]))
+            if previous is not None:
+                gaps += time.ticks_diff(entry, previous)
+            previous = entry
+            if r[base + DWELL] >= 0:
+                dwell += r[base + DWELL]
+                dwell_n += 1
+            if r[base + GATE] >= 0:
+                gate += r[base + GATE]
+                gate_n += 1
+        return ('{"total":%d,"bounces":%d,"gap_ms":%d,"dwell_ms":%d,"gate_ms":%d,'
+                '"fields":["entry","dwell","min_mm","gate"],"records":[%s]}') % (
+            self.total, self.bounces,
+            gaps // (n - 1) if n > 1 else 0,
+            dwell // dwell_n if dwell_n else 0,
+            gate // gate_n if gate_n else 0,
+            ','.join(rows))
+
+    def reset(self):
+        self.total = 0
+        self.bounces = 0
+        self.open = -1